@@ -1,27 +1,69 @@
 # \!/usr/bin/env python3
-"""Database backup script."""
+"""Database backup script.
+
+Streams the properties collection to a file with bounded memory.
+"""
 
 import argparse
+import asyncio
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to Python path
+# Add project source to Python path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from phoenix_real_estate.foundation.config.environment import get_config  # noqa: E402
+from phoenix_real_estate.foundation.database.connection import (  # noqa: E402
+    close_database_connection,
+    get_database_connection,
+)
+from phoenix_real_estate.foundation.database.export import (  # noqa: E402
+    EXPORT_SUFFIXES,
+    EXPORT_WRITERS,
+)
+from phoenix_real_estate.foundation.database.repositories import PropertyRepository  # noqa: E402
+
+
+async def backup(path, export_format, batch_size):
+    config = get_config()
+    mongodb_uri = config.mongodb_uri or os.getenv("MONGODB_URL", "")
+    database_name = getattr(config, "database_name", "") or getattr(
+        config, "mongodb_database", "phoenix_real_estate"
+    )
+    connection = await get_database_connection(mongodb_uri, database_name)
+    try:
+        repository = PropertyRepository(connection)
+        return await EXPORT_WRITERS[export_format](
+            repository.export(batch_size=batch_size), path, batch_size=batch_size
+        )
+    finally:
+        await close_database_connection()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Database backup")
     parser.add_argument("--name", required=True, help="Backup name")
+    parser.add_argument(
+        "--format", choices=sorted(EXPORT_WRITERS), default="ndjson", help="Output format"
+    )
+    parser.add_argument(
+        "--output-dir", default=str(project_root / "data" / "backups"), help="Backup directory"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per batch")
     args = parser.parse_args()
 
     backup_name = args.name
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    path = Path(args.output_dir) / f"{backup_name}_{timestamp}{EXPORT_SUFFIXES[args.format]}"
+
+    count = asyncio.run(backup(path, args.format, args.batch_size))
 
     print(f"[OK] Backup created: {backup_name}")
     print(f"     Timestamp: {timestamp}")
-    print("     Note: Logical backup using MongoDB native tools")
+    print(f"     Properties: {count} written to {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+# \!/usr/bin/env python3
+"""Index advisor for the repository collections.
+
+Explains every repository query shape, reports collection scans and unused or
+redundant indexes, and proposes a minimal compound index set.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add project source to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from phoenix_real_estate.foundation.config.environment import get_config  # noqa: E402
+from phoenix_real_estate.foundation.database.connection import (  # noqa: E402
+    close_database_connection,
+    get_database_connection,
+)
+from phoenix_real_estate.foundation.database.index_advisor import (  # noqa: E402
+    IndexAdvisor,
+    format_report,
+)
+
+
+async def advise(apply_missing):
+    config = get_config()
+    database_name = getattr(config, "database_name", "") or getattr(
+        config, "mongodb_database", "phoenix_real_estate"
+    )
+    connection = await get_database_connection(config.mongodb_uri, database_name)
+    try:
+        advisor = IndexAdvisor(connection)
+        report = await advisor.analyze()
+        created = await advisor.create_missing(report) if apply_missing else []
+        return report, created
+    finally:
+        await close_database_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query plan and index advisor")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument(
+        "--create-missing", action="store_true", help="Create proposed indexes that are missing"
+    )
+    args = parser.parse_args()
+
+    report, created = asyncio.run(advise(args.create_missing))
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print(format_report(report))
+
+    collscans = [
+        query["name"]
+        for query in report["queries"]
+        if query["collscan"] and not query["full_scan_expected"]
+    ]
+    print(f"\n[OK] Explained {len(report['queries'])} query shapes, {len(collscans)} COLLSCANs")
+    for name in created:
+        print(f"     Created index: {name}")
+
+
+if __name__ == "__main__":
+    main()
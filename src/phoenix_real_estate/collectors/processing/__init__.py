@@ -12,7 +12,11 @@ from .performance import (
     PerformanceOptimizer,
     BatchSizeOptimizer,
     ConcurrencyOptimizer,
+    AdaptiveConcurrencyLimiter,
 )
+from .write_buffer import WriteBehindBuffer
+from .worker_pool import SourcePriorityQueue, WorkerPool
+from .jobs import JobRegistry, ProcessingJob
 
 
 __all__ = [
@@ -42,6 +46,15 @@ __all__ = [
     "PerformanceOptimizer",
     "BatchSizeOptimizer",
     "ConcurrencyOptimizer",
+    "AdaptiveConcurrencyLimiter",
+    # Persistence
+    "WriteBehindBuffer",
+    # Worker pool
+    "SourcePriorityQueue",
+    "WorkerPool",
+    # Batch jobs
+    "JobRegistry",
+    "ProcessingJob",
 ]
 
 # Add version info
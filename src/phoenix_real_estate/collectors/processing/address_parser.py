@@ -0,0 +1,243 @@
+"""Rule-based parsing of Maricopa County property addresses."""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from phoenix_real_estate.collectors.base.reference_data import CITY_MAPPINGS
+from phoenix_real_estate.foundation.utils.helpers import is_valid_zipcode
+
+
+class AddressParser:
+    """Splits single-line addresses into street, city, state and ZIP locally.
+
+    County records use a handful of regular formats, with or without commas
+    ("123 MAIN ST PHOENIX AZ 85033", "123 Main St Unit A, Phoenix, AZ 85001").
+    Addresses are only accepted when a house number, a known or clearly
+    delimited city, an Arizona state and a ZIP code are all present, so
+    callers can fall back to the LLM for anything else.
+    """
+
+    STATE_NAMES = {"AZ": "AZ", "ARIZ": "AZ", "ARIZONA": "AZ"}
+
+    # All Arizona ZIP codes start with 85 or 86
+    ZIP_PREFIXES = ("85", "86")
+
+    # Street suffixes and their normalized abbreviations
+    STREET_SUFFIXES = {
+        "ST": "St",
+        "STREET": "St",
+        "AVE": "Ave",
+        "AVENUE": "Ave",
+        "RD": "Rd",
+        "ROAD": "Rd",
+        "DR": "Dr",
+        "DRIVE": "Dr",
+        "LN": "Ln",
+        "LANE": "Ln",
+        "BLVD": "Blvd",
+        "BOULEVARD": "Blvd",
+        "CT": "Ct",
+        "COURT": "Ct",
+        "PL": "Pl",
+        "PLACE": "Pl",
+        "CIR": "Cir",
+        "CIRCLE": "Cir",
+        "PKWY": "Pkwy",
+        "PARKWAY": "Pkwy",
+        "WAY": "Way",
+        "TRL": "Trl",
+        "TRAIL": "Trl",
+        "LOOP": "Loop",
+        "HWY": "Hwy",
+        "TER": "Ter",
+        "PASS": "Pass",
+        "RUN": "Run",
+    }
+
+    DIRECTIONALS = {
+        "N": "N",
+        "S": "S",
+        "E": "E",
+        "W": "W",
+        "NE": "NE",
+        "NW": "NW",
+        "SE": "SE",
+        "SW": "SW",
+        "NORTH": "N",
+        "SOUTH": "S",
+        "EAST": "E",
+        "WEST": "W",
+        "NORTHEAST": "NE",
+        "NORTHWEST": "NW",
+        "SOUTHEAST": "SE",
+        "SOUTHWEST": "SW",
+    }
+
+    # Unit designators and their normalized labels
+    UNIT_DESIGNATORS = {
+        "UNIT": "Unit",
+        "APT": "Apt",
+        "STE": "Ste",
+        "SUITE": "Ste",
+        "SPC": "Spc",
+        "LOT": "Lot",
+        "BLDG": "Bldg",
+        "#": "#",
+    }
+
+    _ZIP_PATTERN = re.compile(r"[\s,]*(\d{5})(?:-\d{4})?$")
+    _HOUSE_NUMBER_PATTERN = re.compile(r"^\d+[A-Z]?$", re.IGNORECASE)
+    _CITY_PATTERN = re.compile(r"^[A-Za-z][A-Za-z .'-]*$")
+    _ORDINAL_PATTERN = re.compile(r"^(\d+)(ST|ND|RD|TH)$", re.IGNORECASE)
+
+    def __init__(self):
+        """Initialize the address parser."""
+        self._known_cities = sorted(
+            (city.split() for city in CITY_MAPPINGS),
+            key=len,
+            reverse=True,
+        )
+
+    def parse(self, address: Optional[str]) -> Optional[Dict[str, str]]:
+        """Parse an address into its components.
+
+        Args:
+            address: Raw single-line address
+
+        Returns:
+            Dictionary with street, city, state and zip_code, or None if the
+            address cannot be parsed confidently
+        """
+        if not address or not address.strip():
+            return None
+
+        cleaned = " ".join(address.split()).strip(" ,")
+
+        zip_match = self._ZIP_PATTERN.search(cleaned)
+        if not zip_match or not is_valid_zipcode(zip_match.group(1)):
+            return None
+        if not zip_match.group(1).startswith(self.ZIP_PREFIXES):
+            return None
+        zip_code = zip_match.group(1)
+        remainder = cleaned[: zip_match.start()].rstrip(" ,")
+
+        state = "AZ"
+        state_match = re.search(r"(?:^|[\s,])([A-Za-z.]+)$", remainder)
+        if state_match:
+            token = state_match.group(1).upper().rstrip(".")
+            if token in self.STATE_NAMES:
+                state = self.STATE_NAMES[token]
+                remainder = remainder[: state_match.start()].rstrip(" ,")
+            elif len(token) == 2 and token not in self.STREET_SUFFIXES:
+                # Another state's abbreviation
+                return None
+
+        split = self._split_street_city(remainder)
+        if split is None:
+            return None
+        street, city = split
+
+        return {
+            "street": self._normalize_street(street),
+            "city": self._normalize_city(city),
+            "state": state,
+            "zip_code": zip_code,
+        }
+
+    def _split_street_city(self, text: str) -> Optional[Tuple[str, str]]:
+        """Find the boundary between the street and city parts.
+
+        Args:
+            text: Address text with the state and ZIP code removed
+
+        Returns:
+            Tuple of (street, city), or None if no boundary is certain
+        """
+        if "," in text:
+            street, city = (part.strip() for part in text.rsplit(",", 1))
+            street = street.replace(",", " ")
+            if self._is_street(street.split()) and self._CITY_PATTERN.match(city):
+                return " ".join(street.split()), city
+            return None
+
+        tokens = text.split()
+
+        # Prefer a known city name at the end, longest first ("SUN CITY WEST")
+        upper_tokens = [token.upper() for token in tokens]
+        for city_tokens in self._known_cities:
+            size = len(city_tokens)
+            if len(tokens) > size and upper_tokens[-size:] == city_tokens:
+                street_tokens = tokens[:-size]
+                if self._is_street(street_tokens):
+                    return " ".join(street_tokens), " ".join(tokens[-size:])
+
+        # Otherwise split after the last street suffix (and optional unit)
+        for index in range(len(tokens) - 2, 0, -1):
+            if upper_tokens[index] not in self.STREET_SUFFIXES:
+                continue
+            boundary = index + 1
+            if upper_tokens[boundary] in self.UNIT_DESIGNATORS and boundary + 2 < len(tokens):
+                boundary += 2
+            city_tokens = tokens[boundary:]
+            if (
+                self._is_street(tokens[:boundary])
+                and 0 < len(city_tokens) <= 3
+                and self._CITY_PATTERN.match(" ".join(city_tokens))
+            ):
+                return " ".join(tokens[:boundary]), " ".join(city_tokens)
+            break
+
+        return None
+
+    def _is_street(self, tokens: List[str]) -> bool:
+        """Check that tokens look like a numbered street address.
+
+        Besides the house number, at least one token must name the street;
+        directionals and unit markers alone ("123 W", "123 APT 4") do not.
+        """
+        if len(tokens) < 2 or not self._HOUSE_NUMBER_PATTERN.match(tokens[0]):
+            return False
+
+        after_unit = False
+        for token in tokens[1:]:
+            word = token.upper().rstrip(".")
+            if after_unit:
+                after_unit = False
+            elif word in self.UNIT_DESIGNATORS:
+                after_unit = True
+            elif word not in self.DIRECTIONALS and not word.startswith("#"):
+                return True
+        return False
+
+    def _normalize_street(self, street: str) -> str:
+        """Normalize street formatting independently of the input's case.
+
+        Directionals and street suffixes are abbreviated, ordinals keep a
+        lowercase suffix ("1st") and unit labels use one spelling ("Apt 2").
+        """
+        words = []
+        after_unit = False
+        for index, token in enumerate(street.split()):
+            word = token.upper().rstrip(".") or token
+            ordinal = self._ORDINAL_PATTERN.match(word)
+            if index == 0 or after_unit or (word.startswith("#") and len(word) > 1):
+                # House numbers and unit numbers ("12A", "B", "#5")
+                words.append(word)
+                after_unit = False
+            elif word in self.UNIT_DESIGNATORS:
+                words.append(self.UNIT_DESIGNATORS[word])
+                after_unit = True
+            elif word in self.DIRECTIONALS:
+                words.append(self.DIRECTIONALS[word])
+            elif word in self.STREET_SUFFIXES:
+                words.append(self.STREET_SUFFIXES[word])
+            elif ordinal:
+                words.append(f"{ordinal.group(1)}{ordinal.group(2).lower()}")
+            else:
+                words.append(word.capitalize())
+        return " ".join(words)
+
+    def _normalize_city(self, city: str) -> str:
+        """Normalize a city name, preferring the known Phoenix-area spelling."""
+        words = city.split()
+        return CITY_MAPPINGS.get(" ".join(words).upper(), " ".join(w.capitalize() for w in words))
@@ -1,13 +1,20 @@
 """Caching layer for LLM responses to reduce costs and improve performance."""
 
 import asyncio
+import gzip
 import hashlib
 import json
+import os
+import pickle  # nosec B403 - only used for values this process cached itself
+import sqlite3
+import threading
 import time
-from collections import OrderedDict
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Callable, List
-import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Callable, Iterable, List, Set, Tuple
 
 from phoenix_real_estate.foundation.logging import get_logger
 
@@ -21,10 +28,13 @@ class CacheConfig:
     enabled: bool = True
     ttl_hours: float = 24.0
     max_size_mb: float = 100.0
-    eviction_policy: str = "lru"  # lru, lfu, fifo
-    backend: str = "memory"  # memory, redis
+    eviction_policy: str = "lru"  # lru, lfu, fifo, tinylfu
+    backend: str = "memory"  # memory, redis, disk
     redis_url: Optional[str] = None
+    disk_path: str = "data/cache/llm_cache.sqlite3"
+    disk_max_size_mb: float = 1024.0
     warmup_on_start: bool = False
+    snapshot_path: Optional[str] = None
     compression_enabled: bool = True
 
     def __post_init__(self):
@@ -32,6 +42,9 @@ class CacheConfig:
         if self.backend == "redis" and not self.redis_url:
             logger.warning("Redis backend selected but no URL provided, falling back to memory")
             self.backend = "memory"
+        if self.eviction_policy not in EVICTION_POLICIES:
+            logger.warning(f"Unknown eviction policy {self.eviction_policy!r}, falling back to lru")
+            self.eviction_policy = "lru"
 
 
 @dataclass
@@ -89,11 +102,409 @@ class CacheMetrics:
         self.bytes_retrieved = 0
 
 
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight await the same future instead of repeating the work. Results
+    are shared, not copied. If the running call is cancelled, waiting callers
+    retry and one of them runs the call instead.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        return len(self._calls)
+
+    async def do(self, key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``await func(*args, **kwargs)`` unless a call for key is already running.
+
+        Args:
+            key: Identity of the call
+            func: Async callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        while (future := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not future.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The running call was cancelled, not us: take over
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executions += 1
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a call without waiters does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get execution and coalescing counters."""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+
+class EvictionPolicy(ABC):
+    """Decides which cache entry to evict.
+
+    The cache notifies the policy of inserts, hits and removals and asks it
+    for a victim when it needs space. ``record_access`` is called for every
+    lookup or write, including misses, so frequency-based policies can learn
+    about keys that are not cached yet.
+    """
+
+    def record_access(self, key: str) -> None:
+        """Record a lookup or write of key."""
+
+    @abstractmethod
+    def on_insert(self, key: str) -> None:
+        """Track a newly inserted key."""
+        pass
+
+    def on_hit(self, key: str) -> None:
+        """Track a cache hit on key."""
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Stop tracking a removed key."""
+        pass
+
+    @abstractmethod
+    def victim(self) -> Optional[str]:
+        """Get the key that should be evicted next."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used key."""
+
+    def __init__(self, capacity: int = 0):
+        """Initialize the policy."""
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Track a newly inserted key."""
+        self._order[key] = None
+
+    def on_hit(self, key: str) -> None:
+        """Mark key as most recently used."""
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        """Stop tracking a removed key."""
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        """Get the least recently used key."""
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        self._order.clear()
+
+
+class FIFOPolicy(LRUPolicy):
+    """Evicts the oldest inserted key regardless of hits."""
+
+    def on_hit(self, key: str) -> None:
+        """Hits do not change insertion order."""
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evicts the least frequently used key, with periodic aging.
+
+    Keys are kept in per-count buckets (oldest first within a bucket) so
+    hits and evictions are O(1). Every ``aging_interval`` hits all counts
+    are halved, letting formerly hot keys that went cold be evicted.
+    """
+
+    def __init__(self, capacity: int = 0, aging_interval: Optional[int] = None):
+        """Initialize the policy.
+
+        Args:
+            capacity: Expected number of cached entries
+            aging_interval: Hits between count halvings (default 10x capacity)
+        """
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, OrderedDict[str, None]] = defaultdict(OrderedDict)
+        self._min_count = 0
+        self._aging_interval = aging_interval or 10 * max(capacity, 1)
+        self._hits = 0
+
+    def on_insert(self, key: str) -> None:
+        """Track a newly inserted key with a count of one."""
+        self._counts[key] = 1
+        self._buckets[1][key] = None
+        self._min_count = 1
+
+    def on_hit(self, key: str) -> None:
+        """Increment the key's use count."""
+        count = self._counts.get(key)
+        if count is None:
+            return
+        self._unlink(key, count)
+        self._counts[key] = count + 1
+        self._buckets[count + 1][key] = None
+
+        self._hits += 1
+        if self._hits >= self._aging_interval:
+            self._age()
+
+    def on_remove(self, key: str) -> None:
+        """Stop tracking a removed key."""
+        count = self._counts.pop(key, None)
+        if count is not None:
+            self._unlink(key, count)
+
+    def _unlink(self, key: str, count: int) -> None:
+        """Remove key from its count bucket."""
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+    def victim(self) -> Optional[str]:
+        """Get the oldest key among the least frequently used."""
+        if not self._counts:
+            return None
+        if self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)
+        return next(iter(self._buckets[self._min_count]))
+
+    def _age(self) -> None:
+        """Halve every count, keeping relative order within equal counts."""
+        self._hits = 0
+        buckets: Dict[int, OrderedDict[str, None]] = defaultdict(OrderedDict)
+        for count in sorted(self._buckets):
+            aged = max(1, count // 2)
+            for key in self._buckets[count]:
+                buckets[aged][key] = None
+                self._counts[key] = aged
+        self._buckets = buckets
+        self._min_count = min(buckets) if buckets else 0
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+        self._hits = 0
+
+
+class FrequencySketch:
+    """Count-Min sketch of recent key frequencies with 4-bit counters.
+
+    Counters are halved after a sample of accesses so estimates reflect
+    recent popularity.
+    """
+
+    _SEEDS = (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F)
+
+    def __init__(self, capacity: int):
+        """Initialize the sketch.
+
+        Args:
+            capacity: Expected number of cached entries
+        """
+        width = 1 << max(4, max(capacity, 1).bit_length())
+        self._mask = width - 1
+        self._tables = [bytearray(width) for _ in self._SEEDS]
+        self._sample_size = 10 * max(capacity, 1)
+        self._additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        """Get the counter index of key in each table."""
+        return [hash((seed, key)) & self._mask for seed in self._SEEDS]
+
+    def increment(self, key: str) -> None:
+        """Record one access of key."""
+        for table, index in zip(self._tables, self._indexes(key)):
+            if table[index] < 15:
+                table[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._additions = 0
+            self._tables = [bytearray(count >> 1 for count in table) for table in self._tables]
+
+    def estimate(self, key: str) -> int:
+        """Estimate how often key was accessed recently."""
+        return min(table[index] for table, index in zip(self._tables, self._indexes(key)))
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """W-TinyLFU: a small LRU admission window in front of an LRU main region.
+
+    New keys enter the window. When the cache is full, the window's oldest
+    key competes with the main region's LRU victim and whichever the
+    frequency sketch has seen less often is evicted. One-hit wonders from
+    scans therefore cannot push frequently requested entries out.
+    """
+
+    def __init__(self, capacity: int = 0, window_fraction: float = 0.01):
+        """Initialize the policy.
+
+        Args:
+            capacity: Expected number of cached entries
+            window_fraction: Share of capacity used for the admission window
+        """
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._main: OrderedDict[str, None] = OrderedDict()
+        self._window_size = max(1, int(capacity * window_fraction))
+        self._sketch = FrequencySketch(capacity)
+
+    def record_access(self, key: str) -> None:
+        """Record a lookup or write of key in the frequency sketch."""
+        self._sketch.increment(key)
+
+    def on_insert(self, key: str) -> None:
+        """Add key to the window, moving overflow into the main region."""
+        self._window[key] = None
+        while len(self._window) > self._window_size:
+            demoted, _ = self._window.popitem(last=False)
+            self._main[demoted] = None
+
+    def on_hit(self, key: str) -> None:
+        """Mark key as most recently used in its region."""
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._main:
+            self._main.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        """Stop tracking a removed key."""
+        if key in self._window:
+            del self._window[key]
+        else:
+            self._main.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        """Pick the loser between the window candidate and the main victim."""
+        candidate = next(iter(self._window), None)
+        main_victim = next(iter(self._main), None)
+        if candidate is None or main_victim is None:
+            return main_victim if candidate is None else candidate
+
+        if self._sketch.estimate(candidate) > self._sketch.estimate(main_victim):
+            # Admit the candidate into the main region
+            del self._window[candidate]
+            self._main[candidate] = None
+            return main_victim
+        return candidate
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        self._window.clear()
+        self._main.clear()
+
+
+EVICTION_POLICIES: Dict[str, Callable[[int], EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "fifo": FIFOPolicy,
+    "lfu": LFUPolicy,
+    "tinylfu": TinyLFUPolicy,
+}
+
+
+def create_eviction_policy(name: str, capacity: int) -> EvictionPolicy:
+    """Create an eviction policy by name.
+
+    Args:
+        name: Policy name (lru, lfu, fifo, tinylfu)
+        capacity: Expected number of cached entries
+
+    Returns:
+        New policy instance
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    try:
+        return EVICTION_POLICIES[name](capacity)
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy: {name}") from None
+
+
+# Scalar types JSON decodes back to the same type
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_round_trips(value: Any) -> bool:
+    """Check that JSON decodes value back to an equal value of the same types.
+
+    Tuples would come back as lists, non-string dict keys as strings and
+    subclasses as their base type, so such values must be pickled instead.
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is list:
+        return all(_json_round_trips(item) for item in value)
+    if value_type is dict:
+        return all(type(key) is str and _json_round_trips(item) for key, item in value.items())
+    return False
+
+
 class LRUCache:
-    """Least Recently Used cache implementation with TTL support."""
+    """Bounded in-memory cache with TTL support and pluggable eviction.
+
+    Evicts least recently used entries by default; ``eviction_policy``
+    selects LFU, FIFO or W-TinyLFU instead. Values are serialized once on
+    put and stored as byte blobs (JSON, or pickle for values JSON cannot
+    represent exactly), optionally zlib-compressed. The blob length is the exact
+    accounted size, and values are decoded lazily on hit.
+    """
+
+    # Encoding flags stored alongside each blob
+    _PICKLED = 1
+    _COMPRESSED = 2
 
     def __init__(
-        self, max_size: int = 1000, ttl_seconds: float = 86400, max_memory_mb: float = 100
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 86400,
+        max_memory_mb: float = 100,
+        compression: bool = False,
+        compression_min_bytes: int = 256,
+        eviction_policy: str = "lru",
+        on_evict: Optional[Callable[[str], None]] = None,
     ):
         """Initialize LRU cache.
 
@@ -101,64 +512,149 @@ class LRUCache:
             max_size: Maximum number of entries
             ttl_seconds: Time to live for entries in seconds
             max_memory_mb: Maximum memory usage in MB
+            compression: Whether to zlib-compress stored values
+            compression_min_bytes: Smallest serialized value worth compressing
+            eviction_policy: Eviction policy name (lru, lfu, fifo, tinylfu)
+            on_evict: Called with the key of each evicted or expired entry
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.compression = compression
+        self.compression_min_bytes = compression_min_bytes
+
+        self.eviction_policy = eviction_policy
+        self._policy = create_eviction_policy(eviction_policy, max_size)
+        self._on_evict = on_evict
 
-        self._cache: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        # key -> (blob, encoding flags, timestamp)
+        self._cache: Dict[str, tuple[bytes, int, float]] = {}
         self._lock = asyncio.Lock()
         self.memory_used = 0
         self.eviction_count = 0
 
-    def _estimate_size(self, value: Any) -> int:
-        """Estimate memory size of a value."""
-        if isinstance(value, str):
-            return len(value.encode("utf-8"))
-        elif isinstance(value, (dict, list)):
-            return len(json.dumps(value).encode("utf-8"))
+    def _encode(self, value: Any) -> tuple[bytes, int]:
+        """Serialize a value into a blob and its encoding flags."""
+        flags = 0
+        if _json_round_trips(value):
+            blob = json.dumps(value, separators=(",", ":")).encode("utf-8")
         else:
-            return sys.getsizeof(value)
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            flags |= self._PICKLED
+
+        if self.compression and len(blob) >= self.compression_min_bytes:
+            compressed = zlib.compress(blob, 1)
+            if len(compressed) < len(blob):
+                blob = compressed
+                flags |= self._COMPRESSED
+
+        return blob, flags
+
+    def _decode(self, blob: bytes, flags: int) -> Any:
+        """Deserialize a stored blob."""
+        if flags & self._COMPRESSED:
+            blob = zlib.decompress(blob)
+        if flags & self._PICKLED:
+            return pickle.loads(blob)  # nosec B301 - only reads blobs this cache wrote
+        return json.loads(blob)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        if key not in self._cache:
-            return None
+        return self.get_with_size(key)[0]
+
+    def get_with_size(self, key: str) -> tuple[Optional[Any], int]:
+        """Get value from cache along with its stored size in bytes.
 
-        value, timestamp, size = self._cache[key]
+        Returns:
+            Tuple of (value, size); (None, 0) on a miss
+        """
+        self._policy.record_access(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, 0
+
+        blob, flags, timestamp = entry
 
         # Check TTL
         if time.time() - timestamp > self.ttl_seconds:
-            del self._cache[key]
-            self.memory_used -= size
-            return None
+            self._remove(key)
+            if self._on_evict:
+                self._on_evict(key)
+            return None, 0
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return value
+        self._policy.on_hit(key)
+        return self._decode(blob, flags), len(blob)
 
     async def get_async(self, key: str) -> Optional[Any]:
         """Async get for async contexts."""
         async with self._lock:
             return self.get(key)
 
-    def put(self, key: str, value: Any) -> None:
-        """Put value in cache."""
-        self._put_internal_sync(key, value)
+    async def get_with_size_async(self, key: str) -> tuple[Optional[Any], int]:
+        """Async get_with_size for async contexts."""
+        async with self._lock:
+            return self.get_with_size(key)
+
+    def put(self, key: str, value: Any) -> int:
+        """Put value in cache.
 
-    async def put_async(self, key: str, value: Any) -> None:
+        Returns:
+            Stored size in bytes, or 0 if the value was too large to cache
+        """
+        return self._put_internal_sync(key, value)
+
+    async def put_async(self, key: str, value: Any) -> int:
         """Async put for async contexts."""
         async with self._lock:
-            self._put_internal_sync(key, value)
+            return self._put_internal_sync(key, value)
 
-    def _put_internal_sync(self, key: str, value: Any) -> None:
+    def put_many(self, entries: Iterable[Tuple[str, Any, Optional[float]]]) -> List[int]:
+        """Put several entries, preserving their expiry.
+
+        Args:
+            entries: (key, value, expires_at) tuples; expires_at None uses the TTL
+
+        Returns:
+            Stored size per entry (0 where the entry was expired or too large)
+        """
+        now = time.time()
+        sizes = []
+        for key, value, expires_at in entries:
+            if expires_at is not None and expires_at <= now:
+                sizes.append(0)
+                continue
+            timestamp = None if expires_at is None else expires_at - self.ttl_seconds
+            sizes.append(self._put_internal_sync(key, value, timestamp))
+        return sizes
+
+    async def put_many_async(
+        self, entries: Iterable[Tuple[str, Any, Optional[float]]]
+    ) -> List[int]:
+        """Async put_many for async contexts."""
+        async with self._lock:
+            return self.put_many(entries)
+
+    def items(self) -> List[Tuple[str, Any, float]]:
+        """Get all live entries.
+
+        Returns:
+            List of (key, value, expires_at) tuples
+        """
+        now = time.time()
+        return [
+            (key, self._decode(blob, flags), timestamp + self.ttl_seconds)
+            for key, (blob, flags, timestamp) in list(self._cache.items())
+            if now - timestamp <= self.ttl_seconds
+        ]
+
+    def _put_internal_sync(self, key: str, value: Any, timestamp: Optional[float] = None) -> int:
         """Internal put implementation (sync version)."""
-        size = self._estimate_size(value)
+        blob, flags = self._encode(value)
+        size = len(blob)
+        self._policy.record_access(key)
 
         # Remove old entry if exists
-        if key in self._cache:
-            _, _, old_size = self._cache[key]
-            self.memory_used -= old_size
+        self._remove(key)
 
         # Check if the single item is too large for the cache
         if size > self.max_memory_bytes:
@@ -166,7 +662,7 @@ class LRUCache:
                 f"Item too large for cache: {size} bytes > {self.max_memory_bytes} bytes"
             )
             # Don't store items that exceed the memory limit
-            return
+            return 0
 
         # Check memory limit - evict until we have enough space
         while self.memory_used + size > self.max_memory_bytes and self._cache:
@@ -177,24 +673,50 @@ class LRUCache:
             self._evict_one()
 
         # Add new entry
-        self._cache[key] = (value, time.time(), size)
+        self._cache[key] = (blob, flags, time.time() if timestamp is None else timestamp)
+        self._policy.on_insert(key)
         self.memory_used += size
+        return size
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its policy state."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._policy.on_remove(key)
+        self.memory_used -= len(entry[0])
+        return True
 
     def _evict_one(self) -> None:
-        """Evict least recently used entry."""
-        if not self._cache:
+        """Evict the entry chosen by the eviction policy."""
+        key = self._policy.victim()
+        if key is None:
             return
 
-        # Remove oldest (first) item
-        key, (_, _, size) = self._cache.popitem(last=False)
-        self.memory_used -= size
+        self._remove(key)
         self.eviction_count += 1
+        if self._on_evict:
+            self._on_evict(key)
         logger.debug(f"Evicted cache entry: {key[:50]}...")
 
+    def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._remove(key)
+
+    async def delete_async(self, key: str) -> bool:
+        """Async delete for async contexts."""
+        async with self._lock:
+            return self._remove(key)
+
     async def clear(self) -> None:
         """Clear all cache entries."""
         async with self._lock:
             self._cache.clear()
+            self._policy.clear()
             self.memory_used = 0
 
     def size(self) -> int:
@@ -202,6 +724,401 @@ class LRUCache:
         return len(self._cache)
 
 
+class DiskCache:
+    """SQLite-backed persistent cache with TTL and size-bounded eviction.
+
+    Used as the L2 tier under the in-memory ``LRUCache`` so cached responses
+    survive process restarts. Values are stored as JSON, optionally
+    zlib-compressed. When the stored bytes exceed the limit, the least
+    recently accessed entries are evicted until usage drops to 90% of it.
+    Reads do not write: access times older than ``touch_interval`` are
+    buffered on a hit and saved with the next write, eviction or close.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 86400,
+        max_size_mb: float = 1024,
+        compression: bool = True,
+        touch_interval: float = 60.0,
+    ):
+        """Initialize disk cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Time to live for entries in seconds
+            max_size_mb: Maximum stored value size in MB
+            compression: Whether to zlib-compress stored values
+            touch_interval: Seconds before a hit refreshes an entry's access time
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.compression = compression
+        self.touch_interval = touch_interval
+        self._touched: Dict[str, float] = {}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.bytes_used = 0
+        self.eviction_count = 0
+        self.expired_count = 0
+
+    def open(self) -> None:
+        """Open the database, creating it if needed, and purge expired entries."""
+        if self._conn is not None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                compressed INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                tag TEXT
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_tag ON cache_entries (tag)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache_entries (accessed_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries (expires_at)")
+        conn.commit()
+        self._conn = conn
+
+        with self._lock:
+            self._purge_expired()
+            self.bytes_used = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+
+        logger.info(f"Disk cache opened at {self.path} ({self.size()} entries)")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_touches()
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+    def _encode(self, value: Any) -> tuple[bytes, bool]:
+        """Serialize a value for storage."""
+        data = json.dumps(value).encode("utf-8")
+        if self.compression:
+            return zlib.compress(data), True
+        return data, False
+
+    @staticmethod
+    def _decode(data: bytes, compressed: bool) -> Any:
+        """Deserialize a stored value."""
+        if compressed:
+            data = zlib.decompress(data)
+        return json.loads(data.decode("utf-8"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        return self.get_entry(key)[0]
+
+    def get_entry(self, key: str) -> Tuple[Optional[Any], float, Optional[str]]:
+        """Get a value along with its expiry time and tag.
+
+        Returns:
+            Tuple of (value, expires_at, tag); (None, 0.0, None) on a miss
+        """
+        if self._conn is None:
+            return None, 0.0, None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, compressed, size, expires_at, accessed_at, tag "
+                "FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None, 0.0, None
+
+            data, compressed, size, expires_at, accessed_at, tag = row
+            now = time.time()
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.bytes_used -= size
+                self.expired_count += 1
+                return None, 0.0, None
+
+            if now - accessed_at >= self.touch_interval:
+                self._touched[key] = now
+
+        return self._decode(data, bool(compressed)), expires_at, tag
+
+    def put(
+        self, key: str, value: Any, ttl_seconds: Optional[float] = None, tag: Optional[str] = None
+    ) -> None:
+        """Put value in cache.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Entry TTL, defaults to the cache TTL
+            tag: Optional secondary key for grouped deletion with delete_tag
+        """
+        if self._conn is None:
+            return
+
+        data, compressed = self._encode(value)
+        size = len(data)
+        if size > self.max_bytes:
+            logger.warning(f"Item too large for disk cache: {size} bytes > {self.max_bytes} bytes")
+            return
+
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+
+        with self._lock:
+            self._flush_touches()
+            row = self._conn.execute(
+                "SELECT size FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.bytes_used -= row[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, value, compressed, size, expires_at, accessed_at, tag) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(data), int(compressed), size, expires_at, now, tag),
+            )
+            self.bytes_used += size
+
+            if self.bytes_used > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+
+            self._conn.commit()
+
+    def put_many(self, entries: Iterable[Tuple[str, Any, float, Optional[str]]]) -> int:
+        """Put several entries in one transaction.
+
+        Args:
+            entries: (key, value, expires_at, tag) tuples
+
+        Returns:
+            Number of entries written
+        """
+        if self._conn is None:
+            return 0
+
+        now = time.time()
+        rows = []
+        for key, value, expires_at, tag in entries:
+            if expires_at <= now:
+                continue
+            data, compressed = self._encode(value)
+            if len(data) > self.max_bytes:
+                continue
+            rows.append(
+                (key, sqlite3.Binary(data), int(compressed), len(data), expires_at, now, tag)
+            )
+
+        with self._lock:
+            self._flush_touches()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, value, compressed, size, expires_at, accessed_at, tag) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.bytes_used = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+            if self.bytes_used > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+            self._conn.commit()
+
+        return len(rows)
+
+    def items(self) -> List[Tuple[str, Any, float, Optional[str]]]:
+        """Get all live entries.
+
+        Returns:
+            List of (key, value, expires_at, tag) tuples
+        """
+        if self._conn is None:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, compressed, expires_at, tag FROM cache_entries "
+                "WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        return [
+            (key, self._decode(data, bool(compressed)), expires_at, tag)
+            for key, data, compressed, expires_at, tag in rows
+        ]
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        if self._conn is None:
+            return False
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._conn.commit()
+            self.bytes_used -= row[0]
+            return True
+
+    def delete_tag(self, tag: str) -> List[str]:
+        """Delete all entries stored with a tag.
+
+        Returns:
+            Keys of the removed entries
+        """
+        if self._conn is None:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache_entries WHERE tag = ?", (tag,)
+            ).fetchall()
+            if rows:
+                self._conn.execute("DELETE FROM cache_entries WHERE tag = ?", (tag,))
+                self._conn.commit()
+                self.bytes_used -= sum(size for _, size in rows)
+            return [key for key, _ in rows]
+
+    def _flush_touches(self) -> None:
+        """Save buffered access times; the caller commits.
+
+        Must be called with the lock held.
+        """
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self, target_bytes: int) -> None:
+        """Evict least recently accessed entries until usage is below target_bytes.
+
+        Must be called with the lock held.
+        """
+        self._flush_touches()
+        self._purge_expired()
+
+        while self.bytes_used > target_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+
+            evict_keys = []
+            for key, size in rows:
+                if self.bytes_used <= target_bytes:
+                    break
+                evict_keys.append((key,))
+                self.bytes_used -= size
+
+            self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", evict_keys)
+            self.eviction_count += len(evict_keys)
+
+        logger.debug(f"Disk cache evicted down to {self.bytes_used} bytes")
+
+    def _purge_expired(self) -> int:
+        """Delete expired entries. Must be called with the lock held."""
+        now = time.time()
+        freed = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM cache_entries WHERE expires_at <= ?",
+            (now,),
+        ).fetchone()
+        if freed[1]:
+            self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            self._conn.commit()
+            self.bytes_used -= freed[0]
+            self.expired_count += freed[1]
+        return freed[1]
+
+    def compact(self) -> int:
+        """Purge expired entries and reclaim free pages on disk.
+
+        Returns:
+            Number of expired entries removed
+        """
+        if self._conn is None:
+            return 0
+
+        with self._lock:
+            removed = self._purge_expired()
+            self._conn.execute("VACUUM")
+
+        logger.info(f"Disk cache compacted, removed {removed} expired entries")
+        return removed
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        if self._conn is None:
+            return
+
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.commit()
+            self.bytes_used = 0
+
+    def size(self) -> int:
+        """Get number of entries in cache."""
+        if self._conn is None:
+            return 0
+
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """Async get that runs the database read in a worker thread."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def get_entry_async(self, key: str) -> Tuple[Optional[Any], float, Optional[str]]:
+        """Async get_entry that runs the database read in a worker thread."""
+        return await asyncio.to_thread(self.get_entry, key)
+
+    async def put_async(
+        self, key: str, value: Any, ttl_seconds: Optional[float] = None, tag: Optional[str] = None
+    ) -> None:
+        """Async put that runs the database write in a worker thread."""
+        await asyncio.to_thread(self.put, key, value, ttl_seconds, tag)
+
+    async def delete_async(self, key: str) -> bool:
+        """Async delete that runs in a worker thread."""
+        return await asyncio.to_thread(self.delete, key)
+
+    async def delete_tag_async(self, tag: str) -> List[str]:
+        """Async delete_tag that runs in a worker thread."""
+        return await asyncio.to_thread(self.delete_tag, tag)
+
+
+# Header identifying cache snapshot files written by CacheManager.export_snapshot
+SNAPSHOT_FORMAT = "phoenix-llm-cache"
+SNAPSHOT_VERSION = 1
+
+
 class CacheManager:
     """Manages caching for LLM responses."""
 
@@ -215,9 +1132,17 @@ class CacheManager:
         self._metrics = CacheMetrics()
         self._backend_type = config.backend
         self._backend: Optional[Any] = None
+        self._disk: Optional[DiskCache] = None
         self._initialized = False
         self._alert_callbacks: List[Callable] = []
 
+        # Coalesces concurrent lookups of the same key on I/O backends
+        self._get_flight = SingleFlight()
+
+        # Secondary index: property key -> cache keys, and the reverse
+        self._property_index: Dict[str, Set[str]] = {}
+        self._key_properties: Dict[str, str] = {}
+
     async def initialize(self) -> None:
         """Initialize cache backend."""
         if self._initialized:
@@ -231,12 +1156,18 @@ class CacheManager:
         try:
             if self.config.backend == "redis":
                 await self._init_redis()
+            elif self.config.backend == "disk":
+                await self._init_disk()
             else:
                 await self._init_memory()
 
             self._initialized = True
             logger.info(f"Cache initialized with {self._backend_type} backend")
 
+            if self.config.warmup_on_start and self.config.snapshot_path:
+                if Path(self.config.snapshot_path).exists():
+                    await self.import_snapshot(self.config.snapshot_path)
+
         except Exception as e:
             logger.error(f"Failed to initialize {self.config.backend} cache: {e}")
             # Fallback to memory
@@ -252,8 +1183,28 @@ class CacheManager:
             max_size=10000,
             ttl_seconds=self.config.ttl_hours * 3600,
             max_memory_mb=self.config.max_size_mb,
+            compression=self.config.compression_enabled,
+            eviction_policy=self.config.eviction_policy,
+            on_evict=self._on_memory_evict,
         )
 
+    def _on_memory_evict(self, cache_key: str) -> None:
+        """Drop evicted memory-only entries from the property index."""
+        if self._disk is None:
+            self._unindex(cache_key)
+
+    async def _init_disk(self) -> None:
+        """Initialize in-memory cache backed by a persistent disk tier."""
+        disk = DiskCache(
+            path=self.config.disk_path,
+            ttl_seconds=self.config.ttl_hours * 3600,
+            max_size_mb=self.config.disk_max_size_mb,
+            compression=self.config.compression_enabled,
+        )
+        await asyncio.to_thread(disk.open)
+        self._disk = disk
+        await self._init_memory()
+
     async def _init_redis(self) -> None:
         """Initialize Redis cache."""
         try:
@@ -279,6 +1230,10 @@ class CacheManager:
         Returns:
             Cache key string
         """
+        # Content-addressed entries are keyed directly by their digest
+        if "content_hash" in property_data:
+            return f"llm:{operation}:{property_data['content_hash']}"
+
         # Check if this is LLM completion data (has prompt and cache_key)
         if "prompt" in property_data and "cache_key" in property_data:
             # For LLM completion caching, use prompt and cache_key
@@ -307,9 +1262,81 @@ class CacheManager:
 
         return f"llm:{operation}:{hash_value}"
 
+    @staticmethod
+    def _property_keys(property_data: Dict[str, Any]) -> List[str]:
+        """Get every identity of the property an entry belongs to.
+
+        Address components (``street``, ``city``, ``state``, ``zip_code``), as
+        returned by extraction, are joined into the usual one-line form.
+
+        Args:
+            property_data: Property information, LLM data or an extraction result
+
+        Returns:
+            Property keys, most specific first; empty for entries not tied to a property
+        """
+        keys = []
+        for field_name in ("property_id", "listing_id", "address"):
+            value = property_data.get(field_name)
+            if isinstance(value, dict):
+                value = CacheManager._format_address(value)
+            if value:
+                keys.append(f"{field_name}:{str(value).strip().lower()}")
+        return keys
+
+    @staticmethod
+    def _format_address(components: Dict[str, Any]) -> str:
+        """Join address components as "street, city, state zip_code"."""
+        region = " ".join(
+            str(components[part]) for part in ("state", "zip_code") if components.get(part)
+        )
+        parts = [components.get("street"), components.get("city"), region]
+        return ", ".join(str(part) for part in parts if part)
+
+    @classmethod
+    def _property_key(cls, property_data: Dict[str, Any]) -> Optional[str]:
+        """Get the primary identity of the property an entry belongs to, if any."""
+        keys = cls._property_keys(property_data)
+        return keys[0] if keys else None
+
+    @classmethod
+    def _entry_property_key(cls, property_data: Dict[str, Any], response: Any) -> Optional[str]:
+        """Get the property key to index an entry under.
+
+        Content-addressed entries carry no property fields in their key data,
+        so they are indexed by the property found in the cached result.
+        """
+        property_key = cls._property_key(property_data)
+        if property_key is None and isinstance(response, dict):
+            data = response.get("data", response)
+            if isinstance(data, dict):
+                property_key = cls._property_key(data)
+        return property_key
+
+    def _index(self, cache_key: str, property_key: Optional[str]) -> None:
+        """Record that cache_key belongs to a property."""
+        if property_key is None:
+            return
+        self._property_index.setdefault(property_key, set()).add(cache_key)
+        self._key_properties[cache_key] = property_key
+
+    def _unindex(self, cache_key: str) -> None:
+        """Remove cache_key from the property index."""
+        property_key = self._key_properties.pop(cache_key, None)
+        if property_key is None:
+            return
+        cache_keys = self._property_index.get(property_key)
+        if cache_keys is not None:
+            cache_keys.discard(cache_key)
+            if not cache_keys:
+                del self._property_index[property_key]
+
     async def get(self, property_data: Dict[str, Any], operation: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached LLM response if available.
 
+        Concurrent lookups of the same key on the disk and Redis backends
+        share one backend read.
+
         Args:
             property_data: Property information
             operation: Type of operation
@@ -324,14 +1351,14 @@ class CacheManager:
 
         try:
             if self._backend_type == "memory":
-                cached = await self._backend.get_async(cache_key)
+                cached, size_bytes = await self._backend.get_with_size_async(cache_key)
             else:
-                cached = await self._backend.get(cache_key)
-                if cached:
-                    cached = json.loads(cached)
+                cached, size_bytes = await self._get_flight.do(
+                    cache_key, self._lookup, cache_key, property_data
+                )
 
             if cached:
-                self._metrics.record_hit(len(json.dumps(cached)))
+                self._metrics.record_hit(size_bytes)
                 logger.debug(f"Cache hit for {operation}: {cache_key[:50]}...")
                 return cached
             else:
@@ -343,6 +1370,30 @@ class CacheManager:
             self._metrics.record_miss()
             return None
 
+    async def _lookup(
+        self, cache_key: str, property_data: Dict[str, Any]
+    ) -> tuple[Optional[Any], int]:
+        """Look a key up in the disk or Redis backend.
+
+        Returns:
+            Tuple of (cached value, stored size in bytes)
+        """
+        if self._backend_type == "disk":
+            cached, size_bytes = await self._backend.get_with_size_async(cache_key)
+            if cached is None:
+                cached, expires_at, tag = await self._disk.get_entry_async(cache_key)
+                if cached is not None:
+                    # Promote to the memory tier, keeping the disk entry's expiry
+                    sizes = await self._backend.put_many_async([(cache_key, cached, expires_at)])
+                    size_bytes = sizes[0]
+                    self._index(cache_key, tag or self._property_key(property_data))
+            return cached, size_bytes
+
+        cached = await self._backend.get(cache_key)
+        if not cached:
+            return None, 0
+        return json.loads(cached), len(cached)
+
     async def set(
         self, property_data: Dict[str, Any], operation: str, response: Dict[str, Any]
     ) -> None:
@@ -357,18 +1408,26 @@ class CacheManager:
             return
 
         cache_key = self._generate_cache_key(property_data, operation)
+        property_key = self._entry_property_key(property_data, response)
 
         try:
-            response_str = json.dumps(response)
-            size_bytes = len(response_str.encode())
-
             if self._backend_type == "memory":
-                await self._backend.put_async(cache_key, response)
+                size_bytes = await self._backend.put_async(cache_key, response)
+            elif self._backend_type == "disk":
+                size_bytes = await self._backend.put_async(cache_key, response)
+                await self._disk.put_async(cache_key, response, tag=property_key)
             else:
-                await self._backend.setex(
-                    cache_key, int(self.config.ttl_hours * 3600), response_str
-                )
-
+                ttl_seconds = int(self.config.ttl_hours * 3600)
+                response_str = json.dumps(response)
+                size_bytes = len(response_str.encode())
+                await self._backend.setex(cache_key, ttl_seconds, response_str)
+                if property_key is not None:
+                    index_key = f"llm:index:{property_key}"
+                    await self._backend.sadd(index_key, cache_key)
+                    await self._backend.expire(index_key, ttl_seconds)
+
+            if size_bytes:
+                self._index(cache_key, property_key)
             self._metrics.record_set(size_bytes)
             logger.debug(f"Cached {operation} response: {cache_key[:50]}...")
 
@@ -390,8 +1449,196 @@ class CacheManager:
 
         logger.info(f"Warming up cache with {len(properties)} entries for {operation}")
 
-        for prop, resp in zip(properties, responses):
-            await self.set(prop, operation, resp)
+        expires_at = time.time() + self.config.ttl_hours * 3600
+        entries = [
+            (
+                self._generate_cache_key(prop, operation),
+                resp,
+                expires_at,
+                self._entry_property_key(prop, resp),
+            )
+            for prop, resp in zip(properties, responses)
+        ]
+
+        try:
+            await self._put_many(entries)
+        except Exception as e:
+            logger.error(f"Cache warmup error: {e}")
+
+    async def _put_many(self, entries: List[Tuple[str, Any, float, Optional[str]]]) -> int:
+        """Store many entries in one backend round trip.
+
+        Args:
+            entries: (cache key, value, expires_at, property key) tuples
+
+        Returns:
+            Number of entries stored
+        """
+        if not entries:
+            return 0
+
+        if self._backend_type in ("memory", "disk"):
+            sizes = await self._backend.put_many_async(
+                (key, value, expires_at) for key, value, expires_at, _ in entries
+            )
+            if self._disk is not None:
+                await asyncio.to_thread(self._disk.put_many, entries)
+        else:
+            now = time.time()
+            sizes = []
+            async with self._backend.pipeline(transaction=False) as pipe:
+                for key, value, expires_at, property_key in entries:
+                    ttl_seconds = int(expires_at - now)
+                    if ttl_seconds <= 0:
+                        sizes.append(0)
+                        continue
+                    value_str = json.dumps(value)
+                    sizes.append(len(value_str.encode()))
+                    pipe.setex(key, ttl_seconds, value_str)
+                    if property_key is not None:
+                        index_key = f"llm:index:{property_key}"
+                        pipe.sadd(index_key, key)
+                        pipe.expire(index_key, ttl_seconds)
+                await pipe.execute()
+
+        stored = 0
+        for (key, _, _, property_key), size_bytes in zip(entries, sizes):
+            if size_bytes:
+                self._index(key, property_key)
+                self._metrics.record_set(size_bytes)
+                stored += 1
+        return stored
+
+    async def export_snapshot(self, path: str) -> int:
+        """Write all live entries to a gzip-compressed JSONL snapshot.
+
+        Each line holds a cache key, its value, its absolute expiry time and
+        the property key used for invalidation. The file is replaced
+        atomically, so a crash never leaves a truncated snapshot behind.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries written
+        """
+        if not self.config.enabled or not self._initialized or self._backend is None:
+            return 0
+
+        if self._backend_type == "redis":
+            entries = await self._redis_entries()
+        else:
+            by_key = {
+                key: (key, value, expires_at, self._key_properties.get(key))
+                for key, value, expires_at in self._backend.items()
+            }
+            if self._disk is not None:
+                for entry in await asyncio.to_thread(self._disk.items):
+                    by_key.setdefault(entry[0], entry)
+            entries = list(by_key.values())
+
+        count = await asyncio.to_thread(self._write_snapshot, Path(path), entries)
+        logger.info(f"Exported {count} cache entries to {path}")
+        return count
+
+    async def import_snapshot(self, path: str) -> int:
+        """Load entries from a snapshot written by export_snapshot.
+
+        Expired entries are skipped; the rest keep their original expiry.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries loaded
+
+        Raises:
+            ValueError: If the file is not a cache snapshot
+        """
+        if not self.config.enabled or not self._initialized:
+            return 0
+
+        entries = await asyncio.to_thread(self._read_snapshot, Path(path))
+        count = await self._put_many(entries)
+        logger.info(f"Imported {count} cache entries from {path}")
+        return count
+
+    async def _redis_entries(self) -> List[Tuple[str, Any, float, Optional[str]]]:
+        """Collect live entries from Redis with pipelined reads."""
+        keys = [
+            key
+            async for key in self._backend.scan_iter(match="llm:*", count=1000)
+            if not key.startswith("llm:index:")
+        ]
+
+        entries = []
+        now = time.time()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            async with self._backend.pipeline(transaction=False) as pipe:
+                for key in chunk:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                replies = await pipe.execute()
+
+            for key, raw, ttl_ms in zip(chunk, replies[0::2], replies[1::2]):
+                if raw is None or ttl_ms == -2:
+                    continue
+                ttl_seconds = ttl_ms / 1000 if ttl_ms > 0 else self.config.ttl_hours * 3600
+                entries.append(
+                    (key, json.loads(raw), now + ttl_seconds, self._key_properties.get(key))
+                )
+        return entries
+
+    @staticmethod
+    def _write_snapshot(path: Path, entries: List[Tuple[str, Any, float, Optional[str]]]) -> int:
+        """Write snapshot lines to a temporary file and move it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.tmp")
+
+        count = 0
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            header = {
+                "format": SNAPSHOT_FORMAT,
+                "version": SNAPSHOT_VERSION,
+                "created_at": time.time(),
+            }
+            f.write(json.dumps(header) + "\n")
+            for key, value, expires_at, property_key in entries:
+                if value is None:
+                    continue
+                try:
+                    line = json.dumps(
+                        {"key": key, "value": value, "expires_at": expires_at, "tag": property_key}
+                    )
+                except (TypeError, ValueError):
+                    # Values JSON cannot represent stay process-local
+                    continue
+                f.write(line + "\n")
+                count += 1
+
+        os.replace(temp_path, path)
+        return count
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> List[Tuple[str, Any, float, Optional[str]]]:
+        """Read unexpired entries from a snapshot file."""
+        now = time.time()
+        entries = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"Not a cache snapshot: {path}")
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported cache snapshot version: {header.get('version')}")
+
+            for line in f:
+                record = json.loads(line)
+                if record["expires_at"] > now:
+                    entries.append(
+                        (record["key"], record["value"], record["expires_at"], record.get("tag"))
+                    )
+        return entries
 
     async def invalidate(self, property_data: Dict[str, Any], operation: str) -> None:
         """Invalidate specific cache entry.
@@ -406,29 +1653,67 @@ class CacheManager:
         cache_key = self._generate_cache_key(property_data, operation)
 
         try:
-            if self._backend_type == "memory":
-                # Memory backend doesn't have delete, so we set None
-                await self._backend.put_async(cache_key, None)
+            if self._backend_type in ("memory", "disk"):
+                await self._backend.delete_async(cache_key)
+                if self._disk is not None:
+                    await self._disk.delete_async(cache_key)
             else:
                 await self._backend.delete(cache_key)
 
+            self._unindex(cache_key)
             logger.debug(f"Invalidated cache entry: {cache_key[:50]}...")
 
         except Exception as e:
             logger.error(f"Cache invalidation error: {e}")
 
-    async def invalidate_pattern(self, property_data: Dict[str, Any]) -> None:
+    async def invalidate_pattern(self, property_data: Dict[str, Any]) -> int:
         """Invalidate all cache entries for a property.
 
+        Looks the entries up in the property index, so the cost is
+        proportional to the property's own entries rather than the cache size.
+        Every identity in property_data is used, since extraction results are
+        indexed by whichever identity they contain (often only the address).
+
         Args:
             property_data: Property information
+
+        Returns:
+            Number of cache entries invalidated
         """
-        # For now, invalidate common operations
-        # In production, would use Redis SCAN with pattern
-        operations = ["extraction", "validation", "analysis"]
+        if not self.config.enabled or not self._initialized:
+            return 0
+
+        property_keys = self._property_keys(property_data)
+        if not property_keys:
+            return 0
+
+        cache_keys: Set[str] = set()
+        for property_key in property_keys:
+            cache_keys.update(self._property_index.get(property_key, ()))
 
-        for op in operations:
-            await self.invalidate(property_data, op)
+        try:
+            if self._backend_type in ("memory", "disk"):
+                if self._disk is not None:
+                    # Also covers entries written by earlier processes
+                    for property_key in property_keys:
+                        cache_keys.update(await self._disk.delete_tag_async(property_key))
+                for cache_key in cache_keys:
+                    await self._backend.delete_async(cache_key)
+            else:
+                index_keys = [f"llm:index:{property_key}" for property_key in property_keys]
+                for index_key in index_keys:
+                    cache_keys.update(await self._backend.smembers(index_key))
+                await self._backend.delete(*index_keys, *cache_keys)
+
+            for cache_key in cache_keys:
+                self._unindex(cache_key)
+
+            logger.debug(f"Invalidated {len(cache_keys)} cache entries for {property_keys[0]}")
+            return len(cache_keys)
+
+        except Exception as e:
+            logger.error(f"Cache invalidation error: {e}")
+            return 0
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get cache metrics.
@@ -438,17 +1723,50 @@ class CacheManager:
         """
         stats = self._metrics.get_stats()
 
-        if self._backend_type == "memory" and self._backend:
+        if self._backend_type in ("memory", "disk") and self._backend:
             stats["entries"] = self._backend.size()
             stats["memory_used_mb"] = self._backend.memory_used / 1024 / 1024
             stats["evictions"] = self._backend.eviction_count
+            stats["eviction_policy"] = self._backend.eviction_policy
+            stats["indexed_properties"] = len(self._property_index)
+
+        stats["coalesced"] = self._get_flight.coalesced
+
+        if self._disk is not None:
+            stats["disk"] = {
+                "entries": self._disk.size(),
+                "used_mb": self._disk.bytes_used / 1024 / 1024,
+                "evictions": self._disk.eviction_count,
+                "expired": self._disk.expired_count,
+                "path": str(self._disk.path),
+            }
 
         return stats
 
+    async def compact(self) -> int:
+        """Purge expired entries from the disk tier and reclaim space.
+
+        Returns:
+            Number of expired entries removed
+        """
+        if self._disk is None:
+            return 0
+        return await asyncio.to_thread(self._disk.compact)
+
     async def close(self) -> None:
-        """Close cache connections."""
+        """Close cache connections, exporting a snapshot first if one is configured."""
+        if self.config.snapshot_path and self._initialized and self._backend is not None:
+            try:
+                await self.export_snapshot(self.config.snapshot_path)
+            except Exception as e:
+                logger.error(f"Cache snapshot export error: {e}")
+
         if self._backend_type == "redis" and self._backend:
             await self._backend.close()
 
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.close)
+            self._disk = None
+
         self._initialized = False
         logger.info("Cache manager closed")
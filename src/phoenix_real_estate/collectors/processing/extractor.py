@@ -3,12 +3,14 @@
 import asyncio
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from phoenix_real_estate.foundation.config.base import ConfigProvider
 from phoenix_real_estate.foundation.utils.exceptions import ProcessingError
 from phoenix_real_estate.foundation.logging import get_logger
 
+from .address_parser import AddressParser
+from .html_reducer import HTMLReducer
 from .llm_client import OllamaClient
 
 
@@ -22,6 +24,13 @@ class PropertyDataExtractor:
     from various sources including HTML (Phoenix MLS) and JSON (Maricopa County).
     """
 
+    ADDRESS_SCHEMA = {
+        "street": "string",
+        "city": "string",
+        "state": "string",
+        "zip_code": "string",
+    }
+
     def __init__(self, config: ConfigProvider):
         """Initialize the property data extractor.
 
@@ -33,6 +42,25 @@ class PropertyDataExtractor:
         self._validator = None  # Validation happens in pipeline
         self._initialized = False
 
+        # HTML pre-reduction before prompts are built
+        self.html_reduction_enabled = config.get_typed("HTML_REDUCTION_ENABLED", bool, default=True)
+        self._html_reducer = HTMLReducer(
+            max_chars=config.get_typed("HTML_REDUCTION_MAX_CHARS", int, default=4000)
+        )
+        self._reduction_stats = {
+            "pages": 0,
+            "fallbacks": 0,
+            "original_tokens": 0,
+            "reduced_tokens": 0,
+        }
+
+        # Rule-based address parsing, with the LLM as fallback
+        self._address_parser = AddressParser()
+        self._address_stats = {"rule_based": 0, "llm_fallback": 0, "llm_batched": 0}
+
+        # Small payloads below this size share one batched LLM prompt
+        self.batch_item_max_chars = config.get_typed("LLM_BATCH_ITEM_MAX_CHARS", int, default=500)
+
     async def initialize(self) -> None:
         """Initialize the extractor and its dependencies."""
         if self._initialized:
@@ -71,6 +99,7 @@ class PropertyDataExtractor:
         source: str,
         timeout: Optional[int] = None,
         strict_validation: bool = True,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Extract property data from HTML content.
 
@@ -79,6 +108,7 @@ class PropertyDataExtractor:
             source: Source identifier (e.g., 'phoenix_mls')
             timeout: Extraction timeout in seconds
             strict_validation: Whether to enforce strict validation
+            fields: Optional subset of schema fields to extract
 
         Returns:
             Extracted property data with metadata
@@ -97,13 +127,17 @@ class PropertyDataExtractor:
             # Get extraction prompt and schema
             await self.get_extraction_prompt(html_content, source)
             schema = await self.get_extraction_schema(source)
+            if fields:
+                schema = {name: spec for name, spec in schema.items() if name in fields}
 
             # Extract data using LLM
             timeout = timeout or self.config.get_typed("EXTRACTION_TIMEOUT", int, default=30)
 
+            content = self._reduce_html(html_content)
+
             extracted_data = await asyncio.wait_for(
                 self._llm_client.extract_structured_data(
-                    content=html_content, extraction_schema=schema, content_type="html"
+                    content=content, extraction_schema=schema, content_type="html"
                 ),
                 timeout=timeout,
             )
@@ -124,12 +158,54 @@ class PropertyDataExtractor:
             logger.error(f"HTML extraction failed: {e}")
             raise ProcessingError(f"Failed to extract from HTML: {str(e)}") from e
 
+    def _reduce_html(self, html_content: str) -> str:
+        """Reduce raw listing HTML to the regions relevant for extraction.
+
+        Args:
+            html_content: Raw listing HTML
+
+        Returns:
+            Compact text summary, or the original HTML if reduction is disabled
+            or produced nothing usable
+        """
+        if not self.html_reduction_enabled:
+            return html_content
+
+        try:
+            reduction = self._html_reducer.reduce(html_content)
+        except Exception as e:
+            logger.warning(f"HTML reduction failed, using raw HTML: {e}")
+            return html_content
+
+        if not reduction.text:
+            return html_content
+
+        self._reduction_stats["pages"] += 1
+        self._reduction_stats["original_tokens"] += reduction.original_tokens
+        self._reduction_stats["reduced_tokens"] += reduction.reduced_tokens
+        if reduction.used_fallback:
+            self._reduction_stats["fallbacks"] += 1
+
+        return reduction.text
+
+    def get_reduction_stats(self) -> Dict[str, Any]:
+        """Get before/after prompt token sizes for HTML pre-reduction.
+
+        Returns:
+            Dictionary of reduction statistics
+        """
+        stats = dict(self._reduction_stats)
+        original = stats["original_tokens"]
+        stats["reduction_ratio"] = 1 - (stats["reduced_tokens"] / original) if original else 0.0
+        return stats
+
     async def extract_from_json(
         self,
         json_data: Union[Dict[str, Any], str],
         source: str,
         timeout: Optional[int] = None,
         strict_validation: bool = True,
+        prefetched_addresses: Optional[Mapping[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Extract property data from JSON content.
 
@@ -138,6 +214,7 @@ class PropertyDataExtractor:
             source: Source identifier (e.g., 'maricopa_county')
             timeout: Extraction timeout in seconds
             strict_validation: Whether to enforce strict validation
+            prefetched_addresses: Addresses resolved by ``prefetch_batch``
 
         Returns:
             Extracted property data with metadata
@@ -162,24 +239,9 @@ class PropertyDataExtractor:
 
             # For Maricopa data, we need to parse the address
             if source == "maricopa_county":
-                # Extract address using LLM
-
-                address_schema = {
-                    "street": "string",
-                    "city": "string",
-                    "state": "string",
-                    "zip_code": "string",
-                }
-
                 timeout = timeout or self.config.get_typed("EXTRACTION_TIMEOUT", int, default=30)
-
-                parsed_address = await asyncio.wait_for(
-                    self._llm_client.extract_structured_data(
-                        content=json_data.get("property_address", ""),
-                        extraction_schema=address_schema,
-                        content_type="text",
-                    ),
-                    timeout=timeout,
+                parsed_address = await self._parse_address(
+                    json_data.get("property_address", ""), timeout, prefetched_addresses
                 )
 
                 # Build structured data
@@ -213,6 +275,124 @@ class PropertyDataExtractor:
             logger.error(f"JSON extraction failed: {e}")
             raise ProcessingError(f"Failed to extract from JSON: {str(e)}") from e
 
+    async def _parse_address(
+        self,
+        address: str,
+        timeout: int,
+        prefetched_addresses: Optional[Mapping[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Split an address into components, using the LLM only as a fallback.
+
+        Args:
+            address: Raw single-line address
+            timeout: LLM extraction timeout in seconds
+            prefetched_addresses: Addresses already resolved for this batch
+
+        Returns:
+            Address dictionary with street, city, state and zip_code
+        """
+        parsed_address = self._address_parser.parse(address)
+        if parsed_address is not None:
+            self._address_stats["rule_based"] += 1
+            return parsed_address
+
+        prefetched = (prefetched_addresses or {}).get(address)
+        if prefetched is not None:
+            self._address_stats["llm_batched"] += 1
+            return prefetched
+
+        logger.debug(f"Falling back to LLM for address: {address!r}")
+        self._address_stats["llm_fallback"] += 1
+
+        return await asyncio.wait_for(
+            self._llm_client.extract_structured_data(
+                content=address,
+                extraction_schema=self.ADDRESS_SCHEMA,
+                content_type="text",
+            ),
+            timeout=timeout,
+        )
+
+    async def prefetch_batch(
+        self,
+        items: List[Union[str, Dict[str, Any]]],
+        source: str,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Resolve small LLM payloads of a batch with shared prompts.
+
+        Maricopa addresses that the rule-based parser cannot split are sent to
+        the LLM together. The returned mapping belongs to the caller's batch
+        and is passed to its ``extract_from_json`` calls as
+        ``prefetched_addresses``, so concurrent batches never share results.
+        Failures are logged and left to the per-item path.
+
+        Args:
+            items: JSON items about to be extracted
+            source: Source identifier
+            timeout: Extraction timeout per item in seconds
+
+        Returns:
+            Parsed addresses keyed by raw address
+        """
+        if source != "maricopa_county":
+            return {}
+
+        pending: List[str] = []
+        seen = set()
+        for item in items:
+            try:
+                data = json.loads(item) if isinstance(item, str) else item
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            address = data.get("property_address") or ""
+            if (
+                not address
+                or len(address) > self.batch_item_max_chars
+                or address in seen
+                or self._address_parser.parse(address) is not None
+            ):
+                continue
+            seen.add(address)
+            pending.append(address)
+
+        if len(pending) < 2:
+            return {}
+
+        if not self._initialized:
+            await self.initialize()
+
+        timeout = timeout or self.config.get_typed("EXTRACTION_TIMEOUT", int, default=30)
+        try:
+            results = await asyncio.wait_for(
+                self._llm_client.extract_structured_data_batch(
+                    pending, self.ADDRESS_SCHEMA, content_type="text"
+                ),
+                timeout=timeout * len(pending),
+            )
+        except Exception as e:
+            logger.warning(f"Batched address extraction failed: {e}")
+            return {}
+
+        resolved = {
+            address: result for address, result in zip(pending, results) if result is not None
+        }
+        logger.debug(f"Prefetched {len(resolved)}/{len(pending)} addresses in batched prompts")
+        return resolved
+
+    def get_address_parsing_stats(self) -> Dict[str, Any]:
+        """Get counts of addresses parsed locally versus by the LLM.
+
+        Returns:
+            Dictionary of address parsing statistics
+        """
+        stats = dict(self._address_stats)
+        total = stats["rule_based"] + stats["llm_fallback"] + stats["llm_batched"]
+        stats["rule_based_rate"] = stats["rule_based"] / total if total > 0 else 0.0
+        return stats
+
     async def get_extraction_prompt(self, content: str, source: str) -> str:
         """Generate extraction prompt based on content type and source.
 
@@ -322,12 +502,22 @@ class PropertyDataExtractor:
         """
         results = []
 
+        prefetched = (
+            await self.prefetch_batch(items, source, timeout) if content_type == "json" else {}
+        )
+
         for item in items:
             try:
                 if content_type == "html":
                     result = await self.extract_from_html(item, source, timeout, strict_validation)
                 elif content_type == "json":
-                    result = await self.extract_from_json(item, source, timeout, strict_validation)
+                    result = await self.extract_from_json(
+                        item,
+                        source,
+                        timeout,
+                        strict_validation,
+                        prefetched_addresses=prefetched,
+                    )
                 else:
                     raise ValueError(f"Unsupported content type: {content_type}")
 
@@ -0,0 +1,197 @@
+"""HTML pre-reduction for LLM extraction prompts."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, Comment, PageElement, Tag
+
+from phoenix_real_estate.collectors.base.reference_data import FIELD_SELECTORS
+from phoenix_real_estate.foundation.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate LLM token count for text (roughly four characters per token)."""
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class ReductionResult:
+    """Result of reducing a listing page to its relevant content."""
+
+    text: str
+    original_tokens: int
+    reduced_tokens: int
+    regions: List[str] = field(default_factory=list)
+    used_fallback: bool = False
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of the original prompt size that was removed."""
+        if self.original_tokens == 0:
+            return 0.0
+        return 1 - (self.reduced_tokens / self.original_tokens)
+
+
+class HTMLReducer:
+    """Strips non-content markup and summarizes the listing regions of a page.
+
+    Regions are located with the same selectors ``PhoenixMLSParser`` uses, so the
+    LLM sees a compact ``field: text`` summary instead of the raw page.
+    """
+
+    NON_CONTENT_TAGS = [
+        "script",
+        "style",
+        "noscript",
+        "iframe",
+        "svg",
+        "canvas",
+        "template",
+        "nav",
+        "footer",
+        "form",
+        "button",
+        "link",
+        "meta",
+        "head",
+    ]
+
+    # Containers that usually hold listing facts but have no field-specific selector
+    EXTRA_REGION_SELECTORS = {
+        "heading": ["h1", "h2"],
+        "address": ['[class*="address"]', '[class*="location"]'],
+        "details": ['[class*="detail"]', '[class*="spec"]', '[class*="fact"]'],
+        "features": ['[class*="feature"]', '[class*="amenit"]'],
+    }
+
+    def __init__(self, max_chars: int = 4000, max_matches_per_selector: int = 3):
+        """Initialize the reducer.
+
+        Args:
+            max_chars: Maximum characters in the reduced text
+            max_matches_per_selector: Maximum elements collected per selector
+        """
+        self.max_chars = max_chars
+        self.max_matches_per_selector = max_matches_per_selector
+        self._region_selectors = self._build_region_selectors()
+
+    def _build_region_selectors(self) -> Dict[str, List[str]]:
+        """Combine parser field selectors with generic listing containers."""
+        selectors: Dict[str, List[str]] = {}
+        for field_name, field_selectors in FIELD_SELECTORS.items():
+            # soupsieve deprecated ':contains' in favour of ':-soup-contains'
+            selectors[field_name] = [
+                selector.replace(":contains(", ":-soup-contains(") for selector in field_selectors
+            ]
+        for region, region_selectors in self.EXTRA_REGION_SELECTORS.items():
+            selectors.setdefault(region, []).extend(region_selectors)
+        return selectors
+
+    def reduce(self, html_content: str) -> ReductionResult:
+        """Reduce raw listing HTML to a compact text summary.
+
+        Args:
+            html_content: Raw HTML of a listing page
+
+        Returns:
+            ReductionResult with the summary text and before/after token sizes
+        """
+        original_tokens = estimate_tokens(html_content)
+        if not html_content or not html_content.strip():
+            return ReductionResult(text="", original_tokens=original_tokens, reduced_tokens=0)
+
+        soup = BeautifulSoup(html_content, "html.parser")
+        self._strip_non_content(soup)
+
+        lines: List[str] = []
+        regions: List[str] = []
+        seen_text: List[str] = []
+        collected: List[Tag] = []
+
+        for region, selectors in self._region_selectors.items():
+            for selector in selectors:
+                for elem in self._select(soup, selector):
+                    if any(self._is_descendant(elem, parent) for parent in collected):
+                        continue
+                    text = self._region_text(elem, collected)
+                    if not text or any(text in previous for previous in seen_text):
+                        continue
+                    collected.append(elem)
+                    seen_text.append(text)
+                    lines.append(f"{region}: {text}")
+                    if region not in regions:
+                        regions.append(region)
+
+        used_fallback = not lines
+        if used_fallback:
+            body = soup.body or soup
+            reduced_text = self._clean_text(body.get_text(" "))
+        else:
+            reduced_text = "\n".join(lines)
+
+        if len(reduced_text) > self.max_chars:
+            reduced_text = reduced_text[: self.max_chars]
+
+        result = ReductionResult(
+            text=reduced_text,
+            original_tokens=original_tokens,
+            reduced_tokens=estimate_tokens(reduced_text),
+            regions=regions,
+            used_fallback=used_fallback,
+        )
+
+        logger.debug(
+            "Reduced listing HTML",
+            extra={
+                "original_tokens": result.original_tokens,
+                "reduced_tokens": result.reduced_tokens,
+                "regions": regions,
+                "used_fallback": used_fallback,
+            },
+        )
+
+        return result
+
+    def _strip_non_content(self, soup: BeautifulSoup) -> None:
+        """Remove scripts, styles, navigation, tracking markup and comments."""
+        for elem in soup.find_all(self.NON_CONTENT_TAGS):
+            elem.decompose()
+        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+            comment.extract()
+        for elem in soup.find_all(style=re.compile(r"display\s*:\s*none", re.IGNORECASE)):
+            elem.decompose()
+
+    def _select(self, soup: BeautifulSoup, selector: str) -> List[Tag]:
+        """Select elements, ignoring selectors the CSS engine cannot handle."""
+        try:
+            return soup.select(selector, limit=self.max_matches_per_selector)
+        except Exception as e:
+            logger.debug(f"Skipping selector {selector!r}: {e}")
+            return []
+
+    def _region_text(self, elem: Tag, collected: List[Tag]) -> str:
+        """Get element text, excluding parts already emitted by nested regions."""
+        parts = []
+        for string in elem.find_all(string=True):
+            if any(self._is_descendant(string, parent) for parent in collected):
+                continue
+            parts.append(string)
+        return self._clean_text(" ".join(parts))
+
+    @staticmethod
+    def _is_descendant(elem: PageElement, parent: Tag) -> bool:
+        """Check whether elem is parent or nested inside it."""
+        return elem is parent or any(ancestor is parent for ancestor in elem.parents)
+
+    @staticmethod
+    def _clean_text(text: Optional[str]) -> str:
+        """Collapse whitespace in extracted text."""
+        if not text:
+            return ""
+        return " ".join(text.split())
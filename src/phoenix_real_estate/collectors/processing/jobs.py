@@ -0,0 +1,200 @@
+"""Tracking of batch processing jobs submitted to the processing service."""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from phoenix_real_estate.foundation.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ProcessingJob:
+    """Progress and results of one batch of queued items.
+
+    Items are counted as they are submitted; once the upload ends the job
+    is sealed and it completes when every submitted item has a result.
+    Only the latest ``max_results`` results are kept in memory; older ones
+    are dropped and counted in ``results_dropped``.
+    """
+
+    job_id: str
+    created_at: float = field(default_factory=time.time)
+    total: int = 0
+    rejected: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    sealed: bool = False
+    finished_at: Optional[float] = None
+    max_results: int = 10000
+    results_dropped: int = 0
+    results: Deque[Dict[str, Any]] = field(default_factory=deque)
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def processed(self) -> int:
+        """Items with a result."""
+        return self.succeeded + self.failed
+
+    @property
+    def done(self) -> bool:
+        """Whether the upload ended and every item has a result."""
+        return self.sealed and self.processed >= self.total
+
+    @property
+    def status(self) -> str:
+        """Job status: receiving, processing or completed."""
+        if not self.sealed:
+            return "receiving"
+        return "completed" if self.done else "processing"
+
+    def add_item(self) -> int:
+        """Count a submitted item and return its index in the batch."""
+        self.total += 1
+        return self.total - 1
+
+    def seal(self) -> None:
+        """Mark the upload as complete."""
+        self.sealed = True
+        self._notify()
+
+    def record(
+        self, index: int, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None
+    ) -> None:
+        """Record the outcome of one item.
+
+        Args:
+            index: Item index in the batch
+            result: Processing result, if the item succeeded
+            error: Error message, if the item failed
+        """
+        if result is not None and error is None:
+            self.succeeded += 1
+            self._add_result({"index": index, "status": "success", "result": result})
+        else:
+            self.failed += 1
+            self._add_result(
+                {"index": index, "status": "failed", "error": error or "No result produced"}
+            )
+        self._notify()
+
+    def _add_result(self, entry: Dict[str, Any]) -> None:
+        """Keep a result, dropping the oldest beyond max_results."""
+        self.results.append(entry)
+        if len(self.results) > self.max_results:
+            self.results.popleft()
+            self.results_dropped += 1
+
+    def _notify(self) -> None:
+        """Wake result streams and stamp completion."""
+        if self.done and self.finished_at is None:
+            self.finished_at = time.time()
+        self._changed.set()
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the job's progress."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "results_dropped": self.results_dropped,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    async def stream_results(self, follow: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Yield recorded results in completion order.
+
+        Results dropped before a reader reaches them are skipped.
+
+        Args:
+            follow: Keep waiting for new results until the job completes
+        """
+        sent = 0
+        while True:
+            self._changed.clear()
+            while True:
+                sent = max(sent, self.results_dropped)
+                if sent >= self.results_dropped + len(self.results):
+                    break
+                yield self.results[sent - self.results_dropped]
+                sent += 1
+            if not follow or self.done:
+                return
+            await self._changed.wait()
+
+
+class JobRegistry:
+    """Bounded registry of batch jobs.
+
+    Completed jobs are kept for ``retention_seconds`` so clients can fetch
+    their results; the oldest jobs are dropped beyond ``max_jobs``, and each
+    job keeps at most ``max_results_per_job`` results.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = 1000,
+        retention_seconds: float = 3600,
+        max_results_per_job: int = 10000,
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_jobs: Maximum jobs kept
+            retention_seconds: How long completed jobs are kept
+            max_results_per_job: Results kept in memory per job
+        """
+        self.max_jobs = max_jobs
+        self.retention_seconds = retention_seconds
+        self.max_results_per_job = max(1, max_results_per_job)
+        self._jobs: "OrderedDict[str, ProcessingJob]" = OrderedDict()
+
+    def create(self) -> ProcessingJob:
+        """Create and register a new job."""
+        self._expire()
+        job = ProcessingJob(job_id=uuid.uuid4().hex, max_results=self.max_results_per_job)
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ProcessingJob]:
+        """Get a job by id, or None if unknown or expired."""
+        return self._jobs.get(job_id)
+
+    def record(
+        self,
+        job_id: str,
+        index: int,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record an item outcome on its job, if the job is still tracked."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            logger.warning(f"Result for unknown or expired job {job_id}")
+            return
+        job.record(index, result, error)
+
+    def _expire(self) -> None:
+        """Drop expired completed jobs, then the oldest jobs beyond max_jobs."""
+        cutoff = time.time() - self.retention_seconds
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+        while len(self._jobs) >= self.max_jobs:
+            self._jobs.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
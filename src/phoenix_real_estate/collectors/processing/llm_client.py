@@ -1,9 +1,14 @@
 """Ollama client for local LLM processing."""
 
 import asyncio
+import copy
+import hashlib
 import json
 import re
-from typing import Dict, Any, Optional
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List, Optional
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout, ClientError
 
@@ -11,9 +16,176 @@ from phoenix_real_estate.foundation.config.base import ConfigProvider
 from phoenix_real_estate.foundation.logging.factory import get_logger
 from phoenix_real_estate.foundation.utils.helpers import retry_async
 
+from .cache import SingleFlight
+
+
+# Bump whenever the extraction prompt template changes so cached results
+# produced by an older prompt are no longer served.
+EXTRACTION_PROMPT_VERSION = "1"
+
+
+class OutputStreamDetector:
+    """Incrementally detects complete JSON objects inside ``<output>`` tags.
+
+    Fed with streamed completion text, it reports when the expected number of
+    ``<output>{...}</output>`` blocks holding valid JSON objects have been
+    emitted, so generation can be cancelled without waiting for the model to
+    finish. Text is scanned once; no prefix is re-parsed as tokens arrive.
+    """
+
+    OPEN_TAG = "<output"
+    CLOSE_TAG = "</output>"
+
+    def __init__(self, expected_outputs: int = 1, schema: Optional[Dict[str, Any]] = None):
+        """Initialize the detector.
+
+        Args:
+            expected_outputs: Number of complete outputs to wait for
+            schema: Extraction schema; objects must contain at least one of its fields
+        """
+        self.expected_outputs = expected_outputs
+        self._fields = set(schema or {})
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear state before (re)consuming a stream."""
+        self._buffer = ""
+        self._pos = 0
+        self._in_output = False
+        self._object_start: Optional[int] = None
+        self._object_end: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.completed = 0
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all expected outputs have been emitted."""
+        return self.completed >= self.expected_outputs
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk of streamed text.
+
+        Args:
+            text: Newly generated text
+
+        Returns:
+            True once all expected outputs are complete
+        """
+        self._buffer += text
+        buffer = self._buffer
+        i = self._pos
+
+        while not self.is_complete:
+            if self._object_end is not None:
+                # Object closed; wait for the closing tag
+                close = buffer.find(self.CLOSE_TAG, self._object_end)
+                if close == -1:
+                    break
+                if self._is_valid(buffer[self._object_start : self._object_end]):
+                    self.completed += 1
+                i = close + len(self.CLOSE_TAG)
+                self._in_output = False
+                self._object_start = None
+                self._object_end = None
+                continue
+
+            if self._object_start is None:
+                if not self._in_output:
+                    tag = buffer.find(self.OPEN_TAG, i)
+                    if tag == -1:
+                        # Keep a possible partial tag at the end for the next chunk
+                        i = max(i, len(buffer) - len(self.OPEN_TAG))
+                        break
+                    tag_end = buffer.find(">", tag)
+                    if tag_end == -1:
+                        i = tag
+                        break
+                    self._in_output = True
+                    i = tag_end + 1
+                brace = buffer.find("{", i)
+                close = buffer.find(self.CLOSE_TAG, i)
+                if close != -1 and (brace == -1 or close < brace):
+                    # Output block without an object; later text is not part of it
+                    i = close + len(self.CLOSE_TAG)
+                    self._in_output = False
+                    continue
+                if brace == -1:
+                    # Keep a possible partial closing tag at the end for the next chunk
+                    i = max(i, len(buffer) - len(self.CLOSE_TAG))
+                    break
+                self._object_start = brace
+                self._depth = 0
+                self._in_string = False
+                self._escape = False
+                i = brace
+
+            i = self._scan_object(buffer, i)
+            if self._object_end is None:
+                break
+
+        self._pos = i
+        return self.is_complete
+
+    def _scan_object(self, buffer: str, i: int) -> int:
+        """Advance through a JSON object, tracking nesting and strings."""
+        while i < len(buffer):
+            char = buffer[i]
+            i += 1
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._object_end = i
+                    break
+        return i
+
+    def _is_valid(self, object_text: str) -> bool:
+        """Check that an emitted object is JSON matching the schema."""
+        try:
+            data = json.loads(object_text)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(data, dict):
+            return False
+        return not self._fields or bool(self._fields & data.keys())
+
+
+@dataclass
+class OllamaEndpoint:
+    """Routing state for one Ollama instance."""
+
+    url: str
+    outstanding: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    probing: bool = False
+
+    def is_available(self, now: float) -> bool:
+        """Whether the endpoint is not currently ejected."""
+        return self.ejected_until <= now
+
 
 class OllamaClient:
-    """Client for local Ollama LLM processing."""
+    """Client for local Ollama LLM processing.
+
+    Requests are spread over one or more Ollama endpoints (``OLLAMA_BASE_URLS``),
+    routed to the endpoint with the fewest outstanding requests. Endpoints that
+    keep failing are ejected for a while and re-admitted after a health check.
+    """
 
     def __init__(self, config: ConfigProvider) -> None:
         """Initialize Ollama client."""
@@ -22,9 +194,26 @@ class OllamaClient:
 
         # Load configuration - CORRECT pattern using config.get()
         self.base_url = config.get("OLLAMA_BASE_URL", "http://localhost:11434")
+        self._endpoints = [
+            OllamaEndpoint(url=url)
+            for url in self._parse_endpoint_urls(config.get("OLLAMA_BASE_URLS"), self.base_url)
+        ]
+        self.base_url = self._endpoints[0].url
         self.model_name = config.get("LLM_MODEL", "llama3.2:latest")
         self.timeout_seconds = config.get_typed("LLM_TIMEOUT", int, default=30)
         self.max_retries = config.get_typed("LLM_MAX_RETRIES", int, default=2)
+        self.batch_max_records = config.get_typed("LLM_BATCH_MAX_RECORDS", int, default=8)
+        self.streaming_enabled = config.get_typed("LLM_STREAMING", bool, default=True)
+
+        # Connection pool per endpoint and ejection policy
+        self.pool_size = config.get_typed(
+            "OLLAMA_POOL_SIZE",
+            int,
+            default=config.get_typed("MAX_CONCURRENT_PROCESSING", int, default=5),
+        )
+        self.keepalive_seconds = config.get_typed("OLLAMA_KEEPALIVE_SECONDS", float, default=30.0)
+        self.max_endpoint_failures = config.get_typed("OLLAMA_MAX_FAILURES", int, default=3)
+        self.ejection_seconds = config.get_typed("OLLAMA_EJECTION_SECONDS", float, default=30.0)
 
         # HTTP client setup
         self.timeout = ClientTimeout(total=self.timeout_seconds)
@@ -33,10 +222,20 @@ class OllamaClient:
         # Cache manager (will be set by pipeline if caching is enabled)
         self._cache_manager: Optional[Any] = None
 
+        # Concurrency limiter fed with request latency (set by pipeline)
+        self._concurrency_limiter: Optional[Any] = None
+        self._extraction_cache_hits = 0
+        self._extraction_cache_misses = 0
+
+        # Concurrent identical requests share one in-flight call
+        self._completion_flight = SingleFlight()
+        self._extraction_flight = SingleFlight()
+
         self.logger.info(
             "Ollama client initialized",
             extra={
                 "base_url": self.base_url,
+                "endpoints": [endpoint.url for endpoint in self._endpoints],
                 "model": self.model_name,
                 "timeout_seconds": self.timeout_seconds,
             },
@@ -51,12 +250,104 @@ class OllamaClient:
         """Async context manager exit."""
         await self.close()
 
+    @staticmethod
+    def _parse_endpoint_urls(urls: Any, default_url: str) -> List[str]:
+        """Parse the endpoint list from a list or comma-separated string."""
+        if isinstance(urls, str):
+            urls = urls.split(",")
+        parsed = [str(url).strip().rstrip("/") for url in urls or [] if str(url).strip()]
+        return parsed or [default_url.rstrip("/")]
+
     async def _ensure_session(self) -> None:
         """Ensure HTTP session is available."""
         if self.session is None or self.session.closed:
-            self.session = ClientSession(
-                timeout=self.timeout, connector=aiohttp.TCPConnector(limit=5, limit_per_host=2)
+            # aiohttp pools connections per (host, port), so limit_per_host is the per-endpoint pool
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size * len(self._endpoints),
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.keepalive_seconds,
             )
+            self.session = ClientSession(timeout=self.timeout, connector=connector)
+
+    async def _select_endpoint(self) -> OllamaEndpoint:
+        """Pick the available endpoint with the fewest outstanding requests."""
+        if len(self._endpoints) == 1:
+            return self._endpoints[0]
+
+        now = time.monotonic()
+        for endpoint in self._endpoints:
+            if endpoint.ejected_until and endpoint.is_available(now) and not endpoint.probing:
+                # Ejection expired; re-admit only if the endpoint is healthy again.
+                # One request probes while concurrent ones route elsewhere.
+                endpoint.probing = True
+                try:
+                    await self._check_endpoint_health(endpoint)
+                finally:
+                    endpoint.probing = False
+
+        now = time.monotonic()
+        available = [
+            endpoint
+            for endpoint in self._endpoints
+            if endpoint.is_available(now) and not endpoint.probing
+        ]
+        if not available:
+            # Everything is ejected; keep trying rather than failing every request
+            available = self._endpoints
+
+        return min(available, key=lambda endpoint: (endpoint.outstanding, endpoint.total_requests))
+
+    @asynccontextmanager
+    async def _use_endpoint(self) -> AsyncIterator[OllamaEndpoint]:
+        """Route one request to an endpoint, tracking load and failures."""
+        endpoint = await self._select_endpoint()
+        failures_before = endpoint.total_failures
+        endpoint.outstanding += 1
+        endpoint.total_requests += 1
+        start = time.monotonic()
+        success = False
+        try:
+            yield endpoint
+        except (ClientError, asyncio.TimeoutError):
+            self._record_endpoint_failure(endpoint)
+            raise
+        else:
+            success = endpoint.total_failures == failures_before
+            if success:
+                endpoint.consecutive_failures = 0
+        finally:
+            endpoint.outstanding -= 1
+            if self._concurrency_limiter is not None:
+                self._concurrency_limiter.record_sample(time.monotonic() - start, success)
+
+    def _record_endpoint_failure(self, endpoint: OllamaEndpoint) -> None:
+        """Count a failed request and eject the endpoint if it keeps failing."""
+        endpoint.total_failures += 1
+        endpoint.consecutive_failures += 1
+        if len(self._endpoints) > 1 and endpoint.consecutive_failures >= self.max_endpoint_failures:
+            self._eject_endpoint(endpoint)
+
+    def _eject_endpoint(self, endpoint: OllamaEndpoint) -> None:
+        """Stop routing to an endpoint for the ejection period."""
+        endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+        self.logger.warning(
+            "Ollama endpoint ejected",
+            extra={"endpoint": endpoint.url, "ejection_seconds": self.ejection_seconds},
+        )
+
+    def get_endpoint_stats(self) -> List[Dict[str, Any]]:
+        """Get per-endpoint load and health counters."""
+        now = time.monotonic()
+        return [
+            {
+                "url": endpoint.url,
+                "outstanding": endpoint.outstanding,
+                "total_requests": endpoint.total_requests,
+                "total_failures": endpoint.total_failures,
+                "available": endpoint.is_available(now),
+            }
+            for endpoint in self._endpoints
+        ]
 
     async def close(self) -> None:
         """Close HTTP session."""
@@ -65,17 +356,37 @@ class OllamaClient:
             self.session = None
 
     async def health_check(self) -> bool:
-        """Check if Ollama service is available."""
+        """Check if Ollama service is available on any endpoint.
+
+        Unhealthy endpoints are ejected from routing and healthy ones re-admitted.
+        """
+        results = await asyncio.gather(
+            *(self._check_endpoint_health(endpoint) for endpoint in self._endpoints)
+        )
+        return any(results)
+
+    async def _check_endpoint_health(self, endpoint: OllamaEndpoint) -> bool:
+        """Check one endpoint and update its routing state."""
+        healthy = await self._probe_endpoint(endpoint.url)
+        if healthy:
+            endpoint.ejected_until = 0.0
+            endpoint.consecutive_failures = 0
+        elif len(self._endpoints) > 1:
+            self._eject_endpoint(endpoint)
+        return healthy
+
+    async def _probe_endpoint(self, base_url: str) -> bool:
+        """Check that an endpoint responds and serves the configured model."""
         try:
             await self._ensure_session()
 
             # Check service health
-            async with self.session.get(f"{self.base_url}/api/version") as response:
+            async with self.session.get(f"{base_url}/api/version") as response:
                 if response.status != 200:
                     return False
 
             # Check if model is available
-            async with self.session.get(f"{self.base_url}/api/tags") as response:
+            async with self.session.get(f"{base_url}/api/tags") as response:
                 if response.status != 200:
                     return False
 
@@ -86,15 +397,21 @@ class OllamaClient:
                 if not model_available:
                     self.logger.warning(
                         "LLM model not found",
-                        extra={"requested_model": self.model_name, "available_models": models},
+                        extra={
+                            "endpoint": base_url,
+                            "requested_model": self.model_name,
+                            "available_models": models,
+                        },
                     )
                     return False
 
-            self.logger.debug("Ollama health check passed")
+            self.logger.debug("Ollama health check passed", extra={"endpoint": base_url})
             return True
 
         except Exception as e:
-            self.logger.warning("Ollama health check failed", extra={"error": str(e)})
+            self.logger.warning(
+                "Ollama health check failed", extra={"endpoint": base_url, "error": str(e)}
+            )
             return False
 
     async def generate_completion(
@@ -103,18 +420,50 @@ class OllamaClient:
         system_prompt: Optional[str] = None,
         max_tokens: int = 1000,
         cache_key: Optional[str] = None,
+        stop_detector: Optional[OutputStreamDetector] = None,
     ) -> Optional[str]:
         """Generate completion using Ollama with optional caching.
 
+        Concurrent calls with the same prompt, system prompt and token limit
+        share one in-flight request (and cache lookup) instead of each
+        querying the model.
+
         Args:
             prompt: The prompt to send to the model
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens to generate
             cache_key: Optional cache key for response caching
+            stop_detector: Optional detector; when streaming is enabled the
+                response is streamed and cancelled as soon as it reports completion
 
         Returns:
             Generated text or None if failed
         """
+        flight_key = hashlib.sha256(
+            json.dumps(
+                [self.model_name, system_prompt, prompt, max_tokens, cache_key],
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        return await self._completion_flight.do(
+            flight_key,
+            self._generate_completion_cached,
+            prompt,
+            system_prompt,
+            max_tokens,
+            cache_key,
+            stop_detector,
+        )
+
+    async def _generate_completion_cached(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        cache_key: Optional[str],
+        stop_detector: Optional[OutputStreamDetector],
+    ) -> Optional[str]:
+        """Generate a completion, consulting the response cache when keyed."""
         # Check cache first if enabled
         if self._cache_manager and cache_key:
             cached_response = await self._cache_manager.get(
@@ -125,15 +474,27 @@ class OllamaClient:
                 return cached_response.get("response")
 
         # Generate new completion
-        response = await retry_async(
-            self._generate_completion_impl,
-            prompt,
-            system_prompt,
-            max_tokens,
-            max_retries=self.max_retries,
-            delay=1.0,
-            backoff_factor=2.0,
-        )
+        if stop_detector is not None and self.streaming_enabled:
+            response = await retry_async(
+                self._generate_streaming_completion_impl,
+                prompt,
+                system_prompt,
+                max_tokens,
+                stop_detector,
+                max_retries=self.max_retries,
+                delay=1.0,
+                backoff_factor=2.0,
+            )
+        else:
+            response = await retry_async(
+                self._generate_completion_impl,
+                prompt,
+                system_prompt,
+                max_tokens,
+                max_retries=self.max_retries,
+                delay=1.0,
+                backoff_factor=2.0,
+            )
 
         # Cache the response if enabled
         if self._cache_manager and cache_key and response:
@@ -169,12 +530,21 @@ class OllamaClient:
                 payload["system"] = system_prompt
 
             # Make request
-            async with self.session.post(f"{self.base_url}/api/generate", json=payload) as response:
+            async with (
+                self._use_endpoint() as endpoint,
+                self.session.post(f"{endpoint.url}/api/generate", json=payload) as response,
+            ):
                 if response.status != 200:
                     self.logger.error(
                         "Ollama API error",
-                        extra={"status": response.status, "response": await response.text()},
+                        extra={
+                            "endpoint": endpoint.url,
+                            "status": response.status,
+                            "response": await response.text(),
+                        },
                     )
+                    if response.status >= 500:
+                        self._record_endpoint_failure(endpoint)
                     return None
 
                 data = await response.json()
@@ -203,10 +573,299 @@ class OllamaClient:
             self.logger.error("Unexpected error generating completion", extra={"error": str(e)})
             return None
 
+    async def _generate_streaming_completion_impl(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        stop_detector: OutputStreamDetector,
+    ) -> Optional[str]:
+        """Stream a completion, stopping once the detector reports completion.
+
+        Closing the response drops the connection, which makes Ollama abort
+        the generation instead of producing the remaining tokens.
+        """
+        stop_detector.reset()
+        try:
+            await self._ensure_session()
+
+            payload = {
+                "model": self.model_name,
+                "prompt": prompt,
+                "options": {
+                    "num_predict": max_tokens,
+                    "temperature": 0.1,  # Low for consistency
+                    "top_p": 0.9,
+                    "seed": 42,  # For reproducibility
+                },
+                "stream": True,
+            }
+
+            if system_prompt:
+                payload["system"] = system_prompt
+
+            async with (
+                self._use_endpoint() as endpoint,
+                self.session.post(f"{endpoint.url}/api/generate", json=payload) as response,
+            ):
+                if response.status != 200:
+                    self.logger.error(
+                        "Ollama API error",
+                        extra={
+                            "endpoint": endpoint.url,
+                            "status": response.status,
+                            "response": await response.text(),
+                        },
+                    )
+                    if response.status >= 500:
+                        self._record_endpoint_failure(endpoint)
+                    return None
+
+                parts = []
+                stopped_early = False
+                chunk_count = 0
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        self.logger.error("Ollama stream error", extra={"error": data["error"]})
+                        return None
+
+                    token = data.get("response", "")
+                    parts.append(token)
+                    chunk_count += 1
+                    if data.get("done"):
+                        break
+                    if stop_detector.feed(token):
+                        stopped_early = True
+                        response.close()
+                        break
+
+                response_text = "".join(parts)
+
+                self.logger.debug(
+                    "Completion streamed",
+                    extra={
+                        "prompt_length": len(prompt),
+                        "response_length": len(response_text),
+                        "chunks": chunk_count,
+                        "stopped_early": stopped_early,
+                    },
+                )
+
+                return response_text
+
+        except asyncio.TimeoutError:
+            self.logger.error("Ollama request timed out")
+            return None
+        except ClientError as e:
+            self.logger.error("HTTP client error", extra={"error": str(e)})
+            raise  # Let retry_async handle it
+        except Exception as e:
+            self.logger.error("Unexpected error streaming completion", extra={"error": str(e)})
+            return None
+
     async def extract_structured_data(
         self, content: str, extraction_schema: Dict[str, Any], content_type: str = "text"
     ) -> Optional[Dict[str, Any]]:
-        """Extract structured data using LLM."""
+        """Extract structured data using LLM.
+
+        When a cache manager is attached, results are cached by a digest of the
+        normalized content, schema, model name and prompt template version, so
+        re-scraped listings with unchanged content skip the LLM entirely.
+        Concurrent calls for the same digest share one in-flight extraction.
+        """
+        cache_key = self._build_extraction_cache_key(content, extraction_schema, content_type)
+        result = await self._extraction_flight.do(
+            cache_key,
+            self._extract_structured_data_cached,
+            cache_key,
+            content,
+            extraction_schema,
+            content_type,
+        )
+        # Callers annotate the returned dict, and coalesced callers share one result
+        return copy.deepcopy(result)
+
+    async def _extract_structured_data_cached(
+        self,
+        cache_key: str,
+        content: str,
+        extraction_schema: Dict[str, Any],
+        content_type: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Run one extraction, serving it from the extraction cache when possible."""
+        if self._cache_manager:
+            cached = await self._cache_manager.get({"content_hash": cache_key}, "extraction")
+            if cached and cached.get("data") is not None:
+                self._extraction_cache_hits += 1
+                self.logger.debug(f"Extraction cache hit: {cache_key[:16]}")
+                return cached["data"]
+            self._extraction_cache_misses += 1
+
+        result = await self._extract_structured_data_uncached(
+            content, extraction_schema, content_type
+        )
+
+        if self._cache_manager and result is not None:
+            await self._cache_manager.set(
+                {"content_hash": cache_key}, "extraction", {"data": copy.deepcopy(result)}
+            )
+
+        return result
+
+    async def extract_structured_data_batch(
+        self,
+        contents: List[str],
+        extraction_schema: Dict[str, Any],
+        content_type: str = "text",
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Extract structured data from several small records with shared prompts.
+
+        Records are packed into prompts of up to ``LLM_BATCH_MAX_RECORDS``
+        indexed blocks, so the fixed per-request overhead is paid once per
+        batch instead of once per record. Cached records are served from the
+        extraction cache and never sent to the model.
+
+        Args:
+            contents: Record contents to extract from
+            extraction_schema: Schema shared by all records
+            content_type: Type of content being processed
+
+        Returns:
+            Extracted data per record, in input order (None where extraction failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contents)
+        cache_keys: List[Optional[str]] = [None] * len(contents)
+        pending: List[int] = []
+
+        for index, content in enumerate(contents):
+            if self._cache_manager:
+                cache_key = self._build_extraction_cache_key(
+                    content, extraction_schema, content_type
+                )
+                cache_keys[index] = cache_key
+                cached = await self._cache_manager.get({"content_hash": cache_key}, "extraction")
+                if cached and cached.get("data") is not None:
+                    self._extraction_cache_hits += 1
+                    results[index] = copy.deepcopy(cached["data"])
+                    continue
+                self._extraction_cache_misses += 1
+            pending.append(index)
+
+        batch_size = max(1, self.batch_max_records)
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            chunk_results = await self._extract_batch_uncached(
+                [contents[index] for index in chunk], extraction_schema, content_type
+            )
+            for index, result in zip(chunk, chunk_results):
+                results[index] = result
+                if cache_keys[index] and result is not None:
+                    await self._cache_manager.set(
+                        {"content_hash": cache_keys[index]},
+                        "extraction",
+                        {"data": copy.deepcopy(result)},
+                    )
+
+        return results
+
+    async def _extract_batch_uncached(
+        self, contents: List[str], extraction_schema: Dict[str, Any], content_type: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run one batched extraction, retrying records the model dropped.
+
+        Records missing from the response are retried as a smaller batch; if
+        nothing in the response could be parsed the batch is split in half,
+        down to single-record extraction.
+        """
+        if len(contents) == 1:
+            return [
+                await self._extract_structured_data_uncached(
+                    contents[0], extraction_schema, content_type
+                )
+            ]
+
+        schema_description = self._build_schema_description(extraction_schema)
+        records = "\n".join(
+            f'<record index="{index}">\n{content}\n</record>'
+            for index, content in enumerate(contents)
+        )
+
+        prompt = f"""Extract the following information from each of the {len(contents)} {content_type} records below:
+
+{schema_description}
+
+Records:
+{records}
+
+Important: Respond with ONLY one JSON object per record, each wrapped in an <output> tag carrying the record index.
+Example: <output index="0">{{"field": "value"}}</output>
+"""
+
+        system_prompt = "You are a data extraction specialist. Extract information accurately and return only JSON data."
+
+        response = await self.generate_completion(
+            prompt,
+            system_prompt=system_prompt,
+            max_tokens=500 * len(contents),
+            stop_detector=OutputStreamDetector(len(contents), extraction_schema),
+        )
+        parsed = self._extract_indexed_json_from_response(response or "", len(contents))
+
+        missing = [index for index in range(len(contents)) if parsed.get(index) is None]
+        if not missing:
+            return [parsed[index] for index in range(len(contents))]
+
+        self.logger.debug(
+            "Batched extraction incomplete",
+            extra={"batch_size": len(contents), "missing": len(missing)},
+        )
+
+        if len(missing) == len(contents):
+            middle = len(contents) // 2
+            return await self._extract_batch_uncached(
+                contents[:middle], extraction_schema, content_type
+            ) + await self._extract_batch_uncached(
+                contents[middle:], extraction_schema, content_type
+            )
+
+        retried = await self._extract_batch_uncached(
+            [contents[index] for index in missing], extraction_schema, content_type
+        )
+        for index, result in zip(missing, retried):
+            parsed[index] = result
+        return [parsed.get(index) for index in range(len(contents))]
+
+    def _build_extraction_cache_key(
+        self, content: str, extraction_schema: Dict[str, Any], content_type: str
+    ) -> str:
+        """Build a content-addressed cache key for an extraction request."""
+        key_data = {
+            "content": " ".join(str(content).split()),
+            "schema": extraction_schema,
+            "content_type": content_type,
+            "model": self.model_name,
+            "prompt_version": EXTRACTION_PROMPT_VERSION,
+        }
+        data_str = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(data_str.encode("utf-8")).hexdigest()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get extraction cache hit/miss and request coalescing counters."""
+        total = self._extraction_cache_hits + self._extraction_cache_misses
+        return {
+            "hits": self._extraction_cache_hits,
+            "misses": self._extraction_cache_misses,
+            "hit_rate": self._extraction_cache_hits / total if total > 0 else 0.0,
+            "coalesced": self._extraction_flight.coalesced + self._completion_flight.coalesced,
+        }
+
+    async def _extract_structured_data_uncached(
+        self, content: str, extraction_schema: Dict[str, Any], content_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Run the LLM extraction without consulting the extraction cache."""
         # Build prompt for extraction
         schema_description = self._build_schema_description(extraction_schema)
 
@@ -225,7 +884,10 @@ Example: <output>{{"field": "value"}}</output>
 
         # Generate completion
         response = await self.generate_completion(
-            prompt, system_prompt=system_prompt, max_tokens=2000
+            prompt,
+            system_prompt=system_prompt,
+            max_tokens=2000,
+            stop_detector=OutputStreamDetector(1, extraction_schema),
         )
 
         if not response:
@@ -251,9 +913,10 @@ Example: <output>{{"field": "value"}}</output>
                 # Simplified format where spec is just the type string
                 field_type = spec
                 description = f"The {field}"
-            
+
             lines.append(f"- {field} ({field_type}): {description}")
         return "\n".join(lines)
+
     def _extract_json_from_response(self, response: str) -> Optional[Dict[str, Any]]:
         """Extract JSON data from LLM response."""
         try:
@@ -280,6 +943,24 @@ Example: <output>{{"field": "value"}}</output>
             )
             return None
 
+    def _extract_indexed_json_from_response(
+        self, response: str, record_count: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """Extract per-record JSON objects from a batched LLM response."""
+        parsed: Dict[int, Dict[str, Any]] = {}
+        pattern = r"<output\s+index=[\"']?(\d+)[\"']?\s*>\s*(\{.*?\})\s*</output>"
+        for match in re.finditer(pattern, response, re.DOTALL):
+            index = int(match.group(1))
+            if index >= record_count or index in parsed:
+                continue
+            try:
+                data = json.loads(match.group(2))
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                parsed[index] = data
+        return parsed
+
 
 # Backward compatibility alias
 LLMClient = OllamaClient
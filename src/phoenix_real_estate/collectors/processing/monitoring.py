@@ -1,6 +1,7 @@
 """Resource monitoring and management for LLM processing."""
 
 import asyncio
+import threading
 import time
 import psutil
 from collections import deque
@@ -132,18 +133,154 @@ class ResourceMetrics:
         }
 
 
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Point-in-time system and process resource sample."""
+
+    timestamp: float
+    cpu_percent: float
+    memory_mb: float
+    memory_percent: float
+    process_memory_mb: float
+    errors: int = 0
+
+
+class ResourceSampler:
+    """Samples CPU and memory in a background thread.
+
+    Snapshots go into a fixed-size ring buffer. The sampler thread is the only
+    writer and publishes each snapshot with a single reference assignment, so
+    readers on the event loop get the latest values in O(1) without locks or
+    blocking system calls. CPU usage is measured between consecutive samples
+    (``psutil.cpu_percent(interval=None)``) instead of sleeping for a window.
+    """
+
+    def __init__(self, interval: float = 1.0, capacity: int = 300):
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+            capacity: Number of snapshots kept in the ring buffer
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._buffer: List[Optional[ResourceSnapshot]] = [None] * capacity
+        self._count = 0
+        self._latest: Optional[ResourceSnapshot] = None
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Take an initial sample and start the sampling thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sampling loop executed in the background thread."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Resource sampling failed: {e}")
+
+    def sample(self) -> ResourceSnapshot:
+        """Take one sample and publish it.
+
+        Returns:
+            The new snapshot; fields that could not be read are zero
+        """
+        errors = 0
+        try:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        except Exception:
+            cpu_percent, errors = 0.0, errors + 1
+        try:
+            mem = psutil.virtual_memory()
+            memory_mb, memory_percent = mem.used / 1024 / 1024, mem.percent
+        except Exception:
+            memory_mb, memory_percent, errors = 0.0, 0.0, errors + 1
+        try:
+            process_memory_mb = self._process.memory_info().rss / 1024 / 1024
+        except Exception:
+            process_memory_mb, errors = 0.0, errors + 1
+
+        snapshot = ResourceSnapshot(
+            timestamp=time.time(),
+            cpu_percent=cpu_percent,
+            memory_mb=memory_mb,
+            memory_percent=memory_percent,
+            process_memory_mb=process_memory_mb,
+            errors=errors,
+        )
+        self._buffer[self._count % self.capacity] = snapshot
+        self._count += 1
+        self._latest = snapshot
+        return snapshot
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[ResourceSnapshot]:
+        """Get the most recent snapshot.
+
+        Args:
+            max_age: Ignore snapshots older than this many seconds
+
+        Returns:
+            Latest snapshot, or None if there is no (fresh enough) sample
+        """
+        snapshot = self._latest
+        if snapshot is None:
+            return None
+        if max_age is not None and time.time() - snapshot.timestamp > max_age:
+            return None
+        return snapshot
+
+    def history(self, seconds: Optional[float] = None) -> List[ResourceSnapshot]:
+        """Get buffered snapshots, oldest first.
+
+        Args:
+            seconds: Only include snapshots from the last this many seconds
+
+        Returns:
+            List of snapshots
+        """
+        snapshots = [snapshot for snapshot in list(self._buffer) if snapshot is not None]
+        snapshots.sort(key=lambda snapshot: snapshot.timestamp)
+        if seconds is not None:
+            cutoff = time.time() - seconds
+            snapshots = [snapshot for snapshot in snapshots if snapshot.timestamp >= cutoff]
+        return snapshots
+
+
 class ResourceMonitor:
     """Monitors system resources and provides adaptive control."""
 
-    def __init__(self, limits: ResourceLimits):
+    def __init__(self, limits: ResourceLimits, sample_interval: float = 1.0):
         """Initialize resource monitor.
 
         Args:
             limits: Resource limits configuration
+            sample_interval: Seconds between background resource samples
         """
         self.limits = limits
         self.metrics = ResourceMetrics()
         self._process = psutil.Process()
+        self._sampler = ResourceSampler(interval=sample_interval)
 
         self._active_operations: Dict[str, Dict[str, Any]] = {}
         self._active_reservations: Dict[str, Dict[str, Any]] = {}
@@ -163,6 +300,7 @@ class ResourceMonitor:
             return
 
         self._stop_event.clear()
+        self._sampler.start()
         self._monitoring_task = asyncio.create_task(self._monitoring_loop())
         logger.info("Resource monitoring started")
 
@@ -174,6 +312,7 @@ class ResourceMonitor:
         self._stop_event.set()
         await self._monitoring_task
         self._monitoring_task = None
+        await asyncio.to_thread(self._sampler.stop)
         logger.info("Resource monitoring stopped")
 
     async def _monitoring_loop(self) -> None:
@@ -209,6 +348,14 @@ class ResourceMonitor:
 
     async def get_metrics(self) -> Dict[str, Any]:
         """Get current resource metrics."""
+        return self.get_metrics_snapshot()
+
+    def get_metrics_snapshot(self) -> Dict[str, Any]:
+        """Get current resource metrics without blocking.
+
+        Reads the background sampler's latest snapshot, so it is safe to call
+        from synchronous code running on the event loop.
+        """
         try:
             # Memory metrics
             memory_info = self._get_memory_usage()
@@ -217,17 +364,23 @@ class ResourceMonitor:
             cpu_percent = self._get_cpu_usage()
 
             # Process-specific metrics
-            process_memory = self._process.memory_info()
+            snapshot = self._fresh_snapshot()
+            if snapshot is not None:
+                process_memory_mb = snapshot.process_memory_mb
+            else:
+                process_memory_mb = self._process.memory_info().rss / 1024 / 1024
+
+            sampling_failed = snapshot is not None and snapshot.errors > 0
 
             metrics = {
                 "memory_mb": memory_info["mb"],
                 "memory_percent": memory_info["percent"],
                 "cpu_percent": cpu_percent,
-                "process_memory_mb": process_memory.rss / 1024 / 1024,
+                "process_memory_mb": process_memory_mb,
                 "active_operations": len(self._active_operations),
                 "active_reservations": len(self._active_reservations),
                 "queue_size": sum(1 for op in self._active_operations.values() if op.get("queued")),
-                "status": "degraded" if self._degraded_mode else "healthy",
+                "status": "degraded" if self._degraded_mode or sampling_failed else "healthy",
             }
 
             return metrics
@@ -245,8 +398,15 @@ class ResourceMonitor:
                 "status": "degraded",
             }
 
+    def _fresh_snapshot(self) -> Optional[ResourceSnapshot]:
+        """Get the sampler's latest snapshot if it is recent enough to use."""
+        return self._sampler.latest(max_age=self._sampler.interval * 3)
+
     def _get_memory_usage(self) -> Dict[str, float]:
         """Get current memory usage."""
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return {"mb": snapshot.memory_mb, "percent": snapshot.memory_percent}
         try:
             mem = psutil.virtual_memory()
             return {"mb": mem.used / 1024 / 1024, "percent": mem.percent}
@@ -255,8 +415,12 @@ class ResourceMonitor:
 
     def _get_cpu_usage(self) -> float:
         """Get current CPU usage."""
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot.cpu_percent
         try:
-            return psutil.cpu_percent(interval=0.1)
+            # Non-blocking: usage since the previous call
+            return psutil.cpu_percent(interval=None)
         except Exception:
             return 0.0
 
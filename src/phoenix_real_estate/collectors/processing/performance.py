@@ -1,5 +1,6 @@
 """Performance optimization and benchmarking for LLM processing."""
 
+import asyncio
 import time
 import statistics
 from collections import deque
@@ -435,3 +436,176 @@ class ConcurrencyOptimizer:
 
         self.current_concurrency = new_concurrency
         return new_concurrency
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit driven by observed LLM latency and errors.
+
+    Used like ``asyncio.Semaphore`` (``async with limiter:``), but the number of
+    slots changes while work is in flight. LLM calls report their latency and
+    outcome through :meth:`record_sample`:
+
+    - errors and timeouts shrink the limit multiplicatively;
+    - a smoothed latency well above the observed baseline (queueing inside the
+      model server) shrinks it as well, at most once per latency interval;
+    - otherwise, while the limit is saturated, it grows by roughly one slot per
+      window of ``limit`` successful samples.
+
+    With ``adaptive=False`` the limit stays at ``initial_limit``.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        adaptive: bool = True,
+        latency_tolerance: float = 2.0,
+        decrease_factor: float = 0.7,
+        smoothing: float = 0.2,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent slots
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            adaptive: Whether samples adjust the limit
+            latency_tolerance: Smoothed/baseline latency ratio treated as overload
+            decrease_factor: Multiplier applied to the limit on overload
+            smoothing: Weight of new samples in the smoothed latency
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.smoothing = smoothing
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self._baseline_latency: Optional[float] = None
+        self._smoothed_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._samples = 0
+        self._errors = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent slots."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation; hand it on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and wake waiters that now fit under the limit."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        """Acquire a slot."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the slot."""
+        self.release()
+
+    def record_sample(self, latency: float, success: bool = True) -> None:
+        """Record the latency and outcome of one LLM call.
+
+        Args:
+            latency: Call duration in seconds
+            success: Whether the call succeeded
+        """
+        self._samples += 1
+        if not success:
+            self._errors += 1
+            if self.adaptive:
+                self._decrease(force=True)
+            return
+
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += self.smoothing * (latency - self._smoothed_latency)
+
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+        else:
+            # Drift slowly so a uniformly slower model doesn't pin the limit down
+            self._baseline_latency += 0.01 * (latency - self._baseline_latency)
+
+        if not self.adaptive:
+            return
+
+        if self._smoothed_latency > self._baseline_latency * self.latency_tolerance:
+            self._decrease()
+        elif self._in_flight >= self.limit or self._waiters:
+            previous = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            if self.limit > previous:
+                self._increases += 1
+                self._wake_waiters()
+
+    def _decrease(self, force: bool = False) -> None:
+        """Shrink the limit, at most once per smoothed latency interval."""
+        now = time.monotonic()
+        if not force and now - self._last_decrease < (self._smoothed_latency or 0.0):
+            return
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_decrease = now
+        if self.limit < previous:
+            self._decreases += 1
+            logger.debug(f"Concurrency limit decreased from {previous} to {self.limit}")
+
+    def _wake_waiters(self) -> None:
+        """Grant slots to queued waiters while capacity allows."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter state and counters."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "adaptive": self.adaptive,
+            "baseline_latency": self._baseline_latency,
+            "smoothed_latency": self._smoothed_latency,
+            "samples": self._samples,
+            "errors": self._errors,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
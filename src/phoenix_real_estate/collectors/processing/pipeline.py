@@ -1,9 +1,23 @@
 """Data processing pipeline for property information extraction."""
 
 import asyncio
+import re
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
 from phoenix_real_estate.foundation.config.base import ConfigProvider
 from phoenix_real_estate.foundation.logging import get_logger
@@ -12,8 +26,12 @@ from phoenix_real_estate.foundation.utils.helpers import retry_async
 from phoenix_real_estate.models.property import PropertyDetails
 
 from .extractor import PropertyDataExtractor
+from .performance import AdaptiveConcurrencyLimiter
 from .validator import ProcessingValidator, ValidationResult
 
+if TYPE_CHECKING:
+    from phoenix_real_estate.collectors.phoenix_mls.parser import PhoenixMLSParser, PropertyData
+
 
 logger = get_logger(__name__)
 
@@ -39,11 +57,20 @@ class DataProcessingPipeline:
     from various sources using LLM-powered extraction and configurable validation rules.
     """
 
-    def __init__(self, config: ConfigProvider) -> None:
+    # Fields the deterministic parser must supply before the LLM can be skipped
+    TIERED_REQUIRED_FIELDS = ("price", "bedrooms", "bathrooms", "square_feet", "address")
+
+    def __init__(
+        self,
+        config: ConfigProvider,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
         """Initialize the data processing pipeline.
 
         Args:
             config: Configuration provider
+            concurrency_limiter: Optional limiter shared with other consumers of
+                the same Ollama server; one is created from config if omitted
         """
         self.config = config
         self.logger = get_logger("processing.pipeline")
@@ -62,10 +89,15 @@ class DataProcessingPipeline:
             "RESOURCE_MONITORING_ENABLED", bool, default=True
         )
         self.adaptive_batch_sizing = config.get_typed("ADAPTIVE_BATCH_SIZING", bool, default=True)
+        self.adaptive_concurrency = config.get_typed("ADAPTIVE_CONCURRENCY", bool, default=True)
+
+        # HTML extraction mode: "tiered" runs the deterministic parser first, "llm" always uses LLM
+        self.extraction_mode = config.get("EXTRACTION_MODE", "tiered")
 
         # Components
         self._extractor: Optional[PropertyDataExtractor] = None
         self._validator: Optional[ProcessingValidator] = None
+        self._parser: Optional["PhoenixMLSParser"] = None
         self._cache_manager: Optional[Any] = None
         self._resource_monitor: Optional[Any] = None
         self._batch_optimizer: Optional[Any] = None
@@ -79,22 +111,38 @@ class DataProcessingPipeline:
             "total_processing_time": 0.0,
             "total_confidence": 0.0,
             "errors_by_type": {},
+            "extraction_tiers": {"parser": 0, "parser+llm": 0, "llm": 0},
         }
 
-        # Concurrency control
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Concurrency control: MAX_CONCURRENT_PROCESSING is the starting limit,
+        # which adapts to observed LLM latency and errors when enabled
+        self._semaphore = concurrency_limiter or AdaptiveConcurrencyLimiter(
+            initial_limit=self.max_concurrent,
+            min_limit=config.get_typed("ADAPTIVE_CONCURRENCY_MIN", int, default=1),
+            max_limit=config.get_typed(
+                "ADAPTIVE_CONCURRENCY_MAX", int, default=self.max_concurrent * 4
+            ),
+            adaptive=self.adaptive_concurrency,
+        )
 
         self.logger.info(
             "Pipeline initialized",
             extra={
                 "batch_size": self.batch_size,
                 "max_concurrent": self.max_concurrent,
+                "adaptive_concurrency": self.adaptive_concurrency,
                 "processing_timeout": self.processing_timeout,
                 "cache_enabled": self.cache_enabled,
                 "resource_monitoring": self.resource_monitoring_enabled,
+                "extraction_mode": self.extraction_mode,
             },
         )
 
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Limiter bounding in-flight processing, shareable with service workers."""
+        return self._semaphore
+
     async def initialize(self) -> None:
         """Initialize pipeline components."""
         if self._initialized:
@@ -109,6 +157,19 @@ class DataProcessingPipeline:
             validation_config = self.config.get("VALIDATION_CONFIG", None)
             self._validator = ProcessingValidator(validation_config)
 
+            # Initialize deterministic parser for tiered HTML extraction
+            if self.extraction_mode == "tiered":
+                # Imported here: the phoenix_mls package pulls in the Playwright scraper
+                try:
+                    from phoenix_real_estate.collectors.phoenix_mls.parser import (
+                        PhoenixMLSParser,
+                    )
+                except ImportError as e:
+                    self.logger.warning(f"Deterministic parser unavailable, using LLM only: {e}")
+                    self.extraction_mode = "llm"
+                else:
+                    self._parser = PhoenixMLSParser()
+
             # Initialize cache if enabled
             if self.cache_enabled:
                 from .cache import CacheManager, CacheConfig
@@ -118,13 +179,30 @@ class DataProcessingPipeline:
                     ttl_hours=self.config.get_typed("CACHE_TTL_HOURS", float, default=24),
                     max_size_mb=self.config.get_typed("CACHE_MAX_SIZE_MB", float, default=100),
                     backend=self.config.get("CACHE_BACKEND", "memory"),
+                    eviction_policy=self.config.get("CACHE_EVICTION_POLICY", "lru"),
+                    disk_path=str(
+                        Path(self.config.get("CACHE_DIRECTORY", "data/cache")) / "llm_cache.sqlite3"
+                    ),
+                    disk_max_size_mb=self.config.get_typed(
+                        "CACHE_DISK_MAX_SIZE_MB", float, default=1024
+                    ),
+                    snapshot_path=self.config.get("CACHE_SNAPSHOT_PATH"),
+                    warmup_on_start=self.config.get_typed(
+                        "CACHE_WARMUP_ON_START", bool, default=False
+                    ),
                 )
                 self._cache_manager = CacheManager(cache_config)
                 await self._cache_manager.initialize()
 
                 # Inject cache into extractor's LLM client
-                if hasattr(self._extractor, "_client"):
-                    self._extractor._client._cache_manager = self._cache_manager
+                llm_client = getattr(self._extractor, "_llm_client", None)
+                if llm_client is not None:
+                    llm_client._cache_manager = self._cache_manager
+
+            # Feed LLM call latency and errors into the concurrency limiter
+            llm_client = getattr(self._extractor, "_llm_client", None)
+            if llm_client is not None:
+                llm_client._concurrency_limiter = self._semaphore
 
             # Initialize resource monitor if enabled
             if self.resource_monitoring_enabled:
@@ -212,21 +290,33 @@ class DataProcessingPipeline:
         result = ProcessingResult(is_valid=False, source=source)
 
         try:
-            # Extract data with retry
-            extraction_data = await retry_async(
-                self._extractor.extract_from_html,
-                html_content,
-                source,
-                timeout,
-                strict_validation,
-                max_retries=self.retry_attempts,
-                delay=self.retry_delay,
-            )
+            # Extract data, using the deterministic parser first when tiered
+            if self._parser:
+                extraction_data, provenance = await self._extract_html_tiered(
+                    html_content, source, timeout, strict_validation
+                )
+            else:
+                extraction_data = await retry_async(
+                    self._extractor.extract_from_html,
+                    html_content,
+                    source,
+                    timeout,
+                    strict_validation,
+                    max_retries=self.retry_attempts,
+                    delay=self.retry_delay,
+                )
+                provenance = {}
 
             # Check if extraction returned data
             if extraction_data is None:
                 raise ProcessingError("Extraction returned no data")
 
+            if provenance:
+                result.metadata["field_provenance"] = provenance
+                result.metadata["extraction_tier"] = self._classify_tier(provenance)
+                if self.metrics_enabled:
+                    self._metrics["extraction_tiers"][result.metadata["extraction_tier"]] += 1
+
             # Convert to PropertyDetails
             property_data = PropertyDetails.from_extraction_result(extraction_data)
             result.property_data = property_data
@@ -257,12 +347,169 @@ class DataProcessingPipeline:
 
         return result
 
+    async def _extract_html_tiered(
+        self,
+        html_content: str,
+        source: str,
+        timeout: Optional[int],
+        strict_validation: bool,
+    ) -> tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """Extract HTML with the deterministic parser, using the LLM only for gaps.
+
+        Args:
+            html_content: HTML content to process
+            source: Data source identifier
+            timeout: Processing timeout in seconds
+            strict_validation: Whether to enforce strict validation
+
+        Returns:
+            Tuple of (extraction data, per-field provenance of "parser" or "llm")
+        """
+        parsed = self._parse_html(html_content, source)
+
+        if parsed is None:
+            # Parser could not handle the page, fall back to full LLM extraction
+            extraction_data = await retry_async(
+                self._extractor.extract_from_html,
+                html_content,
+                source,
+                timeout,
+                strict_validation,
+                max_retries=self.retry_attempts,
+                delay=self.retry_delay,
+            )
+            provenance = {
+                name: "llm"
+                for name, value in (extraction_data or {}).items()
+                if value is not None and name not in ("source", "extracted_at")
+            }
+            return extraction_data, provenance
+
+        provenance = {
+            name: "parser"
+            for name, value in parsed.items()
+            if value is not None and name not in ("source", "extracted_at")
+        }
+
+        missing_fields = self._fields_needing_llm(parsed)
+        if not missing_fields:
+            return parsed, provenance
+
+        try:
+            llm_data = await retry_async(
+                self._extractor.extract_from_html,
+                html_content,
+                source,
+                timeout,
+                strict_validation,
+                fields=missing_fields,
+                max_retries=self.retry_attempts,
+                delay=self.retry_delay,
+            )
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            # Keep the parser result and let validation judge the gaps
+            self.logger.warning(
+                f"LLM fallback failed, keeping parser result: {e}",
+                extra={"missing_fields": missing_fields},
+            )
+            return parsed, provenance
+
+        for name in missing_fields:
+            value = (llm_data or {}).get(name)
+            if value is not None:
+                parsed[name] = value
+                provenance[name] = "llm"
+
+        return parsed, provenance
+
+    def _parse_html(self, html_content: str, source: str) -> Optional[Dict[str, Any]]:
+        """Run the deterministic parser and convert its output to extraction format.
+
+        Args:
+            html_content: HTML content to parse
+            source: Data source identifier
+
+        Returns:
+            Extraction dictionary or None if the page could not be parsed
+        """
+        try:
+            property_data = self._parser.parse_property(html_content)
+        except Exception as e:
+            self.logger.debug(f"Deterministic parse failed, using LLM: {e}")
+            return None
+
+        return {
+            "price": property_data.price,
+            "bedrooms": property_data.beds,
+            "bathrooms": property_data.baths,
+            "square_feet": property_data.sqft,
+            "lot_size": property_data.lot_size,
+            "lot_units": property_data.lot_size_unit,
+            "year_built": property_data.year_built,
+            "property_type": property_data.property_type,
+            "description": property_data.description,
+            "features": property_data.features or [],
+            "mls_number": property_data.mls_id,
+            "property_address": property_data.address,
+            "address": self._split_parsed_address(property_data),
+            "source": source,
+            "extracted_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _split_parsed_address(self, property_data: "PropertyData") -> Optional[Dict[str, Any]]:
+        """Split a parsed address into components without invented defaults."""
+        try:
+            parts = self._parser.normalize_address(property_data.address)
+        except ValueError:
+            return None
+
+        # normalize_address falls back to a default ZIP, which must not be trusted
+        has_zip = re.search(r"\b\d{5}\b", property_data.address) is not None
+
+        return {
+            "street": parts.get("street"),
+            "city": parts.get("city"),
+            "state": parts.get("state"),
+            "zip_code": parts.get("zip") if has_zip else None,
+        }
+
+    def _fields_needing_llm(self, parsed: Dict[str, Any]) -> List[str]:
+        """Get required fields that are missing or fail validation rules."""
+        missing = []
+        for name in self.TIERED_REQUIRED_FIELDS:
+            value = parsed.get(name)
+            if name == "address":
+                if not value or not all(value.get(k) for k in ("street", "city", "zip_code")):
+                    missing.append(name)
+            elif value is None:
+                missing.append(name)
+
+        property_data = PropertyDetails.from_extraction_result(parsed)
+        for name in self._validator.get_invalid_fields(property_data):
+            if name not in missing:
+                missing.append(name)
+
+        return missing
+
+    @staticmethod
+    def _classify_tier(provenance: Dict[str, str]) -> str:
+        """Classify which extraction tiers produced a result."""
+        sources = set(provenance.values())
+        if sources == {"parser"}:
+            return "parser"
+        if "parser" in sources:
+            return "parser+llm"
+        return "llm"
+
     async def process_json(
         self,
         json_data: Union[Dict[str, Any], str],
         source: str,
         timeout: Optional[int] = None,
         strict_validation: bool = True,
+        prefetched_addresses: Optional[Mapping[str, Dict[str, Any]]] = None,
     ) -> ProcessingResult:
         """Process single JSON content.
 
@@ -271,6 +518,7 @@ class DataProcessingPipeline:
             source: Data source identifier
             timeout: Processing timeout in seconds
             strict_validation: Whether to enforce strict validation
+            prefetched_addresses: Addresses resolved for the enclosing batch
 
         Returns:
             ProcessingResult with extraction and validation results
@@ -293,6 +541,7 @@ class DataProcessingPipeline:
                 strict_validation,
                 max_retries=self.retry_attempts,
                 delay=self.retry_delay,
+                prefetched_addresses=prefetched_addresses,
             )
 
             # Check if extraction returned data
@@ -457,7 +706,13 @@ class DataProcessingPipeline:
             """Process single item with semaphore control."""
             async with self._semaphore:
                 try:
-                    return await self.process_json(item, source, timeout, strict_validation)
+                    return await self.process_json(
+                        item,
+                        source,
+                        timeout,
+                        strict_validation,
+                        prefetched_addresses=prefetched,
+                    )
                 except Exception as e:
                     # Return error result instead of raising
                     result = ProcessingResult(
@@ -466,6 +721,9 @@ class DataProcessingPipeline:
                     # Metrics are already updated in process_html, don't double count
                     return result
 
+        # Resolve small LLM payloads (unparseable addresses) with batched prompts
+        prefetched = await self._extractor.prefetch_batch(json_items, source, timeout)
+
         # Process in batches
         for i in range(0, len(json_items), self.batch_size):
             batch = json_items[i : i + self.batch_size]
@@ -477,6 +735,118 @@ class DataProcessingPipeline:
 
         return results
 
+    async def process_stream(
+        self,
+        items: Union[AsyncIterable[Any], Iterable[Any]],
+        source: str,
+        content_type: str = "html",
+        timeout: Optional[int] = None,
+        strict_validation: bool = True,
+        ordered: bool = False,
+    ) -> AsyncIterator[ProcessingResult]:
+        """Process a stream of items, yielding results as they complete.
+
+        Items are pulled lazily so that the concurrency limiter is kept
+        saturated; a slow item never holds back the ones queued behind it. With
+        ``ordered`` results are yielded in input order, buffering at most twice
+        the limiter's current limit in completed results.
+
+        Args:
+            items: Iterable or async iterable of HTML strings or JSON items
+            source: Data source identifier
+            content_type: Type of content ('html' or 'json')
+            timeout: Processing timeout per item
+            strict_validation: Whether to enforce strict validation
+            ordered: Whether to yield results in input order
+
+        Yields:
+            ProcessingResult per item, with its input position in
+            ``metadata["stream_index"]``
+
+        Raises:
+            ValueError: If content type is not supported
+        """
+        self._ensure_initialized()
+
+        if content_type == "html":
+            process = self.process_html
+        elif content_type == "json":
+            process = self.process_json
+        else:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        if isinstance(items, AsyncIterable):
+            iterator = items.__aiter__()
+        else:
+            iterator = self._iterate_async(items)
+
+        async def process_item(index: int, item: Any) -> ProcessingResult:
+            """Process single item, converting failures to error results."""
+            async with self._semaphore:
+                try:
+                    result = await process(item, source, timeout, strict_validation)
+                except Exception as e:
+                    # Metrics are already updated in process_html/process_json
+                    result = ProcessingResult(
+                        is_valid=False, source=source, error=str(e), processing_time=0.0
+                    )
+            result.metadata["stream_index"] = index
+            return result
+
+        def capacity() -> int:
+            """Items to keep in flight: the limiter's current limit, read each round."""
+            return max(1, getattr(self._semaphore, "limit", self.max_concurrent))
+
+        in_flight: set = set()
+        completed: Dict[int, ProcessingResult] = {}
+        next_index = 0
+        next_to_yield = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Keep the worker pool full without running ahead of the reorder buffer
+                while (
+                    not exhausted
+                    and len(in_flight) < capacity()
+                    and (not ordered or next_index - next_to_yield < 2 * capacity())
+                ):
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    in_flight.add(asyncio.create_task(process_item(next_index, item)))
+                    next_index += 1
+
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    result = task.result()
+                    if ordered:
+                        completed[result.metadata["stream_index"]] = result
+                    else:
+                        yield result
+
+                while next_to_yield in completed:
+                    yield completed.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            # Consumer stopped early or failed; don't leave work running
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    @staticmethod
+    async def _iterate_async(items: Iterable[Any]) -> AsyncIterator[Any]:
+        """Adapt a synchronous iterable to the async iterator protocol."""
+        for item in items:
+            yield item
+
     def _update_metrics(
         self, result: ProcessingResult, validation_result: ValidationResult
     ) -> None:
@@ -530,6 +900,7 @@ class DataProcessingPipeline:
                 self._metrics["total_confidence"] / successful if successful > 0 else 0
             ),
             "errors_by_type": dict(self._metrics["errors_by_type"]),
+            "extraction_tiers": dict(self._metrics["extraction_tiers"]),
         }
 
         # Add cache metrics if available
@@ -543,9 +914,25 @@ class DataProcessingPipeline:
                 "memory_used_mb": cache_metrics.get("memory_used_mb", 0),
             }
 
+            llm_client = getattr(self._extractor, "_llm_client", None)
+            if llm_client is not None and hasattr(llm_client, "get_cache_stats"):
+                metrics["cache"]["extraction"] = llm_client.get_cache_stats()
+
+        # Add HTML pre-reduction metrics if available
+        if self._extractor and hasattr(self._extractor, "get_reduction_stats"):
+            metrics["html_reduction"] = self._extractor.get_reduction_stats()
+
+        # Add concurrency limiter state
+        if hasattr(self._semaphore, "get_stats"):
+            metrics["concurrency"] = self._semaphore.get_stats()
+
+        # Add rule-based vs LLM address parsing metrics if available
+        if self._extractor and hasattr(self._extractor, "get_address_parsing_stats"):
+            metrics["address_parsing"] = self._extractor.get_address_parsing_stats()
+
         # Add resource metrics if available
         if self._resource_monitor:
-            resource_metrics = asyncio.run(self._resource_monitor.get_metrics())
+            resource_metrics = self._resource_monitor.get_metrics_snapshot()
             metrics["resources"] = {
                 "memory_mb": resource_metrics.get("memory_mb", 0),
                 "memory_percent": resource_metrics.get("memory_percent", 0),
@@ -571,6 +958,7 @@ class DataProcessingPipeline:
             "total_processing_time": 0.0,
             "total_confidence": 0.0,
             "errors_by_type": {},
+            "extraction_tiers": {"parser": 0, "parser+llm": 0, "llm": 0},
         }
         self.logger.info("Metrics cleared")
 
@@ -6,9 +6,11 @@ monitoring, and graceful shutdown handling.
 """
 
 import asyncio
+import json
+import os
 import signal
 import sys
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 # Windows-compatible uvloop import
 try:
@@ -20,7 +22,10 @@ try:
 except ImportError:
     # uvloop not available (Windows or not installed)
     pass
+import psutil
 from aiohttp import web
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
 from prometheus_client import (
     Counter,
     Gauge,
@@ -37,7 +42,15 @@ from phoenix_real_estate.collectors.processing.monitoring import (
     ResourceMonitor,
     ResourceLimits,
 )
-from phoenix_real_estate.collectors.processing import OllamaClient
+from phoenix_real_estate.collectors.processing import (
+    OllamaClient,
+    AdaptiveConcurrencyLimiter,
+    WriteBehindBuffer,
+    SourcePriorityQueue,
+    WorkerPool,
+    JobRegistry,
+)
+from phoenix_real_estate.collectors.processing.worker_pool import parse_source_priorities
 from phoenix_real_estate.api.health import (
     HealthCheckService,
     detailed_health_handler,
@@ -54,8 +67,16 @@ processing_duration = Histogram(
     "llm_processing_duration_seconds", "Processing request duration", ["source"]
 )
 active_connections = Gauge("llm_active_connections", "Number of active LLM connections")
+active_workers = Gauge("llm_processing_workers", "Current number of processing workers")
 queue_size = Gauge("llm_processing_queue_size", "Current size of processing queue")
 memory_usage = Gauge("llm_memory_usage_bytes", "Current memory usage in bytes")
+db_bulk_writes = Counter("llm_db_bulk_writes_total", "Bulk result writes sent to the database")
+db_buffered_results = Gauge("llm_db_buffered_results", "Results waiting in the write buffer")
+
+
+def _ndjson_line(record: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON line; values JSON cannot encode are stringified."""
+    return (json.dumps(record, default=str) + "\n").encode("utf-8")
 
 
 class LLMProcessingService:
@@ -74,9 +95,44 @@ class LLMProcessingService:
         self.running = False
         self.shutdown_event = asyncio.Event()
 
-        # Processing queue
-        self.processing_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self.workers: list[asyncio.Task] = []
+        # Processing queue, ordered by source priority; sized from config
+        self.processing_queue = SourcePriorityQueue(
+            maxsize=self.config.get_typed("PROCESSING_QUEUE_SIZE", int, default=100),
+            priorities=parse_source_priorities(self.config.get("PROCESSING_SOURCE_PRIORITIES")),
+        )
+        self.worker_pool: Optional[WorkerPool] = None
+
+        # Host-derived limits; the worker count and memory budget follow the machine
+        self.max_workers = self.config.get_typed(
+            "PROCESSING_MAX_WORKERS", int, default=max(2, os.cpu_count() or 2)
+        )
+        self.resource_limits = ResourceLimits(
+            max_memory_mb=self.config.get_typed(
+                "RESOURCE_MAX_MEMORY_MB",
+                float,
+                default=psutil.virtual_memory().total / 1024 / 1024 * 0.75,
+            ),
+            max_cpu_percent=self.config.get_typed("RESOURCE_MAX_CPU_PERCENT", float, default=80.0),
+            max_concurrent_requests=self.max_workers,
+            max_queue_size=self.processing_queue.maxsize,
+        )
+
+        # Batch jobs submitted through POST /process/batch
+        self.jobs = JobRegistry(
+            max_jobs=self.config.get_typed("PROCESSING_MAX_JOBS", int, default=1000),
+            retention_seconds=self.config.get_typed(
+                "PROCESSING_JOB_RETENTION_SECONDS", float, default=3600.0
+            ),
+            max_results_per_job=self.config.get_typed(
+                "PROCESSING_JOB_MAX_RESULTS", int, default=10000
+            ),
+        )
+
+        # Results are written to the database in bulk by the write-behind buffer
+        self.write_buffer: Optional[WriteBehindBuffer] = None
+
+        # Replaced by the pipeline's limiter on start so workers follow its adaptive limit
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=2, adaptive=False)
 
         # Setup routes
         self._setup_routes()
@@ -89,6 +145,8 @@ class LLMProcessingService:
         self.app.router.add_get("/health/component/{component}", component_health_handler)
         self.app.router.add_get("/metrics", self.metrics_handler)
         self.app.router.add_post("/process", self.process_property)
+        self.app.router.add_post("/process/batch", self.process_batch)
+        self.app.router.add_get("/jobs/{job_id}", self.job_status)
 
     async def health_check(self, request: web.Request) -> web.Response:
         """Basic health check endpoint."""
@@ -128,11 +186,9 @@ class LLMProcessingService:
             health_data["components"]["queue"] = f"healthy: {queue_percent:.1f}% full"
 
         # Check memory usage
-        import psutil
-
         process = psutil.Process()
         memory_mb = process.memory_info().rss / 1024 / 1024
-        memory_limit_mb = 3072  # From systemd config
+        memory_limit_mb = self.resource_limits.max_memory_mb
         memory_percent = (memory_mb / memory_limit_mb) * 100
 
         if memory_percent > 80:
@@ -144,6 +200,11 @@ class LLMProcessingService:
         # Update metrics
         memory_usage.set(process.memory_info().rss)
         queue_size.set(self.processing_queue.qsize())
+        if self.worker_pool:
+            active_workers.set(self.worker_pool.size)
+            health_data["components"]["workers"] = self.worker_pool.get_stats()
+        if self.write_buffer:
+            db_buffered_results.set(self.write_buffer.get_stats()["buffered"])
 
         status_code = 200 if health_data["status"] == "healthy" else 503
         return web.json_response(health_data, status=status_code)
@@ -159,6 +220,10 @@ class LLMProcessingService:
             data = await request.json()
             source = data.get("source", "unknown")
 
+            # Job fields are only set by POST /process/batch
+            data.pop("job_id", None)
+            data.pop("job_index", None)
+
             # Add to processing queue
             await self.processing_queue.put(data)
             processing_requests.labels(source=source, status="queued").inc()
@@ -172,46 +237,134 @@ class LLMProcessingService:
             processing_requests.labels(source="unknown", status="error").inc()
             return web.json_response({"error": "Failed to process request"}, status=500)
 
-    async def _process_worker(self, worker_id: int):
-        """Worker to process items from the queue."""
-        self.logger.info(f"Worker {worker_id} started")
+    async def process_batch(self, request: web.Request) -> web.StreamResponse:
+        """Queue an NDJSON stream of properties as one batch job.
+
+        Each line is shaped like a ``POST /process`` body. The job is created
+        before the body is read: the 202 response carries its id in the
+        ``X-Job-Id`` header and a first NDJSON summary line, so clients can
+        follow ``GET /jobs/{job_id}`` while still uploading. Items are queued
+        as they are read, so a full queue slows the upload down instead of
+        the batch being buffered in memory. The response ends with a summary
+        line once the upload is read, carrying an ``error`` if it failed.
+        """
+        job = self.jobs.create()
+        try:
+            response = web.StreamResponse(
+                status=202,
+                headers={"Content-Type": "application/x-ndjson", "X-Job-Id": job.job_id},
+            )
+            await response.prepare(request)
+            await response.write(_ndjson_line({"type": "summary", **job.summary()}))
 
-        while self.running:
+            error = None
             try:
-                # Get item from queue with timeout
-                item = await asyncio.wait_for(self.processing_queue.get(), timeout=1.0)
-
-                source = item.get("source", "unknown")
-
-                # Process the item
-                with processing_duration.labels(source=source).time():
+                async for line in self._read_ndjson_lines(request.content):
                     try:
-                        result = await self.processing_integrator.process_property(
-                            item["data"], source
-                        )
-
-                        if result:
-                            processing_requests.labels(source=source, status="success").inc()
-                            # Store result in database
-                            if self.db_client:
-                                await self.db_client.properties.insert_one(result)
-                        else:
-                            processing_requests.labels(source=source, status="failed").inc()
-
-                    except Exception as e:
-                        self.logger.error(
-                            f"Worker {worker_id} processing error", error=str(e), source=source
-                        )
-                        processing_requests.labels(source=source, status="error").inc()
-
-            except asyncio.TimeoutError:
-                # No items in queue, continue
-                continue
-            except Exception as e:
-                self.logger.error(f"Worker {worker_id} error", error=str(e))
-                await asyncio.sleep(1)
+                        item = json.loads(line)
+                    except ValueError:
+                        item = None
+                    if not isinstance(item, dict):
+                        job.rejected += 1
+                        continue
+
+                    source = item.get("source", "unknown")
+                    item["job_id"] = job.job_id
+                    item["job_index"] = job.add_item()
+                    await self.processing_queue.put(item)
+                    processing_requests.labels(source=source, status="queued").inc()
 
-        self.logger.info(f"Worker {worker_id} stopped")
+            except Exception as e:
+                self.logger.error(
+                    "Failed to read processing batch", error=str(e), job_id=job.job_id
+                )
+                error = "Failed to read batch"
+
+            job.seal()
+            summary = {"type": "summary", **job.summary()}
+            if error:
+                summary["error"] = error
+            await response.write(_ndjson_line(summary))
+            await response.write_eof()
+            return response
+        finally:
+            # A dropped client or cancelled handler must not leave the job
+            # receiving forever, where it never expires and followers hang
+            job.seal()
+
+    async def job_status(self, request: web.Request) -> web.StreamResponse:
+        """Stream a batch job's progress and results as NDJSON.
+
+        The first line is the job summary and each following line is one
+        finished item. With ``?follow=true`` the stream stays open until the
+        job completes and ends with a final summary line.
+        """
+        job = self.jobs.get(request.match_info["job_id"])
+        if job is None:
+            return web.json_response({"error": "Job not found"}, status=404)
+
+        follow = request.query.get("follow", "false").lower() in ("1", "true", "yes")
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+
+        await response.write(_ndjson_line({"type": "summary", **job.summary()}))
+        async for result in job.stream_results(follow=follow):
+            await response.write(_ndjson_line({"type": "result", **result}))
+        if follow:
+            await response.write(_ndjson_line({"type": "summary", **job.summary()}))
+
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    async def _read_ndjson_lines(content: Any, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Yield non-empty lines from a request body stream.
+
+        Reads fixed-size chunks rather than ``readline`` so large lines (raw
+        listing HTML) are not rejected by the stream's line-length limit.
+        """
+        buffer = b""
+        async for chunk in content.iter_chunked(chunk_size):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+
+    async def _process_item(self, item: Dict[str, Any]) -> None:
+        """Process one queued item; run by the worker pool."""
+        source = item.get("source", "unknown")
+
+        # Process the item once the shared limiter has a free slot
+        result = None
+        error = None
+        async with self.concurrency_limiter:
+            with processing_duration.labels(source=source).time():
+                try:
+                    result = await self.processing_integrator.process_property(item["data"], source)
+
+                    if result:
+                        processing_requests.labels(source=source, status="success").inc()
+                    else:
+                        processing_requests.labels(source=source, status="failed").inc()
+
+                except Exception as e:
+                    error = str(e)
+                    self.logger.error("Processing error", error=error, source=source)
+                    processing_requests.labels(source=source, status="error").inc()
+
+        if "job_id" in item:
+            self.jobs.record(item["job_id"], item.get("job_index", 0), result, error)
+
+        # Hand the result to the write buffer outside the limiter, so
+        # waiting on a full buffer does not hold a processing slot
+        if result:
+            if self.write_buffer:
+                await self.write_buffer.add(result)
+            elif self.db_client:
+                await self.db_client.properties.insert_one(result)
 
     async def start(self):
         """Start the service."""
@@ -222,6 +375,15 @@ class LLMProcessingService:
             self.db_client = DatabaseConnection(self.config)
             await self.db_client.connect()
 
+            # Buffer results and write them as unordered bulk upserts
+            self.write_buffer = WriteBehindBuffer(
+                self._write_results,
+                max_batch_size=self.config.get_typed("DB_WRITE_BATCH_SIZE", int, default=500),
+                flush_interval=self.config.get_typed("DB_WRITE_FLUSH_SECONDS", float, default=1.0),
+                max_buffered=self.config.get_typed("DB_WRITE_BUFFER_SIZE", int, default=2000),
+            )
+            await self.write_buffer.start()
+
             # Initialize processing integrator
             self.processing_integrator = ProcessingIntegrator(self.config)
             await self.processing_integrator.__aenter__()
@@ -230,12 +392,7 @@ class LLMProcessingService:
             self.monitor = ProcessingMonitor()
 
             # Initialize resource monitor
-            resource_limits = ResourceLimits(
-                max_memory_mb=3072,  # 3GB limit
-                max_cpu_percent=80,
-                max_concurrent_requests=10,
-            )
-            self.resource_monitor = ResourceMonitor(resource_limits)
+            self.resource_monitor = ResourceMonitor(self.resource_limits)
             await self.resource_monitor.start()
 
             # Initialize health service
@@ -252,13 +409,23 @@ class LLMProcessingService:
             # Set running flag
             self.running = True
 
-            # Start worker tasks
-            num_workers = 2  # From config
-            for i in range(num_workers):
-                worker = asyncio.create_task(self._process_worker(i))
-                self.workers.append(worker)
-
-            self.logger.info(f"Started {num_workers} processing workers")
+            # Start the worker pool; it grows with queue depth while LLM latency
+            # stays on target, and the limiter still bounds in-flight LLM calls
+            self.concurrency_limiter = self.processing_integrator.pipeline.concurrency_limiter
+            llm_timeout = self.config.get_typed("LLM_TIMEOUT", float, default=30.0)
+            self.worker_pool = WorkerPool(
+                self._process_item,
+                self.processing_queue,
+                min_workers=self.config.get_typed("PROCESSING_MIN_WORKERS", int, default=2),
+                max_workers=self.max_workers,
+                scale_interval=self.config.get_typed(
+                    "PROCESSING_SCALE_INTERVAL", float, default=5.0
+                ),
+                target_latency=self.config.get_typed(
+                    "PROCESSING_TARGET_LATENCY", float, default=llm_timeout / 2
+                ),
+            )
+            await self.worker_pool.start()
 
             # Setup signal handlers
             for sig in (signal.SIGTERM, signal.SIGINT):
@@ -294,9 +461,13 @@ class LLMProcessingService:
         # Set running flag to false
         self.running = False
 
-        # Wait for workers to finish
-        if self.workers:
-            await asyncio.gather(*self.workers, return_exceptions=True)
+        # Let busy workers finish their current item
+        if self.worker_pool:
+            await self.worker_pool.stop()
+
+        # Flush buffered results before the database connection closes
+        if self.write_buffer:
+            await self.write_buffer.stop()
 
         # Stop resource monitor
         if self.resource_monitor:
@@ -311,6 +482,26 @@ class LLMProcessingService:
 
         self.logger.info("LLM Processing Service stopped")
 
+    async def _write_results(self, results: List[Dict[str, Any]]) -> None:
+        """Write a batch of processing results in one unordered bulk write.
+
+        Results with a property_id are upserted so retries and re-processing
+        replace the stored document instead of duplicating it. Other results
+        get their ``_id`` on the first attempt and are replaced by it, so a
+        retry after a partially applied bulk write does not insert them twice.
+        """
+        operations = []
+        for result in results:
+            if result.get("property_id"):
+                operations.append(
+                    UpdateOne({"property_id": result["property_id"]}, {"$set": result}, upsert=True)
+                )
+            else:
+                result.setdefault("_id", ObjectId())
+                operations.append(ReplaceOne({"_id": result["_id"]}, result, upsert=True))
+        await self.db_client.properties.bulk_write(operations, ordered=False)
+        db_bulk_writes.inc()
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         self.logger.info(f"Received signal {signum}, initiating graceful shutdown...")
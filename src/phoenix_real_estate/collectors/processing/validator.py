@@ -235,6 +235,25 @@ class ProcessingValidator:
             metadata=metadata,
         )
 
+    def get_invalid_fields(self, property_data: PropertyDetails) -> List[str]:
+        """Get names of populated fields that fail their configured field rules.
+
+        Args:
+            property_data: Property data to check
+
+        Returns:
+            List of field names whose values violate type or range rules
+        """
+        invalid_fields = []
+        field_rules = self.config["validation_rules"]["field_rules"]
+
+        for field_name, rules in field_rules.items():
+            value = getattr(property_data, field_name, None)
+            if value is not None and not self._validate_field(field_name, value, rules).is_valid:
+                invalid_fields.append(field_name)
+
+        return invalid_fields
+
     def _validate_field(
         self, field_name: str, value: Any, rules: Dict[str, Any]
     ) -> FieldValidation:
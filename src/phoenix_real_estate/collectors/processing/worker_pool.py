@@ -0,0 +1,281 @@
+"""Priority work queue and autoscaling worker pool for the processing service."""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from phoenix_real_estate.foundation.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_source_priorities(value: Any) -> Dict[str, int]:
+    """Parse per-source priorities from config.
+
+    Args:
+        value: Mapping, or a string like ``"maricopa_county:0,phoenix_mls:1"``
+
+    Returns:
+        Source name to priority (lower runs first)
+    """
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return {str(source): int(priority) for source, priority in value.items()}
+
+    priorities = {}
+    for part in str(value).split(","):
+        source, _, priority = part.partition(":")
+        if source.strip() and priority.strip():
+            priorities[source.strip()] = int(priority)
+    return priorities
+
+
+class SourcePriorityQueue(asyncio.Queue):
+    """Bounded queue that hands out items by source priority, then FIFO.
+
+    Items are dicts; their ``source`` selects a priority from ``priorities``
+    (lower runs first) unless the item carries an explicit ``priority``.
+    Being an ``asyncio.Queue``, consumers block on ``get()`` and are woken
+    as soon as an item arrives.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        priorities: Optional[Dict[str, int]] = None,
+        default_priority: int = 100,
+    ):
+        """Initialize the queue.
+
+        Args:
+            maxsize: Maximum queued items (0 for unbounded)
+            priorities: Priority per source name
+            default_priority: Priority for sources without an entry
+        """
+        self.priorities = dict(priorities or {})
+        self.default_priority = default_priority
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._depths: Counter = Counter()
+
+    def _put(self, item: Any) -> None:
+        source = item.get("source", "unknown") if isinstance(item, dict) else "unknown"
+        priority = item.get("priority") if isinstance(item, dict) else None
+        if priority is None:
+            priority = self.priorities.get(source, self.default_priority)
+        heapq.heappush(self._queue, (priority, next(self._sequence), source, item))
+        self._depths[source] += 1
+
+    def _get(self) -> Any:
+        _, _, source, item = heapq.heappop(self._queue)
+        self._depths[source] -= 1
+        if not self._depths[source]:
+            del self._depths[source]
+        return item
+
+    def depths(self) -> Dict[str, int]:
+        """Get the number of queued items per source."""
+        return dict(self._depths)
+
+
+class WorkerPool:
+    """Runs a handler over queue items with a pool that scales with demand.
+
+    Workers block on the queue instead of polling. An autoscaler checks the
+    queue depth and the handler's smoothed latency every ``scale_interval``
+    seconds:
+    - It adds workers while items are waiting, no worker is idle, and
+      latency is within ``target_latency``.
+    - It retires a worker when several sit idle on an empty queue, or when
+      latency exceeds the target (the LLM backend is saturated and more
+      parallelism would only add queueing).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        queue: asyncio.Queue,
+        min_workers: int = 1,
+        max_workers: int = 4,
+        initial_workers: Optional[int] = None,
+        scale_interval: float = 5.0,
+        target_latency: Optional[float] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            handler: Async callable processing one item
+            queue: Queue to consume
+            min_workers: Lower bound on workers
+            max_workers: Upper bound on workers
+            initial_workers: Workers started initially (default min_workers)
+            scale_interval: Seconds between autoscaling decisions
+            target_latency: Handler latency above which the pool stops growing
+        """
+        self.handler = handler
+        self.queue = queue
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.initial_workers = min(
+            self.max_workers, max(self.min_workers, initial_workers or self.min_workers)
+        )
+        self.scale_interval = scale_interval
+        self.target_latency = target_latency
+
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._idle: Set[int] = set()
+        self._worker_ids = itertools.count()
+        self._retiring = 0
+        self._stopping = False
+        self._autoscaler: Optional[asyncio.Task] = None
+
+        self._latency_ewma: Optional[float] = None
+        self._processed = 0
+        self._failed = 0
+        self._scale_ups = 0
+        self._scale_downs = 0
+
+    @property
+    def size(self) -> int:
+        """Current number of workers."""
+        return len(self._workers)
+
+    async def start(self) -> None:
+        """Start the initial workers and the autoscaler."""
+        self._stopping = False
+        for _ in range(self.initial_workers):
+            self._spawn()
+        self._autoscaler = asyncio.create_task(self._autoscale())
+        logger.info(
+            "Worker pool started",
+            extra={
+                "workers": self.size,
+                "min_workers": self.min_workers,
+                "max_workers": self.max_workers,
+            },
+        )
+
+    async def stop(self) -> None:
+        """Stop all workers, letting busy ones finish their current item."""
+        self._stopping = True
+        if self._autoscaler:
+            self._autoscaler.cancel()
+            await asyncio.gather(self._autoscaler, return_exceptions=True)
+            self._autoscaler = None
+
+        for worker_id in list(self._idle):
+            self._workers[worker_id].cancel()
+
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        logger.info("Worker pool stopped", extra=self.get_stats())
+
+    def _spawn(self) -> None:
+        """Start one worker."""
+        worker_id = next(self._worker_ids)
+        self._workers[worker_id] = asyncio.create_task(self._worker(worker_id))
+
+    async def _worker(self, worker_id: int) -> None:
+        """Process queue items until retired or stopped."""
+        try:
+            while not self._stopping:
+                self._idle.add(worker_id)
+                item = await self.queue.get()
+                self._idle.discard(worker_id)
+
+                start_time = time.monotonic()
+                try:
+                    await self.handler(item)
+                    self._processed += 1
+                except Exception as e:
+                    self._failed += 1
+                    logger.error(f"Worker {worker_id} handler error: {e}")
+                finally:
+                    self.queue.task_done()
+                    self._record_latency(time.monotonic() - start_time)
+
+                if self._retiring:
+                    self._retiring -= 1
+                    break
+        except asyncio.CancelledError:
+            # Only idle workers are cancelled; no item is lost
+            pass
+        finally:
+            self._idle.discard(worker_id)
+            self._workers.pop(worker_id, None)
+
+    def _record_latency(self, latency: float) -> None:
+        """Update the smoothed handler latency."""
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+    async def _autoscale(self) -> None:
+        """Periodically resize the pool."""
+        while True:
+            await asyncio.sleep(self.scale_interval)
+            self.rebalance()
+
+    def rebalance(self) -> int:
+        """Make one scaling decision.
+
+        Returns:
+            Change in worker count (positive when workers were added)
+        """
+        depth = self.queue.qsize()
+        workers = self.size - self._retiring
+        idle = len(self._idle)
+        latency_ok = (
+            self.target_latency is None
+            or self._latency_ewma is None
+            or self._latency_ewma <= self.target_latency
+        )
+
+        if depth > 0 and idle == 0 and latency_ok and workers < self.max_workers:
+            added = min(self.max_workers - workers, math.ceil(depth / max(workers, 1)))
+            for _ in range(added):
+                self._spawn()
+            self._scale_ups += 1
+            logger.info(f"Scaled worker pool up by {added} to {self.size} (queue depth {depth})")
+            return added
+
+        if workers > self.min_workers and ((depth == 0 and idle > 1) or not latency_ok):
+            self._retire_one()
+            self._scale_downs += 1
+            logger.info(f"Scaled worker pool down to {workers - 1} (queue depth {depth})")
+            return -1
+
+        return 0
+
+    def _retire_one(self) -> None:
+        """Stop an idle worker now, or the next worker to finish an item."""
+        if self._idle:
+            self._workers[self._idle.pop()].cancel()
+        else:
+            self._retiring += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size, throughput and scaling statistics."""
+        stats = {
+            "workers": self.size,
+            "idle_workers": len(self._idle),
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue.qsize(),
+            "processed": self._processed,
+            "failed": self._failed,
+            "latency_ewma_seconds": self._latency_ewma,
+            "scale_ups": self._scale_ups,
+            "scale_downs": self._scale_downs,
+        }
+        if isinstance(self.queue, SourcePriorityQueue):
+            stats["queue_depth_by_source"] = self.queue.depths()
+        return stats
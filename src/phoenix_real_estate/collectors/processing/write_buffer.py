@@ -0,0 +1,158 @@
+"""Write-behind buffering of processing results for bulk database writes."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from phoenix_real_estate.foundation.logging import get_logger
+from phoenix_real_estate.foundation.utils.helpers import retry_async
+
+logger = get_logger(__name__)
+
+
+class WriteBehindBuffer:
+    """Collects documents from many producers and writes them in bulk.
+
+    Producers ``add`` documents to a bounded buffer; a single flusher task
+    hands them to ``flush_func`` in batches of up to ``max_batch_size``, or
+    after ``flush_interval`` seconds for partial batches. When the buffer is
+    full, ``add`` waits, pushing backpressure onto the producers. ``stop``
+    flushes everything still buffered.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[List[Dict[str, Any]]], Awaitable[Any]],
+        max_batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffered: int = 2000,
+        max_retries: int = 2,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            flush_func: Async callable that writes one batch of documents
+            max_batch_size: Documents per bulk write
+            flush_interval: Maximum seconds a document waits before being flushed
+            max_buffered: Documents buffered before producers are blocked
+            max_retries: Retries for a failed bulk write before it is dropped
+        """
+        self.flush_func = flush_func
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffered = max(self.max_batch_size, max_buffered)
+        self.max_retries = max_retries
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_buffered)
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self._flushes = 0
+        self._documents_written = 0
+        self._documents_failed = 0
+        self._flush_time = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the flusher task is running."""
+        return self._flusher is not None and not self._flusher.done()
+
+    async def start(self) -> None:
+        """Start the background flusher."""
+        if self.running:
+            return
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._run())
+        logger.info(
+            "Write-behind buffer started",
+            extra={"max_batch_size": self.max_batch_size, "flush_interval": self.flush_interval},
+        )
+
+    async def add(self, document: Dict[str, Any]) -> None:
+        """Buffer a document, waiting while the buffer is full.
+
+        Args:
+            document: Document to write
+
+        Raises:
+            RuntimeError: If the buffer is not running
+        """
+        if not self.running or self._stopping:
+            raise RuntimeError("Write-behind buffer is not running")
+        await self._queue.put(document)
+
+    async def stop(self) -> None:
+        """Flush all buffered documents and stop the flusher."""
+        if self._flusher is None:
+            return
+        self._stopping = True
+        await self._flusher
+        self._flusher = None
+        logger.info("Write-behind buffer stopped", extra=self.get_stats())
+
+    async def _run(self) -> None:
+        """Collect batches and flush them until stopped and drained."""
+        loop = asyncio.get_running_loop()
+
+        while not (self._stopping and self._queue.empty()):
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                continue
+
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                # Drain what is already buffered before waiting
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+
+                remaining = deadline - loop.time()
+                if remaining <= 0 or self._stopping:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write one batch, retrying failures."""
+        start_time = time.time()
+        try:
+            await retry_async(
+                self.flush_func,
+                batch,
+                max_retries=self.max_retries,
+                delay=0.5,
+                backoff_factor=2.0,
+            )
+            self._documents_written += len(batch)
+        except Exception as e:
+            self._documents_failed += len(batch)
+            logger.error(
+                "Bulk write failed, dropping batch",
+                extra={"documents": len(batch), "error": str(e)},
+            )
+        finally:
+            self._flushes += 1
+            self._flush_time += time.time() - start_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer and flush statistics."""
+        return {
+            "buffered": self._queue.qsize(),
+            "flushes": self._flushes,
+            "documents_written": self._documents_written,
+            "documents_failed": self._documents_failed,
+            "average_batch_size": (
+                (self._documents_written + self._documents_failed) / self._flushes
+                if self._flushes
+                else 0.0
+            ),
+            "average_flush_seconds": self._flush_time / self._flushes if self._flushes else 0.0,
+        }
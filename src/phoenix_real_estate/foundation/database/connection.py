@@ -6,7 +6,7 @@ connection pooling optimized for Atlas free tier, and comprehensive error handli
 
 import asyncio
 import threading
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Tuple
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -19,6 +19,25 @@ from phoenix_real_estate.foundation.logging.factory import get_logger
 # Module logger
 logger = get_logger(__name__)
 
+# Indexes created on connect: the minimal compound set serving every repository
+# query, as proposed by index_advisor.propose_indexes
+COLLECTION_INDEXES: Dict[str, List[Tuple[List[Tuple[str, int]], Dict[str, Any]]]] = {
+    "properties": [
+        ([("property_id", 1)], {"unique": True}),
+        # Zipcode searches by update time, with keyset pagination
+        (
+            [("address.zipcode", 1), ("is_active", 1), ("last_updated", 1), ("property_id", 1)],
+            {},
+        ),
+        # Zipcode searches by price and price statistics
+        ([("address.zipcode", 1), ("is_active", 1), ("current_price", 1)], {}),
+        # Recent updates, with keyset pagination
+        ([("is_active", 1), ("last_updated", 1), ("property_id", 1)], {}),
+    ],
+    "daily_reports": [([("date", 1)], {"unique": True})],
+    "zip_market_stats": [([("zipcode", 1)], {"unique": True})],
+}
+
 
 class DatabaseConnection:
     """MongoDB connection manager with automatic recovery and connection pooling.
@@ -297,8 +316,9 @@ class DatabaseConnection:
     async def _create_indexes(self) -> None:
         """Create required indexes for optimal query performance.
 
-        This method creates all necessary indexes for the properties and
-        daily_reports collections to ensure optimal query performance.
+        This method creates the indexes in COLLECTION_INDEXES. Indexes that
+        existing deployments created earlier are left in place; the index
+        advisor reports which of them can be dropped.
         """
         if self._database is None:
             raise DatabaseError("Database not available for index creation")
@@ -306,32 +326,10 @@ class DatabaseConnection:
         logger.info("Creating database indexes")
 
         try:
-            # Properties collection indexes
-            properties_collection = self._database["properties"]
-
-            # Single field indexes
-            await properties_collection.create_index("property_id", unique=True)
-            await properties_collection.create_index("address.zipcode")
-            await properties_collection.create_index("address.street")
-            await properties_collection.create_index("listing.status")
-            await properties_collection.create_index("listing.mls_id")
-            await properties_collection.create_index("current_price")
-            await properties_collection.create_index("last_updated")
-            await properties_collection.create_index("is_active")
-            await properties_collection.create_index("sources.source")
-
-            # Compound indexes for common query patterns
-            await properties_collection.create_index(
-                [("address.zipcode", 1), ("listing.status", 1)]
-            )
-            await properties_collection.create_index(
-                [("address.zipcode", 1), ("current_price", -1)]
-            )
-            await properties_collection.create_index([("is_active", 1), ("last_updated", -1)])
-
-            # Daily reports collection indexes
-            daily_reports_collection = self._database["daily_reports"]
-            await daily_reports_collection.create_index("date", unique=True)
+            for collection_name, indexes in COLLECTION_INDEXES.items():
+                collection = self._database[collection_name]
+                for keys, options in indexes:
+                    await collection.create_index(keys, **options)
 
             self._indexes_created = True
             logger.info("Database indexes created successfully")
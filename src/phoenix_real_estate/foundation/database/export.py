@@ -0,0 +1,337 @@
+"""Incremental writers for property exports.
+
+Each writer consumes an async iterator of documents, such as
+``PropertyRepository.export``, and writes it in fixed-size batches, so memory
+stays bounded by the batch size rather than the collection size. Blocking
+file I/O runs in a worker thread, and output goes to a temporary file that is
+moved into place once complete.
+"""
+
+import asyncio
+import csv
+import gzip
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Union
+
+from bson import json_util
+
+from phoenix_real_estate.foundation.logging.factory import get_logger
+from phoenix_real_estate.foundation.utils.exceptions import ConfigurationError
+
+# Module logger
+logger = get_logger(__name__)
+
+PathLike = Union[str, Path]
+
+
+async def _batches(
+    documents: AsyncIterator[Dict[str, Any]], batch_size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Group documents into lists of at most batch_size."""
+    batch: List[Dict[str, Any]] = []
+    async for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def flatten_document(document: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested documents into dotted columns for tabular formats.
+
+    Lists are kept as JSON text, since their length varies per document.
+
+    Args:
+        document: Document to flatten
+        prefix: Column prefix of the enclosing document
+
+    Returns:
+        Mapping of dotted column names to scalar values
+    """
+    row: Dict[str, Any] = {}
+    for key, value in document.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            row.update(flatten_document(value, f"{column}."))
+        elif isinstance(value, (list, tuple)):
+            row[column] = json_util.dumps(value)
+        else:
+            row[column] = value
+    return row
+
+
+async def _write_incrementally(
+    documents: AsyncIterator[Dict[str, Any]],
+    path: PathLike,
+    open_output: Callable[[Path], Any],
+    write_batch: Callable[[Any, List[Dict[str, Any]]], None],
+    batch_size: int,
+) -> int:
+    """Stream batches into a temporary file, then move it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+
+    count = 0
+    output = await asyncio.to_thread(open_output, temp_path)
+    try:
+        async for batch in _batches(documents, max(1, batch_size)):
+            await asyncio.to_thread(write_batch, output, batch)
+            count += len(batch)
+    except BaseException:
+        await asyncio.to_thread(output.close)
+        temp_path.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(output.close)
+
+    os.replace(temp_path, path)
+    logger.info("Exported %d documents to %s", count, path)
+    return count
+
+
+async def write_ndjson_gz(
+    documents: AsyncIterator[Dict[str, Any]], path: PathLike, batch_size: int = 1000
+) -> int:
+    """Write documents as gzip-compressed newline-delimited JSON.
+
+    Values use MongoDB extended JSON, so dates and ObjectIds round-trip.
+
+    Args:
+        documents: Documents to write
+        path: Output file path
+        batch_size: Documents written per batch
+
+    Returns:
+        Number of documents written
+    """
+
+    def write_batch(output: Any, batch: List[Dict[str, Any]]) -> None:
+        output.writelines(json_util.dumps(document) + "\n" for document in batch)
+
+    return await _write_incrementally(
+        documents,
+        path,
+        lambda temp_path: gzip.open(temp_path, "wt", encoding="utf-8"),
+        write_batch,
+        batch_size,
+    )
+
+
+class _CsvOutput:
+    """CSV file whose header is fixed by the columns given or the first batch."""
+
+    def __init__(self, path: Path, columns: Optional[Sequence[str]]) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._columns = list(columns) if columns else None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, batch: List[Dict[str, Any]]) -> None:
+        rows = [flatten_document(document) for document in batch]
+        if self._writer is None:
+            columns = self._columns or list(dict.fromkeys(key for row in rows for key in row))
+            self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+            self._writer.writeheader()
+        for row in rows:
+            self._writer.writerow(
+                {
+                    key: value.isoformat() if isinstance(value, datetime) else value
+                    for key, value in row.items()
+                }
+            )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def write_csv(
+    documents: AsyncIterator[Dict[str, Any]],
+    path: PathLike,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Write documents as CSV with nested fields flattened to dotted columns.
+
+    Without explicit columns, the header is the columns seen in the first
+    batch; columns first appearing later are dropped.
+
+    Args:
+        documents: Documents to write
+        path: Output file path
+        columns: Dotted column names to write
+        batch_size: Documents written per batch
+
+    Returns:
+        Number of documents written
+    """
+    return await _write_incrementally(
+        documents,
+        path,
+        lambda temp_path: _CsvOutput(temp_path, columns),
+        lambda output, batch: output.write(batch),
+        batch_size,
+    )
+
+
+class _ParquetOutput:
+    """Parquet file written one row group per batch.
+
+    Rows are held back until every column seen so far has a non-null value
+    (or ``max_buffered_rows`` is reached), so sparse columns get their type
+    from the first batch that actually carries them.
+    """
+
+    def __init__(
+        self, path: Path, columns: Optional[Sequence[str]], max_buffered_rows: int = 50_000
+    ) -> None:
+        self._path = path
+        self._columns = list(columns) if columns else None
+        self._max_buffered_rows = max_buffered_rows
+        self._schema = None
+        self._writer = None
+        self._pending: List[List[Dict[str, Any]]] = []
+        self._pending_rows = 0
+        self._seen: Dict[str, bool] = {}
+        self._text_columns: set = set()
+        self._dropped: set = set()
+
+    def write(self, batch: List[Dict[str, Any]]) -> None:
+        rows = [flatten_document(document) for document in batch]
+        if self._writer is None:
+            self._pending.append(rows)
+            self._pending_rows += len(rows)
+            for row in rows:
+                for name, value in row.items():
+                    if not self._seen.get(name):
+                        self._seen[name] = value is not None
+            if not self._schema_is_settled():
+                return
+            self._open_writer()
+        else:
+            self._write_rows(rows)
+
+    def _schema_is_settled(self) -> bool:
+        """Whether the buffered rows give every wanted column a type."""
+        if self._pending_rows >= self._max_buffered_rows:
+            return True
+        names = self._columns or self._seen
+        return all(self._seen.get(name) for name in names)
+
+    def _open_writer(self) -> None:
+        import pyarrow.parquet as pq
+
+        rows = [row for rows in self._pending for row in rows]
+        self._schema = self._infer_schema(rows)
+        self._writer = pq.ParquetWriter(str(self._path), self._schema)
+        for rows in self._pending:
+            self._write_rows(rows)
+        self._pending = []
+        self._pending_rows = 0
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        import pyarrow as pa
+
+        if not self._columns:
+            new_columns = {name for row in rows for name in row} - set(self._schema.names)
+            if new_columns - self._dropped:
+                logger.warning(
+                    "Parquet export dropping columns first seen after the schema was fixed: %s",
+                    ", ".join(sorted(new_columns - self._dropped)),
+                )
+                self._dropped |= new_columns
+
+        table = pa.Table.from_pylist(
+            [{name: self._value(row, name) for name in self._schema.names} for row in rows],
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+
+    def _value(self, row: Dict[str, Any], name: str) -> Any:
+        value = row.get(name)
+        if value is not None and name in self._text_columns and not isinstance(value, str):
+            # Never had a value while the schema was inferred; keep it as text
+            return value.isoformat() if isinstance(value, datetime) else str(value)
+        return value
+
+    def _infer_schema(self, rows: List[Dict[str, Any]]) -> Any:
+        """Infer column types from the buffered rows, widened to survive later ones."""
+        import pyarrow as pa
+
+        names = self._columns or list(self._seen)
+        fields = []
+        for name in names:
+            data_type = pa.array([row.get(name) for row in rows]).type
+            if pa.types.is_integer(data_type):
+                # Prices and areas are ints in some documents and floats in others
+                data_type = pa.float64()
+            elif pa.types.is_null(data_type):
+                data_type = pa.string()
+                self._text_columns.add(name)
+            fields.append(pa.field(name, data_type))
+        return pa.schema(fields)
+
+    def close(self) -> None:
+        if self._writer is None and self._pending:
+            self._open_writer()
+        if self._writer is not None:
+            self._writer.close()
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # Nothing was exported; still leave a readable file
+            pq.write_table(pa.table({}), str(self._path))
+
+
+async def write_parquet(
+    documents: AsyncIterator[Dict[str, Any]],
+    path: PathLike,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """Write documents as Parquet, one row group per batch.
+
+    Nested fields are flattened to dotted columns. Rows are buffered until
+    every column has a non-null value, so column types come from the first
+    values seen, with integers widened to doubles. Columns still empty when
+    the schema is fixed are written as text, and columns first appearing
+    after that are dropped with a warning.
+
+    Args:
+        documents: Documents to write
+        path: Output file path
+        columns: Dotted column names to write
+        batch_size: Documents per row group
+
+    Returns:
+        Number of documents written
+
+    Raises:
+        ConfigurationError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ConfigurationError("pyarrow package is required for Parquet export") from e
+
+    return await _write_incrementally(
+        documents,
+        path,
+        lambda temp_path: _ParquetOutput(temp_path, columns),
+        lambda output, batch: output.write(batch),
+        batch_size,
+    )
+
+
+# Writers by export format name
+EXPORT_WRITERS = {
+    "ndjson": write_ndjson_gz,
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
+
+# File suffix of each export format
+EXPORT_SUFFIXES = {"ndjson": ".ndjson.gz", "csv": ".csv", "parquet": ".parquet"}
@@ -0,0 +1,545 @@
+"""Query-plan and index advisor for the repository collections.
+
+The advisor explains every query shape the repositories issue, flags the
+ones that scan whole collections, reports indexes that ``$indexStats`` shows
+unused or that a longer index makes redundant, and proposes the smallest
+set of compound indexes that serves all query shapes.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pymongo.errors import OperationFailure
+
+from phoenix_real_estate.foundation.database.connection import (
+    COLLECTION_INDEXES,
+    DatabaseConnection,
+)
+from phoenix_real_estate.foundation.database.repositories import (
+    PropertyRepository,
+    keyset_filter,
+)
+from phoenix_real_estate.foundation.logging.factory import get_logger
+from phoenix_real_estate.foundation.utils.exceptions import DatabaseError
+
+# Module logger
+logger = get_logger(__name__)
+
+IndexKey = Tuple[Tuple[str, int], ...]
+
+# Indexes that enforce uniqueness and must be kept whatever the queries need
+UNIQUE_INDEXES: Dict[str, List[IndexKey]] = {
+    collection: [tuple(keys) for keys, options in indexes if options.get("unique")]
+    for collection, indexes in COLLECTION_INDEXES.items()
+}
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """One query a repository issues, with representative values.
+
+    Attributes:
+        name: Repository method issuing the query
+        collection: Collection queried
+        filter: Query filter (the first ``$match`` for aggregations)
+        sort: Sort keys in order
+        pipeline: Aggregation pipeline, if the query is an aggregation
+        count: Whether the query is a count
+        full_scan: Whether reading the whole collection is intended
+    """
+
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Tuple[Tuple[str, int], ...] = ()
+    pipeline: Optional[List[Dict[str, Any]]] = None
+    count: bool = False
+    full_scan: bool = False
+
+
+@dataclass
+class QueryPlan:
+    """Winning plan summary of one explained query shape."""
+
+    shape: QueryShape
+    stages: List[str] = field(default_factory=list)
+    indexes_used: List[str] = field(default_factory=list)
+
+    @property
+    def collscan(self) -> bool:
+        """Whether the plan scans the whole collection."""
+        return "COLLSCAN" in self.stages
+
+    @property
+    def blocking_sort(self) -> bool:
+        """Whether the plan sorts in memory instead of reading an index in order."""
+        return "SORT" in self.stages
+
+
+def repository_query_shapes(
+    zipcode: str = "85001", since: Optional[datetime] = None
+) -> List[QueryShape]:
+    """List the query shapes PropertyRepository and DailyReportRepository issue.
+
+    Args:
+        zipcode: Zipcode used in representative filters
+        since: Timestamp used in representative filters (default: a day ago)
+
+    Returns:
+        Query shapes of every repository read and write filter
+    """
+    since = since or datetime.now(timezone.utc) - timedelta(days=1)
+    by_zipcode = {"address.zipcode": zipcode, "is_active": True}
+    recent = {"last_updated": {"$gt": since}, "is_active": True}
+    newest_first = (("last_updated", -1), ("property_id", -1))
+    price_pipeline = PropertyRepository._price_statistics_pipeline([zipcode], [10, 25, 50, 75, 90])
+    market_pipeline = PropertyRepository._market_stats_pipeline(None)
+
+    return [
+        QueryShape(
+            "PropertyRepository.get_by_property_id", "properties", {"property_id": "sample"}
+        ),
+        QueryShape(
+            "PropertyRepository.bulk_upsert",
+            "properties",
+            {"property_id": {"$in": ["sample-1", "sample-2"]}},
+        ),
+        QueryShape(
+            "PropertyRepository.search_by_zipcode",
+            "properties",
+            by_zipcode,
+            sort=(("last_updated", -1),),
+        ),
+        QueryShape(
+            "PropertyRepository.search_by_zipcode (by price)",
+            "properties",
+            by_zipcode,
+            sort=(("current_price", -1),),
+        ),
+        QueryShape(
+            "PropertyRepository.search_by_zipcode (count)", "properties", by_zipcode, count=True
+        ),
+        QueryShape(
+            "PropertyRepository.search_by_zipcode_page",
+            "properties",
+            {
+                "$and": [
+                    by_zipcode,
+                    keyset_filter("last_updated", -1, since, "sample"),
+                ]
+            },
+            sort=newest_first,
+        ),
+        QueryShape(
+            "PropertyRepository.get_recent_updates",
+            "properties",
+            recent,
+            sort=(("last_updated", -1),),
+        ),
+        QueryShape(
+            "PropertyRepository.get_recent_updates_page",
+            "properties",
+            {"$and": [recent, keyset_filter("last_updated", -1, since, "sample")]},
+            sort=newest_first,
+        ),
+        QueryShape(
+            "PropertyRepository.get_price_statistics",
+            "properties",
+            price_pipeline[0]["$match"],
+            sort=(("current_price", 1),),
+            pipeline=price_pipeline,
+        ),
+        QueryShape(
+            "PropertyRepository.refresh_zip_market_stats",
+            "properties",
+            market_pipeline[0]["$match"],
+            pipeline=market_pipeline,
+            full_scan=True,
+        ),
+        QueryShape("PropertyRepository.export", "properties", {}, full_scan=True),
+        QueryShape(
+            "ZipMarketStatsRepository.get_summaries",
+            "zip_market_stats",
+            {"zipcode": {"$in": [zipcode]}},
+        ),
+        QueryShape(
+            "DailyReportRepository.create_report",
+            "daily_reports",
+            {"date": since.strftime("%Y-%m-%d")},
+        ),
+        QueryShape(
+            "DailyReportRepository.get_recent_reports",
+            "daily_reports",
+            {"created_at": {"$gte": since}},
+            sort=(("date", -1),),
+            # One document per day; an index would cost more than it saves
+            full_scan=True,
+        ),
+    ]
+
+
+def _filter_fields(query: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Split a filter's fields into equality and range fields, in filter order."""
+    equality: List[str] = []
+    ranges: List[str] = []
+    for key, value in query.items():
+        if key == "$and":
+            for clause in value:
+                clause_equality, clause_ranges = _filter_fields(clause)
+                equality.extend(clause_equality)
+                ranges.extend(clause_ranges)
+        elif key.startswith("$"):
+            # $or keyset continuations and $expr add no new leading fields
+            continue
+        elif isinstance(value, dict) and any(op.startswith("$") for op in value):
+            (equality if set(value) <= {"$eq", "$in"} else ranges).append(key)
+        else:
+            equality.append(key)
+    return equality, ranges
+
+
+def esr_index(shape: QueryShape) -> IndexKey:
+    """Build the Equality-Sort-Range compound index for a query shape.
+
+    Args:
+        shape: Query shape to serve
+
+    Returns:
+        Index key pattern as (field, direction) pairs
+    """
+    equality, ranges = _filter_fields(shape.filter)
+    keys: List[Tuple[str, int]] = []
+    for name in dict.fromkeys(equality):
+        keys.append((name, 1))
+    # After equality fields an index serves a sort read either way, so sorts
+    # are normalized to start ascending and their mirror images coincide
+    flip = -1 if shape.sort and shape.sort[0][1] < 0 else 1
+    for name, direction in shape.sort:
+        if name not in {key for key, _ in keys}:
+            keys.append((name, direction * flip))
+    for name in dict.fromkeys(ranges):
+        if name not in {key for key, _ in keys}:
+            keys.append((name, 1))
+    return tuple(keys)
+
+
+def _is_prefix(prefix: IndexKey, key: IndexKey) -> bool:
+    """Whether an index is a prefix of another, read forwards or backwards."""
+    if len(prefix) > len(key):
+        return False
+    head = key[: len(prefix)]
+    # Text, hashed and geo keys have string directions and cannot be inverted
+    inverted = tuple(
+        (name, -direction if isinstance(direction, (int, float)) else direction)
+        for name, direction in prefix
+    )
+    return head == prefix or head == inverted
+
+
+def minimal_index_set(keys: Sequence[IndexKey], unique: Sequence[IndexKey] = ()) -> List[IndexKey]:
+    """Drop index keys that another key serves through its prefix.
+
+    Args:
+        keys: Candidate index keys
+        unique: Unique index keys, which are always kept
+
+    Returns:
+        Candidates not covered by a longer candidate, unique keys first
+    """
+    candidates = list(dict.fromkeys([*unique, *keys]))
+    minimal = []
+    for position, key in enumerate(candidates):
+        if key in unique:
+            minimal.append(key)
+            continue
+        covered = any(
+            _is_prefix(key, other)
+            # An index read backwards serves the same queries; keep the first
+            and (len(other) > len(key) or earlier < position)
+            for earlier, other in enumerate(candidates)
+            if other != key and other not in unique
+        )
+        if not covered:
+            minimal.append(key)
+    return minimal
+
+
+def propose_indexes(shapes: Sequence[QueryShape]) -> Dict[str, List[IndexKey]]:
+    """Propose the minimal compound index set serving the query shapes.
+
+    Args:
+        shapes: Query shapes to serve; full scans are ignored
+
+    Returns:
+        Proposed index keys by collection
+    """
+    by_collection: Dict[str, List[IndexKey]] = {}
+    for shape in shapes:
+        keys = by_collection.setdefault(shape.collection, [])
+        if not shape.full_scan:
+            keys.append(esr_index(shape))
+    return {
+        collection: minimal_index_set(keys, UNIQUE_INDEXES.get(collection, ()))
+        for collection, keys in by_collection.items()
+    }
+
+
+def redundant_indexes(indexes: Dict[str, IndexKey], unique: Sequence[str] = ()) -> Dict[str, str]:
+    """Find indexes whose key is a prefix of another existing index.
+
+    Args:
+        indexes: Index keys by index name
+        unique: Names of unique indexes, which are never redundant
+
+    Returns:
+        Redundant index names mapped to the index that makes them redundant
+    """
+    redundant = {}
+    for name, key in indexes.items():
+        if name == "_id_" or name in unique:
+            continue
+        for other, other_key in indexes.items():
+            if other != name and len(other_key) > len(key) and _is_prefix(key, other_key):
+                redundant[name] = other
+                break
+    return redundant
+
+
+def _plan_stages(explain: Any, stages: List[str], indexes: List[str]) -> None:
+    """Collect stage names and index names from every winning plan in an explain."""
+    if isinstance(explain, dict):
+        for key, value in explain.items():
+            if key == "rejectedPlans":
+                continue
+            if key == "stage" and isinstance(value, str):
+                stages.append(value)
+            elif key == "indexName" and isinstance(value, str):
+                indexes.append(value)
+            else:
+                _plan_stages(value, stages, indexes)
+    elif isinstance(explain, list):
+        for item in explain:
+            _plan_stages(item, stages, indexes)
+
+
+class IndexAdvisor:
+    """Explain repository queries and review the indexes behind them.
+
+    Examples:
+        >>> advisor = IndexAdvisor(db_connection)
+        >>> report = await advisor.analyze()
+        >>> print(format_report(report))
+    """
+
+    def __init__(
+        self, db_connection: DatabaseConnection, shapes: Optional[Sequence[QueryShape]] = None
+    ) -> None:
+        """Initialize the advisor.
+
+        Args:
+            db_connection: Database connection instance
+            shapes: Query shapes to analyze (default: repository_query_shapes())
+        """
+        self._db_connection = db_connection
+        self.shapes = list(shapes) if shapes is not None else repository_query_shapes()
+
+    async def analyze(self) -> Dict[str, Any]:
+        """Explain every query shape and review each collection's indexes.
+
+        Returns:
+            Report with query plans, index usage, redundant indexes, the
+            proposed index set, and the proposed indexes that are missing or
+            existing indexes outside it
+
+        Raises:
+            DatabaseError: If explaining or listing indexes fails
+        """
+        proposed = propose_indexes(self.shapes)
+
+        try:
+            async with self._db_connection.get_database() as db:
+                plans = [await self._explain(db, shape) for shape in self.shapes]
+                collections = {
+                    collection: await self._review_indexes(db[collection])
+                    for collection in proposed
+                }
+        except Exception as e:
+            logger.error("Index analysis failed: %s", str(e))
+            raise DatabaseError(
+                "Index analysis failed", context={"error": str(e)}, original_error=e
+            ) from e
+
+        for collection, review in collections.items():
+            existing = [tuple(map(tuple, index["key"])) for index in review["indexes"]]
+            names = [index["name"] for index in review["indexes"]]
+            review["proposed"] = [list(key) for key in proposed[collection]]
+            review["missing"] = [
+                list(key)
+                for key in proposed[collection]
+                if not any(_is_prefix(key, index) for index in existing)
+            ]
+            review["not_proposed"] = [
+                name
+                for name, index in zip(names, existing)
+                if name != "_id_"
+                and not any(
+                    len(key) == len(index) and _is_prefix(index, key)
+                    for key in proposed[collection]
+                )
+            ]
+
+        return {
+            "queries": [
+                {
+                    "name": plan.shape.name,
+                    "collection": plan.shape.collection,
+                    "stages": plan.stages,
+                    "indexes_used": plan.indexes_used,
+                    "collscan": plan.collscan,
+                    "blocking_sort": plan.blocking_sort,
+                    "full_scan_expected": plan.shape.full_scan,
+                }
+                for plan in plans
+            ],
+            "collections": collections,
+        }
+
+    async def create_missing(self, report: Dict[str, Any]) -> List[str]:
+        """Create the proposed indexes a report found missing.
+
+        Indexes outside the proposed set are left for an operator to drop.
+
+        Args:
+            report: Report from analyze()
+
+        Returns:
+            Names of the created indexes
+
+        Raises:
+            DatabaseError: If index creation fails
+        """
+        created = []
+        try:
+            async with self._db_connection.get_database() as db:
+                for collection, review in report["collections"].items():
+                    for key in review["missing"]:
+                        created.append(
+                            await db[collection].create_index([tuple(pair) for pair in key])
+                        )
+        except Exception as e:
+            logger.error("Failed to create proposed indexes: %s", str(e))
+            raise DatabaseError(
+                "Failed to create proposed indexes",
+                context={"created": created, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        logger.info("Created %d proposed indexes", len(created))
+        return created
+
+    @staticmethod
+    async def _explain(db: Any, shape: QueryShape) -> QueryPlan:
+        """Explain one query shape with the query planner."""
+        if shape.pipeline is not None:
+            command = {"aggregate": shape.collection, "pipeline": shape.pipeline, "cursor": {}}
+        elif shape.count:
+            command = {"count": shape.collection, "query": shape.filter}
+        else:
+            command = {"find": shape.collection, "filter": shape.filter, "limit": 20}
+            if shape.sort:
+                command["sort"] = dict(shape.sort)
+
+        explain = await db.command("explain", command, verbosity="queryPlanner")
+        plan = QueryPlan(shape)
+        _plan_stages(explain, plan.stages, plan.indexes_used)
+        return plan
+
+    @staticmethod
+    async def _review_indexes(collection: Any) -> Dict[str, Any]:
+        """List a collection's indexes with their usage counts and redundancy."""
+        specs = {}
+        async for spec in collection.list_indexes():
+            specs[spec["name"]] = spec
+
+        try:
+            usage: Optional[Dict[str, int]] = {
+                stats["name"]: stats["accesses"]["ops"]
+                async for stats in collection.aggregate([{"$indexStats": {}}])
+            }
+        except OperationFailure as e:
+            # Shared Atlas tiers may not allow $indexStats
+            logger.warning("Index usage unavailable for %s: %s", collection.name, str(e))
+            usage = None
+
+        keys = {name: tuple(spec["key"].items()) for name, spec in specs.items()}
+        unique = [name for name, spec in specs.items() if spec.get("unique")]
+        redundant = redundant_indexes(keys, unique)
+
+        return {
+            "indexes": [
+                {
+                    "name": name,
+                    "key": [list(pair) for pair in key],
+                    "unique": name in unique,
+                    "ops": usage.get(name) if usage is not None else None,
+                    "unused": usage is not None and name != "_id_" and not usage.get(name),
+                    "redundant_with": redundant.get(name),
+                }
+                for name, key in keys.items()
+            ],
+            "usage_available": usage is not None,
+        }
+
+
+def _format_key(key: Sequence[Sequence[Any]]) -> str:
+    """Format an index key like the mongo shell does."""
+    return "{" + ", ".join(f"{name}: {direction}" for name, direction in key) + "}"
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render an analyze() report as plain text.
+
+    Args:
+        report: Report from IndexAdvisor.analyze()
+
+    Returns:
+        Multi-line report
+    """
+    lines = ["Query plans:"]
+    for query in report["queries"]:
+        if query["collscan"] and not query["full_scan_expected"]:
+            status = "[COLLSCAN]"
+        elif query["blocking_sort"]:
+            status = "[SORT]"
+        else:
+            status = "[OK]"
+        used = ", ".join(query["indexes_used"]) or "no index"
+        lines.append(f"  {status:<10} {query['name']} -> {used}")
+
+    for collection, review in report["collections"].items():
+        lines.append(f"\nIndexes on {collection}:")
+        for index in review["indexes"]:
+            notes = []
+            if index["unique"]:
+                notes.append("unique")
+            if index["ops"] is not None:
+                notes.append(f"{index['ops']} ops")
+            if index["unused"]:
+                notes.append("UNUSED")
+            if index["redundant_with"]:
+                notes.append(f"REDUNDANT with {index['redundant_with']}")
+            lines.append(f"  {index['name']}: {_format_key(index['key'])} ({', '.join(notes)})")
+        if not review["usage_available"]:
+            lines.append("  Usage counts unavailable ($indexStats not permitted)")
+
+        lines.append("  Proposed minimal set:")
+        lines.extend(f"    {_format_key(key)}" for key in review["proposed"])
+        if review["missing"]:
+            lines.append("  Missing:")
+            lines.extend(f"    {_format_key(key)}" for key in review["missing"])
+        if review["not_proposed"]:
+            lines.append("  Outside the proposed set (candidates to drop):")
+            lines.extend(f"    {name}" for name in review["not_proposed"])
+
+    return "\n".join(lines)
@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 
 from phoenix_real_estate.foundation.database.schema import (
     Property,
@@ -12,9 +12,59 @@ from phoenix_real_estate.foundation.database.schema import (
     ListingStatus,
     DataSource,
 )
+from phoenix_real_estate.foundation.database.repositories import (
+    PAGE_COUNT_MODES,
+    _field_value,
+    check_percentiles,
+    compute_content_hash,
+    decode_page_token,
+    encode_page_token,
+    interpolate_percentile,
+    price_histogram_bucket,
+    zip_market_summary,
+)
 from phoenix_real_estate.foundation.utils.exceptions import ValidationError
 
 
+def _sort_key(doc: Dict[str, Any], sort_by: str) -> tuple:
+    """Order documents like MongoDB: missing values first, ties by property_id."""
+    value = _field_value(doc, sort_by)
+    return (value is not None, value if value is not None else 0, doc["property_id"])
+
+
+def _select_fields(
+    doc: Dict[str, Any], fields: Optional[Sequence[str]], required: Sequence[str] = ()
+) -> Dict[str, Any]:
+    """Keep only the requested top-level fields of a document."""
+    if fields is None:
+        return doc
+    keep = {field.split(".")[0] for field in (*fields, *required)}
+    return {key: value for key, value in doc.items() if key in keep}
+
+
+def _keyset_page(
+    matching: List[Dict[str, Any]],
+    limit: int,
+    cursor: Optional[str],
+    sort_by: str,
+    sort_order: int,
+    fields: Optional[Sequence[str]],
+) -> Dict[str, Any]:
+    """Slice one keyset page out of documents already in page order."""
+    start = 0
+    if cursor:
+        _, property_id = decode_page_token(cursor, sort_by, sort_order)
+        ids = [doc["property_id"] for doc in matching]
+        start = ids.index(property_id) + 1 if property_id in ids else len(matching)
+
+    page = matching[start : start + limit]
+    has_more = start + limit < len(matching)
+    return {
+        "properties": [_select_fields(doc, fields, (sort_by, "property_id")) for doc in page],
+        "next_cursor": encode_page_token(page[-1], sort_by, sort_order) if has_more else None,
+    }
+
+
 class MockPropertyRepository:
     """Mock property repository for testing.
 
@@ -25,6 +75,7 @@ class MockPropertyRepository:
     def __init__(self):
         """Initialize mock repository with empty storage."""
         self._properties: Dict[str, Property] = {}
+        self._content_hashes: Dict[str, str] = {}
         self._lock = asyncio.Lock()
 
     async def create(self, property_data: Dict[str, Any]) -> str:
@@ -120,6 +171,87 @@ class MockPropertyRepository:
             self._properties[property_id] = property_obj
             return property_id, was_created
 
+    async def bulk_upsert(
+        self, properties: List[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Create or update many properties, skipping unchanged ones.
+
+        Args:
+            properties: Property data to upsert
+            chunk_size: Accepted for interface parity; unused in memory
+
+        Returns:
+            Counts of inserted, updated, unchanged and failed properties
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        async with self._lock:
+            for property_data in properties:
+                property_id = property_data.get("property_id")
+                if not property_id:
+                    counts["failed"] += 1
+                    continue
+
+                content_hash = compute_content_hash(property_data)
+                existing = self._properties.get(property_id)
+                if existing is not None and self._content_hashes.get(property_id) == content_hash:
+                    counts["unchanged"] += 1
+                    continue
+
+                try:
+                    property_obj = Property(**property_data)
+                except Exception:
+                    counts["failed"] += 1
+                    continue
+
+                property_obj.last_updated = datetime.now()
+                if existing is not None:
+                    # Like $setOnInsert, updates keep the original creation time
+                    property_obj.first_seen = existing.first_seen
+                    property_obj.price_history = existing.price_history
+                    price = property_obj.current_price
+                    if price is not None and price != existing.current_price:
+                        sources = property_obj.sources or existing.sources
+                        property_obj.price_history.append(
+                            PropertyPrice(
+                                amount=price,
+                                date=property_obj.last_updated,
+                                price_type="listing",
+                                source=sources[-1].source if sources else DataSource.MANUAL_ENTRY,
+                            )
+                        )
+                    counts["updated"] += 1
+                else:
+                    counts["inserted"] += 1
+
+                self._properties[property_id] = property_obj
+                self._content_hashes[property_id] = content_hash
+
+        return counts
+
+    async def save(self, property_data: Dict[str, Any]) -> bool:
+        """Save a property, inserting or updating it.
+
+        Args:
+            property_data: Property data to save
+
+        Returns:
+            True once saved
+        """
+        await self.upsert(property_data)
+        return True
+
+    async def bulk_save(self, properties: List[Dict[str, Any]]) -> int:
+        """Save many properties.
+
+        Args:
+            properties: Property data to save
+
+        Returns:
+            Number of properties now stored as given (written or unchanged)
+        """
+        counts = await self.bulk_upsert(properties)
+        return counts["inserted"] + counts["updated"] + counts["unchanged"]
+
     async def search_by_zipcode(
         self,
         zipcode: str,
@@ -127,7 +259,9 @@ class MockPropertyRepository:
         limit: int = 20,
         sort_by: str = "last_updated",
         sort_order: int = -1,
-    ) -> tuple[List[Dict[str, Any]], int]:
+        fields: Optional[Sequence[str]] = None,
+        count_mode: str = "exact",
+    ) -> tuple[List[Dict[str, Any]], Optional[int]]:
         """Search properties by zipcode.
 
         Args:
@@ -136,104 +270,266 @@ class MockPropertyRepository:
             limit: Maximum results
             sort_by: Field to sort by
             sort_order: 1 for asc, -1 for desc
+            fields: Fields to return (default: whole documents)
+            count_mode: One of PAGE_COUNT_MODES
 
         Returns:
-            Tuple of (properties list, total count)
+            Tuple of (properties list, total count or None)
         """
-        async with self._lock:
-            # Filter by zipcode
-            matching = [
-                prop
-                for prop in self._properties.values()
-                if prop.address.zipcode == zipcode and prop.is_active
-            ]
+        if count_mode not in PAGE_COUNT_MODES:
+            raise ValidationError(f"Unknown count mode: {count_mode}")
 
-            # Sort
-            reverse = sort_order == -1
-            if sort_by == "last_updated":
-                matching.sort(key=lambda p: p.last_updated, reverse=reverse)
-            elif sort_by == "current_price":
-                matching.sort(key=lambda p: p.current_price or 0, reverse=reverse)
+        async with self._lock:
+            matching = self._sorted_zipcode_matches(zipcode, sort_by, sort_order)
 
             # Paginate
-            total = len(matching)
-            paginated = matching[skip : skip + limit]
-
-            # Convert to dicts
-            results = [prop.model_dump(by_alias=True, exclude={"id"}) for prop in paginated]
+            total = len(matching) if count_mode != "none" else None
+            results = [_select_fields(doc, fields) for doc in matching[skip : skip + limit]]
 
             return results, total
 
-    async def get_recent_updates(self, since: datetime, limit: int = 100) -> List[Dict[str, Any]]:
+    async def search_by_zipcode_page(
+        self,
+        zipcode: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_by: str = "last_updated",
+        sort_order: int = -1,
+        fields: Optional[Sequence[str]] = None,
+        count_mode: str = "none",
+    ) -> Dict[str, Any]:
+        """Search properties by zipcode one keyset page at a time.
+
+        Args:
+            zipcode: ZIP code to search
+            limit: Maximum results per page
+            cursor: next_cursor of the previous page
+            sort_by: Field to sort by
+            sort_order: 1 for asc, -1 for desc
+            fields: Fields to return
+            count_mode: One of PAGE_COUNT_MODES
+
+        Returns:
+            Dictionary with properties, next_cursor and total
+        """
+        if count_mode not in PAGE_COUNT_MODES:
+            raise ValidationError(f"Unknown count mode: {count_mode}")
+
+        async with self._lock:
+            matching = self._sorted_zipcode_matches(zipcode, sort_by, sort_order)
+            page = _keyset_page(matching, limit, cursor, sort_by, sort_order, fields)
+            page["total"] = len(matching) if count_mode != "none" else None
+            return page
+
+    async def get_recent_updates(
+        self, since: datetime, limit: int = 100, fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Get recently updated properties.
 
         Args:
             since: Timestamp to search from
             limit: Maximum results
+            fields: Fields to return (default: whole documents)
 
         Returns:
             List of recently updated properties
         """
         async with self._lock:
-            matching = [
-                prop
-                for prop in self._properties.values()
-                if prop.last_updated >= since and prop.is_active
-            ]
+            matching = self._sorted_recent_updates(since)
+            return [_select_fields(doc, fields) for doc in matching[:limit]]
 
-            # Sort by update time desc
-            matching.sort(key=lambda p: p.last_updated, reverse=True)
+    async def get_recent_updates_page(
+        self,
+        since: datetime,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get recently updated properties one keyset page at a time.
 
-            # Limit and convert
-            results = [prop.model_dump(by_alias=True, exclude={"id"}) for prop in matching[:limit]]
+        Args:
+            since: Timestamp to search from
+            limit: Maximum results per page
+            cursor: next_cursor of the previous page
+            fields: Fields to return
 
-            return results
+        Returns:
+            Dictionary with properties and next_cursor
+        """
+        async with self._lock:
+            matching = self._sorted_recent_updates(since)
+            return _keyset_page(matching, limit, cursor, "last_updated", -1, fields)
+
+    async def export(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream stored properties.
+
+        Args:
+            filters: Equality filters on (possibly dotted) fields
+            fields: Fields to export (default: whole documents)
+            batch_size: Accepted for interface parity; unused in memory
 
-    async def get_price_statistics(self, zipcode: str) -> Dict[str, Any]:
+        Yields:
+            Property documents
+        """
+        async with self._lock:
+            documents = [
+                prop.model_dump(by_alias=True, exclude={"id"}) for prop in self._properties.values()
+            ]
+
+        for document in documents:
+            if all(_field_value(document, key) == value for key, value in (filters or {}).items()):
+                yield _select_fields(document, fields)
+
+    def _sorted_zipcode_matches(
+        self, zipcode: str, sort_by: str, sort_order: int
+    ) -> List[Dict[str, Any]]:
+        """Active properties in a zipcode as dicts, in (sort_by, property_id) order."""
+        matching = [
+            prop.model_dump(by_alias=True, exclude={"id"})
+            for prop in self._properties.values()
+            if prop.address.zipcode == zipcode and prop.is_active
+        ]
+        matching.sort(key=lambda doc: _sort_key(doc, sort_by), reverse=sort_order == -1)
+        return matching
+
+    def _sorted_recent_updates(self, since: datetime) -> List[Dict[str, Any]]:
+        """Active properties updated since a timestamp as dicts, newest first."""
+        matching = [
+            prop.model_dump(by_alias=True, exclude={"id"})
+            for prop in self._properties.values()
+            if prop.last_updated >= since and prop.is_active
+        ]
+        matching.sort(key=lambda doc: _sort_key(doc, "last_updated"), reverse=True)
+        return matching
+
+    async def get_price_statistics(
+        self, zipcode: str, percentiles: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
         """Get price statistics for zipcode.
 
         Args:
             zipcode: ZIP code to analyze
+            percentiles: Percentiles to report (default DEFAULT_PRICE_PERCENTILES)
 
         Returns:
             Price statistics dictionary
         """
-        async with self._lock:
-            prices = [
-                prop.current_price
-                for prop in self._properties.values()
-                if prop.address.zipcode == zipcode
-                and prop.is_active
-                and prop.current_price is not None
-            ]
+        stats = await self.get_price_statistics_by_zipcodes([zipcode], percentiles)
+        return stats[zipcode]
+
+    async def get_price_statistics_by_zipcodes(
+        self, zipcodes: Sequence[str], percentiles: Optional[Sequence[float]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get price statistics for many zipcodes.
+
+        Args:
+            zipcodes: ZIP codes to analyze
+            percentiles: Percentiles to report (default DEFAULT_PRICE_PERCENTILES)
 
-            if not prices:
-                return {
+        Returns:
+            Statistics keyed by zipcode
+
+        Raises:
+            ValidationError: If a percentile is outside [0, 100]
+        """
+        percentiles = check_percentiles(percentiles)
+        stats = {}
+        async with self._lock:
+            for zipcode in zipcodes:
+                prices = sorted(
+                    prop.current_price
+                    for prop in self._properties.values()
+                    if prop.address.zipcode == zipcode and prop.is_active and prop.current_price
+                )
+                count = len(prices)
+                by_rank = {rank: price for rank, price in enumerate(prices, start=1)}
+
+                stats[zipcode] = {
                     "zipcode": zipcode,
-                    "count": 0,
-                    "avg_price": None,
-                    "min_price": None,
-                    "max_price": None,
-                    "median_price": None,
+                    "count": count,
+                    "avg_price": round(sum(prices) / count, 2) if count else None,
+                    "min_price": prices[0] if count else None,
+                    "max_price": prices[-1] if count else None,
+                    "median_price": interpolate_percentile(by_rank, count, 50) if count else None,
+                    "percentiles": {
+                        f"p{p:g}": interpolate_percentile(by_rank, count, p) if count else None
+                        for p in percentiles
+                    },
                 }
 
-            sorted_prices = sorted(prices)
-            count = len(prices)
+        return stats
 
-            # Calculate median
-            if count % 2 == 0:
-                median = (sorted_prices[count // 2 - 1] + sorted_prices[count // 2]) / 2
-            else:
-                median = sorted_prices[count // 2]
+    async def get_zip_market_summary(self, zipcode: str) -> Dict[str, Any]:
+        """Get the market summary of a zipcode.
 
-            return {
-                "zipcode": zipcode,
-                "count": count,
-                "avg_price": round(sum(prices) / count, 2),
-                "min_price": min(prices),
-                "max_price": max(prices),
-                "median_price": median,
+        Args:
+            zipcode: ZIP code to look up
+
+        Returns:
+            Market summary dictionary
+        """
+        summaries = await self.get_zip_market_summaries([zipcode])
+        return summaries[zipcode]
+
+    async def get_zip_market_summaries(self, zipcodes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the market summaries of many zipcodes.
+
+        Computed from the stored properties, so they are always fresh.
+
+        Args:
+            zipcodes: ZIP codes to look up
+
+        Returns:
+            Market summaries keyed by zipcode
+        """
+        summaries = {}
+        async with self._lock:
+            for zipcode in zipcodes:
+                prices = [
+                    prop.current_price
+                    for prop in self._properties.values()
+                    if prop.address.zipcode == zipcode and prop.is_active and prop.current_price
+                ]
+                histogram: Dict[str, int] = {}
+                for price in prices:
+                    bucket = str(price_histogram_bucket(price))
+                    histogram[bucket] = histogram.get(bucket, 0) + 1
+
+                summaries[zipcode] = zip_market_summary(
+                    {
+                        "zipcode": zipcode,
+                        "count": len(prices),
+                        "sum_price": sum(prices),
+                        "min_price": min(prices, default=None),
+                        "max_price": max(prices, default=None),
+                        "histogram": histogram,
+                        "last_updated": datetime.now(),
+                    }
+                )
+
+        return summaries
+
+    async def refresh_zip_market_stats(self, zipcodes: Optional[Sequence[str]] = None) -> int:
+        """Rebuild market statistics; summaries are computed on read in memory.
+
+        Args:
+            zipcodes: Zipcodes to rebuild (default: all of them)
+
+        Returns:
+            Number of zipcodes with statistics
+        """
+        async with self._lock:
+            present = {
+                prop.address.zipcode
+                for prop in self._properties.values()
+                if prop.is_active and prop.current_price
             }
+        return len(present if zipcodes is None else present & set(zipcodes))
 
     async def add_price_history(
         self, property_id: str, price: float, date: datetime, source: str
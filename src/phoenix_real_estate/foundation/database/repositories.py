@@ -5,11 +5,18 @@ proper error handling, and support for MongoDB operations including aggregations
 """
 
 import asyncio
+import base64
+import bisect
+import hashlib
+import json
+import math
 from abc import ABC
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
-from pymongo.errors import DuplicateKeyError, OperationFailure
+from bson import json_util
+from pymongo import ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
 from phoenix_real_estate.foundation.database.connection import DatabaseConnection
 from phoenix_real_estate.foundation.utils.exceptions import (
@@ -26,6 +33,330 @@ T = TypeVar("T", bound=Dict[str, Any])
 # Module logger
 logger = get_logger(__name__)
 
+# Metadata that changes between collection runs without the property changing;
+# dropped at every nesting level before hashing
+VOLATILE_FIELDS = frozenset(
+    {
+        "_id",
+        "content_hash",
+        "created_at",
+        "first_seen",
+        "last_updated",
+        "extracted_at",
+        "collected_at",
+        "extraction_confidence",
+        "price_history",
+    }
+)
+
+
+def _normalize_for_hash(value: Any) -> Any:
+    """Drop volatile fields and normalize values that compare equal."""
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize_for_hash(item)
+            for key, item in value.items()
+            if key not in VOLATILE_FIELDS
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize_for_hash(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def compute_content_hash(property_data: Dict[str, Any]) -> str:
+    """Compute a stable hash of a property's content.
+
+    Volatile metadata is excluded and keys are sorted, so the same property
+    collected on different days hashes identically.
+
+    Args:
+        property_data: Property document
+
+    Returns:
+        Hex SHA-256 digest of the normalized property
+    """
+    normalized = json.dumps(
+        _normalize_for_hash(property_data), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+# Percentiles reported by get_price_statistics unless others are requested
+DEFAULT_PRICE_PERCENTILES = (10, 25, 75, 90)
+
+
+def interpolate_percentile(
+    prices_by_rank: Dict[int, float], count: int, percentile: float
+) -> float:
+    """Compute an exact percentile by linear interpolation between closest ranks.
+
+    Args:
+        prices_by_rank: Sorted prices keyed by 1-based rank; only the ranks
+            around the percentile's position are required
+        count: Total number of prices
+        percentile: Percentile between 0 and 100
+
+    Returns:
+        The percentile value (same definition as numpy's default "linear")
+
+    Raises:
+        ValidationError: If the percentile is outside [0, 100]
+    """
+    check_percentiles([percentile])
+    position = percentile / 100 * (count - 1)
+    lower = math.floor(position)
+    fraction = position - lower
+    low = prices_by_rank[lower + 1]
+    if not fraction:
+        return low
+    return low + (prices_by_rank[lower + 2] - low) * fraction
+
+
+def check_percentiles(percentiles: Optional[Sequence[float]]) -> List[float]:
+    """Validate requested percentiles and return them sorted without duplicates.
+
+    Args:
+        percentiles: Percentiles to report (default DEFAULT_PRICE_PERCENTILES)
+
+    Returns:
+        Sorted unique percentiles
+
+    Raises:
+        ValidationError: If a percentile is outside [0, 100]
+    """
+    percentiles = sorted(set(percentiles or DEFAULT_PRICE_PERCENTILES))
+    invalid = [p for p in percentiles if not 0 <= p <= 100]
+    if invalid:
+        raise ValidationError(
+            "Percentiles must be between 0 and 100",
+            context={"percentiles": invalid},
+        )
+    return percentiles
+
+
+def _percentile_key(percentile: float) -> str:
+    """Format a percentile as a result key, e.g. 90 -> "p90", 99.9 -> "p99.9"."""
+    return f"p{percentile:g}"
+
+
+def _empty_price_statistics(zipcode: str, percentiles: Sequence[float]) -> Dict[str, Any]:
+    """Price statistics for a zipcode without prices."""
+    return {
+        "zipcode": zipcode,
+        "count": 0,
+        "avg_price": None,
+        "min_price": None,
+        "max_price": None,
+        "median_price": None,
+        "percentiles": {_percentile_key(p): None for p in percentiles},
+    }
+
+
+def _price_source(property_data: Dict[str, Any]) -> str:
+    """Find the data source to record on an automatic price history entry."""
+    source = property_data.get("source") or (property_data.get("metadata") or {}).get("source")
+    if not source and property_data.get("sources"):
+        source = property_data["sources"][-1].get("source")
+    return str(source or "unknown")
+
+
+# Lower bounds of the per-zipcode price histogram buckets; the last bucket is
+# open-ended
+PRICE_HISTOGRAM_BOUNDARIES = (
+    0,
+    100_000,
+    150_000,
+    200_000,
+    250_000,
+    300_000,
+    350_000,
+    400_000,
+    450_000,
+    500_000,
+    600_000,
+    700_000,
+    800_000,
+    1_000_000,
+    1_250_000,
+    1_500_000,
+    2_000_000,
+    3_000_000,
+    5_000_000,
+)
+
+
+def price_histogram_bucket(price: float) -> int:
+    """Find the lower bound of the histogram bucket holding a price."""
+    return PRICE_HISTOGRAM_BOUNDARIES[bisect.bisect_right(PRICE_HISTOGRAM_BOUNDARIES, price) - 1]
+
+
+def estimate_histogram_percentile(
+    histogram: Dict[str, int],
+    count: int,
+    percentile: float,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> Optional[float]:
+    """Estimate a percentile from bucket counts by interpolating within its bucket.
+
+    Args:
+        histogram: Property counts keyed by bucket lower bound
+        count: Total number of prices
+        percentile: Percentile between 0 and 100
+        min_price: Lowest price, used to narrow the first bucket
+        max_price: Highest price, used to close the open-ended last bucket
+
+    Returns:
+        The estimated percentile, or None without prices
+    """
+    if count <= 0:
+        return None
+
+    target = percentile / 100 * count
+    seen = 0
+    for index, lower in enumerate(PRICE_HISTOGRAM_BOUNDARIES):
+        in_bucket = histogram.get(str(lower), 0)
+        if in_bucket <= 0:
+            continue
+        if seen + in_bucket >= target:
+            if index + 1 < len(PRICE_HISTOGRAM_BOUNDARIES):
+                upper: Optional[float] = PRICE_HISTOGRAM_BOUNDARIES[index + 1]
+            else:
+                upper = max_price
+            low = max(lower, min_price) if min_price is not None else lower
+            high = min(upper, max_price) if upper is not None and max_price is not None else upper
+            if high is None or high < low:
+                return float(low)
+            return low + (high - low) * (target - seen) / in_bucket
+        seen += in_bucket
+
+    return float(max_price) if max_price is not None else None
+
+
+def zip_market_summary(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a stored ``zip_market_stats`` document into a market summary.
+
+    Args:
+        stats: Stored count, price sum, bounds and histogram for a zipcode
+
+    Returns:
+        Summary with count, average, bounds, median estimate and histogram
+    """
+    count = stats.get("count", 0)
+    histogram = {key: value for key, value in (stats.get("histogram") or {}).items() if value > 0}
+    min_price = stats.get("min_price") if count else None
+    max_price = stats.get("max_price") if count else None
+    return {
+        "zipcode": stats["zipcode"],
+        "count": count,
+        "avg_price": round(stats.get("sum_price", 0) / count, 2) if count else None,
+        "min_price": min_price,
+        "max_price": max_price,
+        "median_price_estimate": estimate_histogram_percentile(
+            histogram, count, 50, min_price, max_price
+        ),
+        "histogram": histogram,
+        "last_updated": stats.get("last_updated"),
+    }
+
+
+# How paginated searches count their total: a count_documents query, the
+# materialized zip market statistics, or not at all
+PAGE_COUNT_MODES = ("exact", "estimated", "none")
+
+
+def _projection(
+    fields: Optional[Sequence[str]], required: Sequence[str] = ()
+) -> Optional[Dict[str, int]]:
+    """Build a find projection for the requested fields (None returns everything)."""
+    if fields is None:
+        return None
+    return {"_id": 0, **{field: 1 for field in (*fields, *required)}}
+
+
+def _field_value(document: Dict[str, Any], field: str) -> Any:
+    """Read a possibly dotted field from a document."""
+    value: Any = document
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def encode_page_token(document: Dict[str, Any], sort_by: str, sort_order: int) -> str:
+    """Encode the keyset position after a document as an opaque page token.
+
+    Args:
+        document: Last document of the page
+        sort_by: Field the page is sorted by
+        sort_order: Sort order (1 or -1)
+
+    Returns:
+        URL-safe page token
+    """
+    position = {
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "value": _field_value(document, sort_by),
+        "property_id": document["property_id"],
+    }
+    return base64.urlsafe_b64encode(json_util.dumps(position).encode("utf-8")).decode("ascii")
+
+
+def decode_page_token(token: str, sort_by: str, sort_order: int) -> Tuple[Any, str]:
+    """Decode a page token into the (sort value, property_id) to continue after.
+
+    Args:
+        token: Token from encode_page_token
+        sort_by: Field the next page is sorted by
+        sort_order: Sort order of the next page
+
+    Returns:
+        Sort value and property_id of the previous page's last document
+
+    Raises:
+        ValidationError: If the token is malformed or was issued for another sort
+    """
+    try:
+        position = json_util.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        value, property_id = position["value"], position["property_id"]
+        issued_for = (position["sort_by"], position["sort_order"])
+    except Exception as e:
+        raise ValidationError("Invalid page token", context={"token": token}) from e
+
+    if issued_for != (sort_by, sort_order):
+        raise ValidationError(
+            "Page token was issued for a different sort",
+            context={"token_sort": issued_for, "sort": (sort_by, sort_order)},
+        )
+    return value, property_id
+
+
+def keyset_filter(sort_by: str, sort_order: int, value: Any, property_id: str) -> Dict[str, Any]:
+    """Match documents sorted after (value, property_id) in (sort_by, property_id) order."""
+    beyond = "$gt" if sort_order == 1 else "$lt"
+    tie = {sort_by: value, "property_id": {beyond: property_id}}
+    # Nulls and missing values sort before every other value
+    if value is None:
+        return {"$or": [{sort_by: {"$ne": None}}, tie]} if sort_order == 1 else tie
+    if sort_order == 1:
+        return {"$or": [{sort_by: {beyond: value}}, tie]}
+    return {"$or": [{sort_by: {beyond: value}}, {sort_by: None}, tie]}
+
+
+def _market_contribution(property_data: Optional[Dict[str, Any]]) -> Optional[Tuple[str, float]]:
+    """Get the (zipcode, price) a property adds to the market statistics, if any."""
+    if not property_data or not property_data.get("is_active", True):
+        return None
+    zipcode = (property_data.get("address") or {}).get("zipcode")
+    price = property_data.get("current_price")
+    if not zipcode or not isinstance(price, (int, float)) or price <= 0:
+        return None
+    return str(zipcode), float(price)
+
 
 class BaseRepository(ABC):
     """Abstract base repository providing common database operations.
@@ -113,6 +444,197 @@ class BaseRepository(ABC):
         )
 
 
+# A property's (zipcode, price) contribution before and after a write
+MarketChange = Tuple[Optional[Tuple[str, float]], Optional[Tuple[str, float]]]
+
+
+class ZipMarketStatsRepository(BaseRepository):
+    """Repository for the materialized per-zipcode market statistics.
+
+    Each ``zip_market_stats`` document holds the active listing count, price
+    sum, price bounds and price histogram of one zipcode. PropertyRepository
+    keeps them current with increments as properties are written, so a
+    summary is one indexed lookup instead of an aggregation over the
+    properties collection. Counts, sums and histograms are exact; the price
+    bounds only widen until the next refresh. Partial writes through
+    ``PropertyRepository.update`` are not tracked and are reconciled by
+    ``PropertyRepository.refresh_zip_market_stats``.
+
+    Increments are derived from the stored documents read before each bulk
+    write. Two writers upserting the same property concurrently can both
+    read the old contribution, so that property's change is counted twice;
+    ``refresh_zip_market_stats`` also repairs such drift.
+    """
+
+    def __init__(self, db_connection: DatabaseConnection) -> None:
+        """Initialize the market statistics repository.
+
+        Args:
+            db_connection: Database connection instance
+        """
+        super().__init__("zip_market_stats", db_connection)
+
+    async def apply_changes(self, changes: Sequence[MarketChange]) -> int:
+        """Apply property contribution changes as one increment per zipcode.
+
+        Args:
+            changes: (before, after) pairs of (zipcode, price) contributions,
+                None where a property does not count towards the statistics
+
+        Returns:
+            Number of zipcodes updated
+
+        Raises:
+            DatabaseError: If the update fails
+        """
+        deltas: Dict[str, Dict[str, Any]] = {}
+        for before, after in changes:
+            if before == after:
+                continue
+            for contribution, sign in ((before, -1), (after, 1)):
+                if contribution is None:
+                    continue
+                zipcode, price = contribution
+                delta = deltas.setdefault(
+                    zipcode, {"count": 0, "sum_price": 0.0, "histogram": {}, "added": []}
+                )
+                delta["count"] += sign
+                delta["sum_price"] += sign * price
+                bucket = f"histogram.{price_histogram_bucket(price)}"
+                delta["histogram"][bucket] = delta["histogram"].get(bucket, 0) + sign
+                if sign > 0:
+                    delta["added"].append(price)
+
+        if not deltas:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne({"zipcode": zipcode}, self._increment(delta, now), upsert=True)
+            for zipcode, delta in deltas.items()
+        ]
+        self._log_operation("apply_changes", {"zipcodes": list(deltas)})
+
+        try:
+            async with self._get_collection() as collection:
+                await collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            self._logger.error("Failed to update market stats for %s: %s", list(deltas), str(e))
+            raise DatabaseError(
+                "Failed to update zip market statistics",
+                context={"zipcodes": list(deltas), "error": str(e)},
+                original_error=e,
+            ) from e
+
+        return len(operations)
+
+    @staticmethod
+    def _increment(delta: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """Build the update document applying one zipcode's delta."""
+        increments = {"count": delta["count"], "sum_price": delta["sum_price"]}
+        increments.update({key: n for key, n in delta["histogram"].items() if n})
+        update: Dict[str, Any] = {"$inc": increments, "$set": {"last_updated": now}}
+        if delta["added"]:
+            update["$min"] = {"min_price": min(delta["added"])}
+            update["$max"] = {"max_price": max(delta["added"])}
+        return update
+
+    async def get_summary(self, zipcode: str) -> Dict[str, Any]:
+        """Get the market summary of a zipcode.
+
+        Args:
+            zipcode: ZIP code to look up
+
+        Returns:
+            Market summary; zipcodes without listings have a count of 0
+
+        Raises:
+            DatabaseError: If the lookup fails
+        """
+        summaries = await self.get_summaries([zipcode])
+        return summaries[zipcode]
+
+    async def get_summaries(self, zipcodes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the market summaries of many zipcodes in one indexed query.
+
+        Args:
+            zipcodes: ZIP codes to look up
+
+        Returns:
+            Market summaries keyed by zipcode
+
+        Raises:
+            DatabaseError: If the lookup fails
+        """
+        zipcodes = list(dict.fromkeys(zipcodes))
+        self._log_operation("get_summaries", {"zipcodes": zipcodes})
+
+        try:
+            async with self._get_collection() as collection:
+                stored = {
+                    doc["zipcode"]: doc
+                    async for doc in collection.find({"zipcode": {"$in": zipcodes}}, {"_id": 0})
+                }
+        except Exception as e:
+            self._logger.error("Failed to get market stats for %s: %s", zipcodes, str(e))
+            raise DatabaseError(
+                "Failed to get zip market statistics",
+                context={"zipcodes": zipcodes, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        return {
+            zipcode: zip_market_summary(stored.get(zipcode, {"zipcode": zipcode}))
+            for zipcode in zipcodes
+        }
+
+    async def replace_all(
+        self, stats: Sequence[Dict[str, Any]], zipcodes: Optional[Sequence[str]] = None
+    ) -> int:
+        """Replace stored statistics with freshly computed ones.
+
+        Stored zipcodes in scope that have no statistics any more are deleted.
+
+        Args:
+            stats: Complete statistics documents, one per zipcode
+            zipcodes: Zipcodes that were rebuilt (default: all of them)
+
+        Returns:
+            Number of zipcodes written
+
+        Raises:
+            DatabaseError: If the replacement fails
+        """
+        rebuilt = [doc["zipcode"] for doc in stats]
+        if zipcodes is None:
+            stale: Dict[str, Any] = {"zipcode": {"$nin": rebuilt}}
+        else:
+            stale = {"zipcode": {"$in": [z for z in zipcodes if z not in set(rebuilt)]}}
+        self._log_operation("replace_all", {"zipcodes": len(rebuilt)})
+
+        try:
+            async with self._get_collection() as collection:
+                if stats:
+                    await collection.bulk_write(
+                        [
+                            ReplaceOne({"zipcode": doc["zipcode"]}, doc, upsert=True)
+                            for doc in stats
+                        ],
+                        ordered=False,
+                    )
+                await collection.delete_many(stale)
+        except Exception as e:
+            self._logger.error("Failed to replace market stats: %s", str(e))
+            raise DatabaseError(
+                "Failed to replace zip market statistics",
+                context={"zipcodes": len(rebuilt), "error": str(e)},
+                original_error=e,
+            ) from e
+
+        self._logger.info("Rebuilt market statistics for %d zipcodes", len(rebuilt))
+        return len(rebuilt)
+
+
 class PropertyRepository(BaseRepository):
     """Repository for property-related database operations.
 
@@ -120,13 +642,29 @@ class PropertyRepository(BaseRepository):
     including complex queries, aggregations, and price history management.
     """
 
-    def __init__(self, db_connection: DatabaseConnection) -> None:
+    # Stored fields needed to decide whether, and how, a property changed
+    _CHANGE_PROJECTION = {
+        "_id": 0,
+        "property_id": 1,
+        "content_hash": 1,
+        "current_price": 1,
+        "address.zipcode": 1,
+        "is_active": 1,
+    }
+
+    # Stored fields a property contributes to the zip market statistics
+    _MARKET_PROJECTION = {"_id": 0, "current_price": 1, "address.zipcode": 1, "is_active": 1}
+
+    def __init__(self, db_connection: DatabaseConnection, bulk_chunk_size: int = 500) -> None:
         """Initialize the property repository.
 
         Args:
             db_connection: Database connection instance
+            bulk_chunk_size: Maximum operations sent per bulk write
         """
         super().__init__("properties", db_connection)
+        self.bulk_chunk_size = max(1, bulk_chunk_size)
+        self.market_stats = ZipMarketStatsRepository(db_connection)
 
     async def create(self, property_data: Dict[str, Any]) -> str:
         """Create a new property record with duplicate checking.
@@ -162,7 +700,6 @@ class PropertyRepository(BaseRepository):
                 await collection.insert_one(property_data)
 
                 self._logger.info("Created property: %s", property_id)
-                return property_id
 
         except DuplicateKeyError:
             raise DatabaseError(
@@ -177,6 +714,9 @@ class PropertyRepository(BaseRepository):
                 original_error=e,
             ) from e
 
+        await self._update_market_stats([(None, _market_contribution(property_data))])
+        return property_id
+
     async def get_by_property_id(self, property_id: str) -> Optional[Dict[str, Any]]:
         """Get a property by its unique identifier.
 
@@ -256,6 +796,9 @@ class PropertyRepository(BaseRepository):
     async def upsert(self, property_data: Dict[str, Any]) -> Tuple[str, bool]:
         """Insert or update a property (idempotent operation).
 
+        The write is skipped when the stored content hash matches, and a
+        changed price is appended to the price history.
+
         Args:
             property_data: Property data to upsert
 
@@ -276,24 +819,21 @@ class PropertyRepository(BaseRepository):
 
         try:
             async with self._get_collection() as collection:
-                # Check if exists
-                existing = await collection.find_one({"property_id": property_id}, {"_id": 1})
+                existing = await collection.find_one(
+                    {"property_id": property_id}, self._CHANGE_PROJECTION
+                )
+                spec = self._upsert_spec(property_data, datetime.now(timezone.utc), existing)
+                if spec is None:
+                    self._logger.debug("Property unchanged, skipped write: %s", property_id)
+                    return property_id, False
 
-                now = datetime.now(timezone.utc)
-                property_data["last_updated"] = now
+                result = await collection.update_one(*spec, upsert=True)
 
-                if existing:
-                    # Update existing
-                    await collection.replace_one({"property_id": property_id}, property_data)
-                    self._logger.info("Updated existing property: %s", property_id)
-                    return property_id, False
-                else:
-                    # Create new
-                    property_data["created_at"] = now
-                    property_data["is_active"] = property_data.get("is_active", True)
-                    await collection.insert_one(property_data)
+                was_created = result.upserted_id is not None
+                if was_created:
                     self._logger.info("Created new property: %s", property_id)
-                    return property_id, True
+                else:
+                    self._logger.info("Updated existing property: %s", property_id)
 
         except Exception as e:
             self._logger.error("Failed to upsert property %s: %s", property_id, str(e))
@@ -303,6 +843,207 @@ class PropertyRepository(BaseRepository):
                 original_error=e,
             ) from e
 
+        await self._update_market_stats([self._market_change(property_data, existing)])
+        return property_id, was_created
+
+    async def bulk_upsert(
+        self, properties: List[Dict[str, Any]], chunk_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Insert or update many properties with unordered bulk writes.
+
+        Each chunk costs one read of the stored content hashes and one
+        unordered ``bulk_write``. Properties whose hash is unchanged are not
+        written at all; the rest become upserting ``UpdateOne`` operations,
+        with price changes pushed onto the price history. Failures of
+        individual documents do not stop the rest of the chunk. When a
+        property_id repeats within a chunk, the last copy is written and the
+        earlier ones are counted as unchanged.
+
+        Args:
+            properties: Property documents to upsert
+            chunk_size: Properties per bulk write (defaults to bulk_chunk_size)
+
+        Returns:
+            Counts of inserted, updated, unchanged and failed properties
+
+        Raises:
+            DatabaseError: If the database cannot be reached
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        now = datetime.now(timezone.utc)
+
+        valid = [property_data for property_data in properties if property_data.get("property_id")]
+        counts["failed"] = len(properties) - len(valid)
+        if counts["failed"]:
+            self._logger.warning(
+                "Skipped %d properties without property_id in bulk upsert", counts["failed"]
+            )
+
+        chunk_size = max(1, chunk_size or self.bulk_chunk_size)
+        self._log_operation("bulk_upsert", {"properties": len(valid), "chunk_size": chunk_size})
+
+        try:
+            async with self._get_collection() as collection:
+                for start in range(0, len(valid), chunk_size):
+                    chunk = valid[start : start + chunk_size]
+                    # Keep the last copy of each property so its market change counts once
+                    latest = {p["property_id"]: p for p in chunk}
+                    counts["unchanged"] += len(chunk) - len(latest)
+                    chunk = list(latest.values())
+                    existing = {
+                        doc["property_id"]: doc
+                        async for doc in collection.find(
+                            {"property_id": {"$in": [p["property_id"] for p in chunk]}},
+                            self._CHANGE_PROJECTION,
+                        )
+                    }
+
+                    operations = []
+                    changes = []
+                    for property_data in chunk:
+                        stored = existing.get(property_data["property_id"])
+                        spec = self._upsert_spec(property_data, now, stored)
+                        if spec is None:
+                            counts["unchanged"] += 1
+                        else:
+                            operations.append(UpdateOne(*spec, upsert=True))
+                            changes.append(self._market_change(property_data, stored))
+                    if not operations:
+                        continue
+
+                    try:
+                        result = await collection.bulk_write(operations, ordered=False)
+                        details = result.bulk_api_result
+                    except BulkWriteError as e:
+                        details = e.details
+                        counts["failed"] += len(details.get("writeErrors", []))
+                        self._logger.error(
+                            "Bulk upsert chunk had %d write errors",
+                            len(details.get("writeErrors", [])),
+                        )
+
+                    counts["inserted"] += details.get("nUpserted", 0)
+                    counts["updated"] += details.get("nMatched", 0)
+
+                    failed = {error["index"] for error in details.get("writeErrors", [])}
+                    await self._update_market_stats(
+                        [change for index, change in enumerate(changes) if index not in failed]
+                    )
+
+        except Exception as e:
+            self._logger.error("Failed to bulk upsert %d properties: %s", len(valid), str(e))
+            raise DatabaseError(
+                "Failed to bulk upsert properties",
+                context={"properties": len(valid), "counts": counts, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        self._logger.info(
+            "Bulk upserted properties: %d inserted, %d updated, %d unchanged, %d failed",
+            counts["inserted"],
+            counts["updated"],
+            counts["unchanged"],
+            counts["failed"],
+        )
+        return counts
+
+    async def save(self, property_data: Dict[str, Any]) -> bool:
+        """Save a property, inserting or updating it.
+
+        Args:
+            property_data: Property data to save
+
+        Returns:
+            True once saved
+
+        Raises:
+            ValidationError: If property_data is invalid
+            DatabaseError: If the save fails
+        """
+        await self.upsert(property_data)
+        return True
+
+    async def bulk_save(self, properties: List[Dict[str, Any]]) -> int:
+        """Save many properties with bulk upserts.
+
+        Args:
+            properties: Property documents to save
+
+        Returns:
+            Number of properties now stored as given (written or unchanged)
+        """
+        counts = await self.bulk_upsert(properties)
+        return counts["inserted"] + counts["updated"] + counts["unchanged"]
+
+    @staticmethod
+    def _market_change(
+        property_data: Dict[str, Any], existing: Optional[Dict[str, Any]]
+    ) -> MarketChange:
+        """Get a property's market contribution before and after upserting it."""
+        # Top-level fields are $set wholesale, so a shallow merge is the stored result
+        return _market_contribution(existing), _market_contribution(
+            {**(existing or {}), **property_data}
+        )
+
+    async def _update_market_stats(self, changes: Sequence[MarketChange]) -> None:
+        """Apply market changes of completed writes without failing those writes."""
+        try:
+            await self.market_stats.apply_changes(changes)
+        except DatabaseError as e:
+            self._logger.error(
+                "Zip market statistics are stale until refreshed: %s",
+                str(e),
+                extra={"context": e.context},
+            )
+
+    @staticmethod
+    def _upsert_spec(
+        property_data: Dict[str, Any],
+        now: datetime,
+        existing: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Build the filter and update document for upserting one property.
+
+        ``created_at``, the ``is_active`` default and the given
+        ``price_history`` are only written when the document is inserted, so
+        updates keep the original creation time and append to the history.
+
+        Args:
+            property_data: Property to write
+            now: Write timestamp
+            existing: Stored change-detection fields, if the property exists
+
+        Returns:
+            Filter and update documents, or None if the content is unchanged
+        """
+        content_hash = compute_content_hash(property_data)
+        if existing and existing.get("content_hash") == content_hash:
+            return None
+
+        fields = {
+            key: value
+            for key, value in property_data.items()
+            if key not in ("_id", "created_at", "price_history")
+        }
+        fields["last_updated"] = now
+        fields["content_hash"] = content_hash
+
+        update: Dict[str, Any] = {"$set": fields}
+        on_insert: Dict[str, Any] = {"created_at": property_data.get("created_at", now)}
+        if "is_active" not in fields:
+            on_insert["is_active"] = True
+        if existing is None:
+            # Never conflicts with the $push below, which needs a stored document
+            on_insert["price_history"] = property_data.get("price_history", [])
+
+        price = property_data.get("current_price")
+        if existing and price is not None and price != existing.get("current_price"):
+            price_entry = {"price": price, "date": now, "source": _price_source(property_data)}
+            update["$push"] = {"price_history": price_entry}
+        update["$setOnInsert"] = on_insert
+
+        return {"property_id": property_data["property_id"]}, update
+
     async def search_by_zipcode(
         self,
         zipcode: str,
@@ -310,8 +1051,13 @@ class PropertyRepository(BaseRepository):
         limit: int = 20,
         sort_by: str = "last_updated",
         sort_order: int = -1,
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """Search properties by zipcode with pagination.
+        fields: Optional[Sequence[str]] = None,
+        count_mode: str = "exact",
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Search properties by zipcode with offset pagination.
+
+        Deep pages get slower with ``skip``; use search_by_zipcode_page to
+        walk large zipcodes.
 
         Args:
             zipcode: ZIP code to search
@@ -319,13 +1065,17 @@ class PropertyRepository(BaseRepository):
             limit: Maximum number of documents to return
             sort_by: Field to sort by
             sort_order: Sort order (1 for ascending, -1 for descending)
+            fields: Fields to return (default: whole documents)
+            count_mode: One of PAGE_COUNT_MODES
 
         Returns:
-            Tuple of (properties list, total count)
+            Tuple of (properties list, total count or None for count_mode "none")
 
         Raises:
+            ValidationError: If count_mode is unknown
             DatabaseError: If search fails
         """
+        self._check_count_mode(count_mode)
         self._log_operation("search_by_zipcode", {"zipcode": zipcode, "skip": skip, "limit": limit})
 
         try:
@@ -334,10 +1084,15 @@ class PropertyRepository(BaseRepository):
                 query = {"address.zipcode": zipcode, "is_active": True}
 
                 # Get total count
-                total_count = await collection.count_documents(query)
+                total_count = await self._count_zipcode(collection, query, zipcode, count_mode)
 
                 # Get paginated results
-                cursor = collection.find(query).sort(sort_by, sort_order).skip(skip).limit(limit)
+                cursor = (
+                    collection.find(query, _projection(fields))
+                    .sort(sort_by, sort_order)
+                    .skip(skip)
+                    .limit(limit)
+                )
                 properties = []
 
                 async for doc in cursor:
@@ -345,11 +1100,11 @@ class PropertyRepository(BaseRepository):
                     properties.append(doc)
 
                 self._logger.info(
-                    "Found %d properties in zipcode %s (showing %d-%d)",
+                    "Found %s properties in zipcode %s (showing %d-%d)",
                     total_count,
                     zipcode,
                     skip + 1,
-                    min(skip + limit, total_count),
+                    skip + len(properties),
                 )
 
                 return properties, total_count
@@ -362,12 +1117,72 @@ class PropertyRepository(BaseRepository):
                 original_error=e,
             ) from e
 
-    async def get_recent_updates(self, since: datetime, limit: int = 100) -> List[Dict[str, Any]]:
+    async def search_by_zipcode_page(
+        self,
+        zipcode: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_by: str = "last_updated",
+        sort_order: int = -1,
+        fields: Optional[Sequence[str]] = None,
+        count_mode: str = "none",
+    ) -> Dict[str, Any]:
+        """Search properties by zipcode with keyset (cursor) pagination.
+
+        Each page seeks past the previous page's last ``(sort_by, property_id)``
+        instead of skipping documents, so every page costs the same.
+
+        Args:
+            zipcode: ZIP code to search
+            limit: Maximum number of documents to return
+            cursor: ``next_cursor`` of the previous page (None for the first page)
+            sort_by: Field to sort by
+            sort_order: Sort order (1 for ascending, -1 for descending)
+            fields: Fields to return; property_id and sort_by are always included
+            count_mode: One of PAGE_COUNT_MODES
+
+        Returns:
+            Dictionary with properties, next_cursor (None on the last page) and
+            total (None for count_mode "none")
+
+        Raises:
+            ValidationError: If the cursor or count_mode is invalid
+            DatabaseError: If search fails
+        """
+        self._check_count_mode(count_mode)
+        after = decode_page_token(cursor, sort_by, sort_order) if cursor else None
+        self._log_operation(
+            "search_by_zipcode_page", {"zipcode": zipcode, "limit": limit, "cursor": bool(cursor)}
+        )
+
+        try:
+            async with self._get_collection() as collection:
+                query = {"address.zipcode": zipcode, "is_active": True}
+                total_count = await self._count_zipcode(collection, query, zipcode, count_mode)
+                properties, next_cursor = await self._find_page(
+                    collection, query, limit, after, sort_by, sort_order, fields
+                )
+
+        except Exception as e:
+            self._logger.error("Failed to page zipcode %s: %s", zipcode, str(e))
+            raise DatabaseError(
+                "Failed to search properties by zipcode",
+                context={"zipcode": zipcode, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        self._logger.info("Found %d properties in zipcode %s page", len(properties), zipcode)
+        return {"properties": properties, "next_cursor": next_cursor, "total": total_count}
+
+    async def get_recent_updates(
+        self, since: datetime, limit: int = 100, fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Get properties updated since a given timestamp.
 
         Args:
             since: Timestamp to search from
             limit: Maximum number of results
+            fields: Fields to return (default: whole documents)
 
         Returns:
             List of recently updated properties
@@ -380,7 +1195,9 @@ class PropertyRepository(BaseRepository):
         try:
             async with self._get_collection() as collection:
                 cursor = (
-                    collection.find({"last_updated": {"$gt": since}, "is_active": True})
+                    collection.find(
+                        {"last_updated": {"$gt": since}, "is_active": True}, _projection(fields)
+                    )
                     .sort("last_updated", -1)
                     .limit(limit)
                 )
@@ -404,91 +1221,296 @@ class PropertyRepository(BaseRepository):
                 original_error=e,
             ) from e
 
-    async def get_price_statistics(self, zipcode: str) -> Dict[str, Any]:
-        """Get price statistics for a zipcode using aggregation pipeline.
+    async def get_recent_updates_page(
+        self,
+        since: datetime,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get properties updated since a timestamp, newest first, one page at a time.
 
         Args:
-            zipcode: ZIP code to analyze
+            since: Timestamp to search from
+            limit: Maximum number of results per page
+            cursor: ``next_cursor`` of the previous page (None for the first page)
+            fields: Fields to return; property_id and last_updated are always included
 
         Returns:
-            Dictionary with price statistics including min, max, avg, median
+            Dictionary with properties and next_cursor (None on the last page)
 
         Raises:
-            DatabaseError: If aggregation fails
+            ValidationError: If the cursor is invalid
+            DatabaseError: If query fails
         """
-        self._log_operation("get_price_statistics", {"zipcode": zipcode})
+        after = decode_page_token(cursor, "last_updated", -1) if cursor else None
+        self._log_operation(
+            "get_recent_updates_page",
+            {"since": since.isoformat(), "limit": limit, "cursor": bool(cursor)},
+        )
 
         try:
             async with self._get_collection() as collection:
-                pipeline = [
-                    # Match active properties in zipcode with valid prices
-                    {
-                        "$match": {
-                            "address.zipcode": zipcode,
-                            "is_active": True,
-                            "current_price": {"$exists": True, "$gt": 0},
-                        }
-                    },
-                    # Group and calculate statistics
-                    {
-                        "$group": {
-                            "_id": "$address.zipcode",
-                            "count": {"$sum": 1},
-                            "avg_price": {"$avg": "$current_price"},
-                            "min_price": {"$min": "$current_price"},
-                            "max_price": {"$max": "$current_price"},
-                            "prices": {"$push": "$current_price"},
-                        }
-                    },
-                    # Calculate percentiles
-                    {
-                        "$project": {
-                            "_id": 0,
-                            "zipcode": "$_id",
-                            "count": 1,
-                            "avg_price": {"$round": ["$avg_price", 2]},
-                            "min_price": 1,
-                            "max_price": 1,
-                            "median_price": {
-                                "$arrayElemAt": [
-                                    "$prices",
-                                    {"$floor": {"$divide": [{"$size": "$prices"}, 2]}},
-                                ]
-                            },
-                        }
-                    },
-                ]
+                properties, next_cursor = await self._find_page(
+                    collection,
+                    {"last_updated": {"$gt": since}, "is_active": True},
+                    limit,
+                    after,
+                    "last_updated",
+                    -1,
+                    fields,
+                )
 
-                # Execute aggregation
-                cursor = collection.aggregate(pipeline)
-                results = await cursor.to_list(length=1)
+        except Exception as e:
+            self._logger.error("Failed to page recent updates: %s", str(e))
+            raise DatabaseError(
+                "Failed to get recent updates",
+                context={"since": since.isoformat(), "error": str(e)},
+                original_error=e,
+            ) from e
 
-                if results:
-                    stats = results[0]
-                    self._logger.info(
-                        "Calculated price statistics for zipcode %s: %d properties",
-                        zipcode,
-                        stats.get("count", 0),
-                    )
-                    return stats
-                else:
-                    return {
-                        "zipcode": zipcode,
-                        "count": 0,
-                        "avg_price": None,
-                        "min_price": None,
-                        "max_price": None,
-                        "median_price": None,
-                    }
+        self._logger.info(
+            "Found %d properties updated since %s page", len(properties), since.isoformat()
+        )
+        return {"properties": properties, "next_cursor": next_cursor}
+
+    async def export(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream properties out of the collection one server batch at a time.
+
+        Documents are fetched lazily in batches of ``batch_size``, so memory
+        stays bounded however large the collection is. Feed the iterator to
+        the writers in ``phoenix_real_estate.foundation.database.export``.
+
+        Args:
+            filters: MongoDB filter (default: every property, active or not)
+            fields: Fields to export (default: whole documents)
+            batch_size: Documents per server round trip
+
+        Yields:
+            Property documents without the MongoDB ``_id``
+
+        Raises:
+            DatabaseError: If the query fails
+        """
+        self._log_operation("export", {"filters": filters, "batch_size": batch_size})
+
+        exported = 0
+        try:
+            async with self._get_collection() as collection:
+                cursor = collection.find(filters or {}, _projection(fields)).batch_size(
+                    max(1, batch_size)
+                )
+                async for doc in cursor:
+                    doc.pop("_id", None)
+                    exported += 1
+                    yield doc
+
+        except Exception as e:
+            self._logger.error("Failed to export properties after %d: %s", exported, str(e))
+            raise DatabaseError(
+                "Failed to export properties",
+                context={"exported": exported, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        self._logger.info("Exported %d properties", exported)
+
+    @staticmethod
+    def _check_count_mode(count_mode: str) -> None:
+        """Reject unknown count modes."""
+        if count_mode not in PAGE_COUNT_MODES:
+            raise ValidationError(
+                f"Unknown count mode: {count_mode}",
+                context={"count_mode": count_mode, "allowed": PAGE_COUNT_MODES},
+            )
+
+    async def _count_zipcode(
+        self, collection, query: Dict[str, Any], zipcode: str, count_mode: str
+    ) -> Optional[int]:
+        """Count the properties matched by a zipcode query as count_mode asks."""
+        if count_mode == "exact":
+            return await collection.count_documents(query)
+        if count_mode == "estimated":
+            # Priced active listings from the materialized statistics: one lookup
+            summary = await self.market_stats.get_summary(zipcode)
+            return summary["count"]
+        return None
+
+    @staticmethod
+    async def _find_page(
+        collection,
+        query: Dict[str, Any],
+        limit: int,
+        after: Optional[Tuple[Any, str]],
+        sort_by: str,
+        sort_order: int,
+        fields: Optional[Sequence[str]],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one keyset page and the cursor for the page after it.
+
+        One extra document is read to tell whether another page exists.
+        """
+        if after is not None:
+            query = {"$and": [query, keyset_filter(sort_by, sort_order, *after)]}
+        projection = _projection(fields, (sort_by, "property_id"))
+        cursor = (
+            collection.find(query, projection)
+            .sort([(sort_by, sort_order), ("property_id", sort_order)])
+            .limit(limit + 1)
+        )
+
+        properties = []
+        async for doc in cursor:
+            doc.pop("_id", None)
+            properties.append(doc)
+
+        if len(properties) <= limit:
+            return properties, None
+        properties = properties[:limit]
+        return properties, encode_page_token(properties[-1], sort_by, sort_order)
+
+    async def get_price_statistics(
+        self, zipcode: str, percentiles: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """Get exact price statistics for a zipcode.
+
+        Args:
+            zipcode: ZIP code to analyze
+            percentiles: Percentiles to report (default DEFAULT_PRICE_PERCENTILES)
+
+        Returns:
+            Dictionary with count, min, max, avg, median and percentile prices
+
+        Raises:
+            ValidationError: If a percentile is outside [0, 100]
+            DatabaseError: If aggregation fails
+        """
+        stats = await self.get_price_statistics_by_zipcodes([zipcode], percentiles)
+        return stats[zipcode]
+
+    async def get_price_statistics_by_zipcodes(
+        self, zipcodes: Sequence[str], percentiles: Optional[Sequence[float]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get exact price statistics for many zipcodes in one aggregation.
+
+        Prices are ranked per zipcode server-side with ``$setWindowFields``,
+        and only the ranks needed for the min, max, median and requested
+        percentiles leave the database. Percentiles interpolate linearly
+        between the closest ranks, so results are exact. No document
+        accumulates every price in a zipcode.
+
+        Args:
+            zipcodes: ZIP codes to analyze
+            percentiles: Percentiles to report (default DEFAULT_PRICE_PERCENTILES)
+
+        Returns:
+            Statistics keyed by zipcode; zipcodes without prices have a count of 0
+
+        Raises:
+            ValidationError: If a percentile is outside [0, 100]
+            DatabaseError: If aggregation fails
+        """
+        zipcodes = list(dict.fromkeys(zipcodes))
+        percentiles = check_percentiles(percentiles)
+        if not zipcodes:
+            return {}
+        self._log_operation(
+            "get_price_statistics", {"zipcodes": zipcodes, "percentiles": percentiles}
+        )
+
+        try:
+            async with self._get_collection() as collection:
+                cursor = collection.aggregate(
+                    self._price_statistics_pipeline(zipcodes, [50, *percentiles]),
+                    allowDiskUse=True,
+                )
+                groups = await cursor.to_list(length=None)
 
         except Exception as e:
-            self._logger.error("Failed to get price statistics for %s: %s", zipcode, str(e))
+            self._logger.error("Failed to get price statistics for %s: %s", zipcodes, str(e))
             raise DatabaseError(
                 "Failed to calculate price statistics",
-                context={"zipcode": zipcode, "error": str(e)},
+                context={"zipcodes": zipcodes, "error": str(e)},
                 original_error=e,
             ) from e
 
+        stats = {zipcode: _empty_price_statistics(zipcode, percentiles) for zipcode in zipcodes}
+        for group in groups:
+            count = group["count"]
+            prices_by_rank = {entry["rank"]: entry["price"] for entry in group["ranked"]}
+            stats[group["_id"]] = {
+                "zipcode": group["_id"],
+                "count": count,
+                "avg_price": round(group["avg_price"], 2),
+                "min_price": prices_by_rank[1],
+                "max_price": prices_by_rank[count],
+                "median_price": interpolate_percentile(prices_by_rank, count, 50),
+                "percentiles": {
+                    _percentile_key(p): interpolate_percentile(prices_by_rank, count, p)
+                    for p in percentiles
+                },
+            }
+
+        self._logger.info(
+            "Calculated price statistics for %d zipcodes (%d with prices)",
+            len(zipcodes),
+            len(groups),
+        )
+        return stats
+
+    @staticmethod
+    def _price_statistics_pipeline(
+        zipcodes: List[str], percentiles: Sequence[float]
+    ) -> List[Dict[str, Any]]:
+        """Build the ranked-price aggregation behind the price statistics."""
+        everything = {"documents": ["unbounded", "unbounded"]}
+        last_index = {"$subtract": ["$_count", 1]}
+
+        # 1-based ranks of the values each percentile interpolates between
+        needed_ranks = [{"$eq": ["$_rank", 1]}, {"$eq": ["$_rank", "$_count"]}]
+        for percentile in percentiles:
+            position = {"$multiply": [percentile / 100, last_index]}
+            needed_ranks.append({"$eq": ["$_rank", {"$add": [{"$floor": position}, 1]}]})
+            needed_ranks.append({"$eq": ["$_rank", {"$add": [{"$ceil": position}, 1]}]})
+
+        return [
+            # Match active properties in the zipcodes with valid prices
+            {
+                "$match": {
+                    "address.zipcode": {"$in": zipcodes},
+                    "is_active": True,
+                    "current_price": {"$exists": True, "$gt": 0},
+                }
+            },
+            # Rank prices within each zipcode
+            {
+                "$setWindowFields": {
+                    "partitionBy": "$address.zipcode",
+                    "sortBy": {"current_price": 1},
+                    "output": {
+                        "_rank": {"$documentNumber": {}},
+                        "_count": {"$count": {}, "window": everything},
+                        "_avg": {"$avg": "$current_price", "window": everything},
+                    },
+                }
+            },
+            # Keep only the ranks the statistics need
+            {"$match": {"$expr": {"$or": needed_ranks}}},
+            {
+                "$group": {
+                    "_id": "$address.zipcode",
+                    "count": {"$first": "$_count"},
+                    "avg_price": {"$first": "$_avg"},
+                    "ranked": {"$push": {"rank": "$_rank", "price": "$current_price"}},
+                }
+            },
+        ]
+
     async def add_price_history(
         self, property_id: str, price: float, date: datetime, source: str
     ) -> bool:
@@ -519,8 +1541,8 @@ class PropertyRepository(BaseRepository):
                 # Build price history entry
                 price_entry = {"price": price, "date": date, "source": source}
 
-                # Update property
-                result = await collection.update_one(
+                # Update property, keeping the previous price for the market stats
+                previous = await collection.find_one_and_update(
                     {"property_id": property_id},
                     {
                         "$push": {"price_history": price_entry},
@@ -529,17 +1551,18 @@ class PropertyRepository(BaseRepository):
                             "last_updated": datetime.now(timezone.utc),
                         },
                     },
+                    projection=self._MARKET_PROJECTION,
+                    return_document=ReturnDocument.BEFORE,
                 )
 
-                if result.modified_count > 0:
-                    self._logger.info(
-                        "Added price history to property %s: $%.2f from %s",
-                        property_id,
-                        price,
-                        source,
-                    )
-                    return True
-                return False
+                if previous is None:
+                    return False
+                self._logger.info(
+                    "Added price history to property %s: $%.2f from %s",
+                    property_id,
+                    price,
+                    source,
+                )
 
         except Exception as e:
             self._logger.error("Failed to add price history: %s", str(e))
@@ -549,6 +1572,147 @@ class PropertyRepository(BaseRepository):
                 original_error=e,
             ) from e
 
+        await self._update_market_stats(
+            [
+                (
+                    _market_contribution(previous),
+                    _market_contribution({**previous, "current_price": price}),
+                )
+            ]
+        )
+        return True
+
+    async def get_zip_market_summary(self, zipcode: str) -> Dict[str, Any]:
+        """Get the precomputed market summary of a zipcode.
+
+        Reads the materialized ``zip_market_stats`` document instead of
+        aggregating properties, so the cost does not grow with the collection.
+
+        Args:
+            zipcode: ZIP code to look up
+
+        Returns:
+            Count, average, bounds, median estimate and price histogram
+
+        Raises:
+            DatabaseError: If the lookup fails
+        """
+        return await self.market_stats.get_summary(zipcode)
+
+    async def get_zip_market_summaries(self, zipcodes: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the precomputed market summaries of many zipcodes.
+
+        Args:
+            zipcodes: ZIP codes to look up
+
+        Returns:
+            Market summaries keyed by zipcode
+
+        Raises:
+            DatabaseError: If the lookup fails
+        """
+        return await self.market_stats.get_summaries(zipcodes)
+
+    async def refresh_zip_market_stats(self, zipcodes: Optional[Sequence[str]] = None) -> int:
+        """Rebuild the materialized zip market statistics from the properties.
+
+        Run after the first deployment, and periodically to tighten the price
+        bounds and pick up writes the increments do not track.
+
+        Args:
+            zipcodes: Zipcodes to rebuild (default: all of them)
+
+        Returns:
+            Number of zipcodes with statistics
+
+        Raises:
+            DatabaseError: If the rebuild fails
+        """
+        zipcodes = list(dict.fromkeys(zipcodes)) if zipcodes is not None else None
+        self._log_operation("refresh_zip_market_stats", {"zipcodes": zipcodes})
+
+        try:
+            async with self._get_collection() as collection:
+                cursor = collection.aggregate(
+                    self._market_stats_pipeline(zipcodes), allowDiskUse=True
+                )
+                groups = await cursor.to_list(length=None)
+        except Exception as e:
+            self._logger.error("Failed to aggregate zip market statistics: %s", str(e))
+            raise DatabaseError(
+                "Failed to refresh zip market statistics",
+                context={"zipcodes": zipcodes, "error": str(e)},
+                original_error=e,
+            ) from e
+
+        now = datetime.now(timezone.utc)
+        stats = [
+            {
+                "zipcode": group["_id"],
+                "count": group["count"],
+                "sum_price": group["sum_price"],
+                "min_price": group["min_price"],
+                "max_price": group["max_price"],
+                "histogram": {str(bucket["k"]): bucket["v"] for bucket in group["histogram"]},
+                "last_updated": now,
+            }
+            for group in groups
+        ]
+        return await self.market_stats.replace_all(stats, zipcodes)
+
+    @staticmethod
+    def _market_stats_pipeline(zipcodes: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Build the aggregation computing every zipcode's market statistics."""
+        boundaries = list(PRICE_HISTOGRAM_BOUNDARIES)
+        bucket = {
+            "$arrayElemAt": [
+                boundaries,
+                {
+                    "$subtract": [
+                        {
+                            "$size": {
+                                "$filter": {
+                                    "input": boundaries,
+                                    "cond": {"$lte": ["$$this", "$current_price"]},
+                                }
+                            }
+                        },
+                        1,
+                    ]
+                },
+            ]
+        }
+        match: Dict[str, Any] = {
+            "is_active": True,
+            "current_price": {"$gt": 0},
+            "address.zipcode": {"$in": zipcodes} if zipcodes is not None else {"$ne": None},
+        }
+
+        return [
+            {"$match": match},
+            # Count each histogram bucket per zipcode
+            {
+                "$group": {
+                    "_id": {"zipcode": "$address.zipcode", "bucket": bucket},
+                    "count": {"$sum": 1},
+                    "sum_price": {"$sum": "$current_price"},
+                    "min_price": {"$min": "$current_price"},
+                    "max_price": {"$max": "$current_price"},
+                }
+            },
+            # Fold the buckets into one document per zipcode
+            {
+                "$group": {
+                    "_id": "$_id.zipcode",
+                    "count": {"$sum": "$count"},
+                    "sum_price": {"$sum": "$sum_price"},
+                    "min_price": {"$min": "$min_price"},
+                    "max_price": {"$max": "$max_price"},
+                    "histogram": {"$push": {"k": "$_id.bucket", "v": "$count"}},
+                }
+            },
+        ]
+
 
 class DailyReportRepository(BaseRepository):
     """Repository for daily report operations.
@@ -680,12 +1844,13 @@ class RepositoryFactory:
 
     @classmethod
     def get_property_repository(
-        cls, db_connection: Optional[DatabaseConnection] = None
+        cls, db_connection: Optional[DatabaseConnection] = None, bulk_chunk_size: int = 500
     ) -> PropertyRepository:
         """Get or create a PropertyRepository instance.
 
         Args:
             db_connection: Optional database connection to use
+            bulk_chunk_size: Maximum operations per bulk write when creating the repository
 
         Returns:
             PropertyRepository instance
@@ -707,7 +1872,9 @@ class RepositoryFactory:
 
                 db_connection = DatabaseConnection.get_instance(db_uri, db_name)
 
-            cls._repositories[PropertyRepository] = PropertyRepository(db_connection)
+            cls._repositories[PropertyRepository] = PropertyRepository(
+                db_connection, bulk_chunk_size=bulk_chunk_size
+            )
 
         return cls._repositories[PropertyRepository]
 
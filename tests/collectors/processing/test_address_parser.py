@@ -0,0 +1,100 @@
+"""Tests for the rule-based Maricopa address parser."""
+
+import pytest
+
+from phoenix_real_estate.collectors.processing.address_parser import AddressParser
+
+
+@pytest.fixture
+def parser():
+    """Create an address parser."""
+    return AddressParser()
+
+
+class TestAddressParser:
+    """Test suite for AddressParser."""
+
+    @pytest.mark.parametrize(
+        "address, expected",
+        [
+            (
+                "123 MAIN ST PHOENIX AZ 85033",
+                {"street": "123 Main St", "city": "Phoenix", "state": "AZ", "zip_code": "85033"},
+            ),
+            (
+                "123 Main St Unit A, Phoenix, AZ 85001",
+                {
+                    "street": "123 Main St Unit A",
+                    "city": "Phoenix",
+                    "state": "AZ",
+                    "zip_code": "85001",
+                },
+            ),
+            (
+                "4512 N 35TH AVE SUN CITY WEST AZ 85375",
+                {
+                    "street": "4512 N 35th Ave",
+                    "city": "Sun City West",
+                    "state": "AZ",
+                    "zip_code": "85375",
+                },
+            ),
+            (
+                "9 N CENTRAL AVE, PHOENIX ARIZONA 85004-1234",
+                {
+                    "street": "9 N Central Ave",
+                    "city": "Phoenix",
+                    "state": "AZ",
+                    "zip_code": "85004",
+                },
+            ),
+            (
+                "22 W PALM LN LAVEEN 85339",
+                {"street": "22 W Palm Ln", "city": "Laveen", "state": "AZ", "zip_code": "85339"},
+            ),
+        ],
+    )
+    def test_parses_county_formats(self, parser, address, expected):
+        """Test common county address formats are split locally."""
+        assert parser.parse(address) == expected
+
+    @pytest.mark.parametrize(
+        "address",
+        [
+            "",
+            None,
+            "123 MAIN ST",  # No city or ZIP
+            "MAIN ST PHOENIX AZ 85001",  # No house number
+            "123 MAIN ST LOS ANGELES CA 90001",  # Out of state
+            "LOT 7 TONTO RD NEAR CAVE CREEK",  # Free text
+        ],
+    )
+    def test_rejects_unconfident_addresses(self, parser, address):
+        """Test addresses without a clear structure are left for the LLM."""
+        assert parser.parse(address) is None
+
+    @pytest.mark.parametrize(
+        "address",
+        [
+            "123 W GLENDALE AZ 85301",  # Directional only, city taken as the street name
+            "123 W, Glendale, AZ 85301",
+            "123 APT 4 PHOENIX AZ 85001",
+        ],
+    )
+    def test_rejects_streets_without_a_name(self, parser, address):
+        """Test a house number with only a directional or unit is not a street."""
+        assert parser.parse(address) is None
+
+    @pytest.mark.parametrize(
+        "address, street",
+        [
+            ("1 N 1ST ST APT 2, PHOENIX, AZ 85004", "1 N 1st St Apt 2"),
+            ("1 n 1st st apt 2, phoenix, az 85004", "1 N 1st St Apt 2"),
+            ("4602 N 49TH AVE UNIT 5 GLENDALE AZ 85301", "4602 N 49th Ave Unit 5"),
+            ("4602 North 49th Avenue unit 5, Glendale, AZ 85301", "4602 N 49th Ave Unit 5"),
+            ("77 E OAK ST # 3B, MESA, AZ 85201", "77 E Oak St # 3B"),
+        ],
+    )
+    def test_normalizes_streets_regardless_of_case(self, parser, address, street):
+        """Test ordinals, directionals and unit labels normalize the same way for any casing."""
+        assert parser.parse(address)["street"] == street
@@ -4,13 +4,16 @@ import asyncio
 import pytest
 import time
 from typing import Dict, Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from phoenix_real_estate.collectors.processing.cache import (
     CacheManager,
     LRUCache,
     CacheMetrics,
     CacheConfig,
+    DiskCache,
+    SingleFlight,
+    create_eviction_policy,
 )
 
 
@@ -133,6 +136,7 @@ class TestCacheManager:
             enabled=True,
             max_size_mb=0.001,  # 1KB
             backend="memory",
+            compression_enabled=False,  # Account raw sizes
         )
         manager = CacheManager(config)
         await manager.initialize()
@@ -210,6 +214,42 @@ class TestCacheManager:
         assert await cache_manager.get(sample_property, "extraction") is None
         assert await cache_manager.get(sample_property, "validation") is None
 
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_uses_property_index(self, cache_manager, sample_property):
+        """Test property invalidation removes exactly that property's entries."""
+        other_property = {**sample_property, "listing_id": "PHX-2024-0002"}
+        for operation in ("extraction", "validation", "summary"):
+            await cache_manager.set(sample_property, operation, {"op": operation})
+        await cache_manager.set(other_property, "extraction", {"op": "other"})
+
+        assert await cache_manager.invalidate_pattern(sample_property) == 3
+
+        assert await cache_manager.get(sample_property, "summary") is None
+        assert await cache_manager.get(other_property, "extraction") == {"op": "other"}
+        # Deleted entries no longer occupy slots
+        assert cache_manager.get_metrics()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_covers_content_addressed_entries(
+        self, cache_manager, sample_property
+    ):
+        """Test extraction entries keyed by content hash are indexed by their result."""
+        result = {
+            "data": {
+                "address": {
+                    "street": "123 Main St",
+                    "city": "Phoenix",
+                    "state": "AZ",
+                    "zip_code": "85001",
+                },
+                "price": 350000,
+            }
+        }
+        await cache_manager.set({"content_hash": "abc123"}, "extraction", result)
+
+        assert await cache_manager.invalidate_pattern(sample_property) == 1
+        assert await cache_manager.get({"content_hash": "abc123"}, "extraction") is None
+
     @pytest.mark.asyncio
     async def test_concurrent_access(self, cache_manager, sample_property):
         """Test thread-safe concurrent access."""
@@ -251,6 +291,100 @@ class TestCacheManager:
         assert result == data
 
 
+class TestCacheSnapshots:
+    """Test cache warmup and snapshot export/import."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_round_trip(self, tmp_path):
+        """Test a fresh cache preloads entries exported by another process."""
+        path = tmp_path / "snapshots" / "llm-cache.jsonl.gz"
+        properties = [{"listing_id": f"PHX-{i}", "address": f"{i} Main St"} for i in range(20)]
+        responses = [{"price": i * 1000} for i in range(20)]
+
+        source = CacheManager(CacheConfig(backend="memory"))
+        await source.initialize()
+        await source.warmup(properties, responses, "extraction")
+        assert source.get_metrics()["sets"] == 20
+        assert await source.export_snapshot(str(path)) == 20
+
+        target = CacheManager(CacheConfig(backend="memory"))
+        await target.initialize()
+        assert await target.import_snapshot(str(path)) == 20
+
+        assert await target.get(properties[7], "extraction") == {"price": 7000}
+        # The property index survives the round trip
+        assert await target.invalidate_pattern(properties[7]) == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_preserves_expiry(self, tmp_path):
+        """Test entries keep their original expiry and expired ones are skipped."""
+        path = tmp_path / "llm-cache.jsonl.gz"
+        source = CacheManager(CacheConfig(backend="memory"))
+        await source.initialize()
+        await source.set({"listing_id": "PHX-1"}, "extraction", {"price": 1})
+        await source.set({"listing_id": "PHX-2"}, "extraction", {"price": 2})
+        await source.export_snapshot(str(path))
+
+        expiry = source._backend.items()[0][2]
+        with patch("time.time", return_value=expiry + 1):
+            target = CacheManager(CacheConfig(backend="memory"))
+            await target.initialize()
+            assert await target.import_snapshot(str(path)) == 0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_on_start_and_written_on_close(self, tmp_path):
+        """Test configured snapshots warm a cold start and persist on close."""
+        path = tmp_path / "llm-cache.jsonl.gz"
+        config = CacheConfig(backend="memory", snapshot_path=str(path), warmup_on_start=True)
+
+        first = CacheManager(config)
+        await first.initialize()
+        await first.set({"listing_id": "PHX-1"}, "extraction", {"price": 1})
+        await first.close()
+        assert path.exists()
+
+        second = CacheManager(config)
+        await second.initialize()
+        assert await second.get({"listing_id": "PHX-1"}, "extraction") == {"price": 1}
+
+    @pytest.mark.asyncio
+    async def test_rejects_foreign_files(self, tmp_path):
+        """Test importing a file that is not a snapshot fails clearly."""
+        import gzip
+
+        path = tmp_path / "other.jsonl.gz"
+        with gzip.open(path, "wt") as f:
+            f.write('{"hello": "world"}\n')
+
+        manager = CacheManager(CacheConfig(backend="memory"))
+        await manager.initialize()
+        with pytest.raises(ValueError):
+            await manager.import_snapshot(str(path))
+
+    @pytest.mark.asyncio
+    async def test_redis_bulk_set_is_pipelined(self):
+        """Test warmup sends all Redis writes in one pipeline round trip."""
+        manager = CacheManager(CacheConfig(backend="memory"))
+        await manager.initialize()
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        pipe_context = MagicMock()
+        pipe_context.__aenter__ = AsyncMock(return_value=pipe)
+        pipe_context.__aexit__ = AsyncMock(return_value=False)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe_context
+        manager._backend = redis
+        manager._backend_type = "redis"
+
+        properties = [{"listing_id": f"PHX-{i}"} for i in range(5)]
+        await manager.warmup(properties, [{"price": i} for i in range(5)], "extraction")
+
+        assert pipe.setex.call_count == 5
+        assert pipe.sadd.call_count == 5
+        pipe.execute.assert_awaited_once()
+
+
 class TestLRUCache:
     """Test LRU cache implementation."""
 
@@ -303,6 +437,320 @@ class TestLRUCache:
         assert cache.size() == 1
         assert cache.memory_used > 0
 
+    def test_size_is_exact_stored_bytes(self):
+        """Test accounted size equals the stored blob length."""
+        cache = LRUCache(max_size=10)
+
+        size = cache.put("key1", {"price": 350000, "beds": 3})
+        assert size == len(b'{"price":350000,"beds":3}')
+        assert cache.memory_used == size
+        assert cache.get_with_size("key1") == ({"price": 350000, "beds": 3}, size)
+
+        cache.put("key1", "short")
+        assert cache.memory_used == len(b'"short"')
+
+    def test_compressed_values(self):
+        """Test compression lets the same budget hold more entries."""
+        value = {"description": "Beautiful home with pool " * 40}
+        plain = LRUCache(max_size=1000, max_memory_mb=0.01)
+        compressed = LRUCache(max_size=1000, max_memory_mb=0.01, compression=True)
+
+        for i in range(50):
+            plain.put(f"key{i}", value)
+            compressed.put(f"key{i}", value)
+
+        assert compressed.size() > plain.size() * 3
+        assert compressed.get("key49") == value
+
+    def test_delete_frees_slot(self):
+        """Test delete removes the entry instead of caching None."""
+        cache = LRUCache(max_size=10)
+        cache.put("key1", "value1")
+
+        assert cache.delete("key1") is True
+        assert cache.delete("key1") is False
+        assert cache.size() == 0
+        assert cache.memory_used == 0
+
+    @pytest.mark.parametrize(
+        "policy, evicted",
+        [("lru", "key3"), ("fifo", "key1"), ("lfu", "key2")],
+    )
+    def test_eviction_policies(self, policy, evicted):
+        """Test each policy picks the expected victim."""
+        cache = LRUCache(max_size=3, eviction_policy=policy)
+        cache.put("key1", "value1")
+        cache.put("key2", "value2")
+        cache.put("key3", "value3")
+        for key in ("key3", "key3", "key1", "key1", "key2"):
+            cache.get(key)
+
+        cache.put("key4", "value4")
+
+        assert cache.get(evicted) is None
+        assert cache.size() == 3
+
+    def test_lfu_aging(self):
+        """Test aging lets a formerly hot key be evicted."""
+        policy = create_eviction_policy("lfu", capacity=1)
+        policy.on_insert("old")
+        for _ in range(9):
+            policy.on_hit("old")  # Ages to half after 10 hits
+        policy.on_insert("new")
+        policy.on_hit("old")
+        for _ in range(5):
+            policy.on_hit("new")
+
+        assert policy.victim() == "old"
+
+    def test_tinylfu_resists_scans(self):
+        """Test W-TinyLFU keeps hot keys through one-hit scans better than LRU."""
+        hit_rates = {}
+        for policy in ("lru", "tinylfu"):
+            cache = LRUCache(max_size=100, eviction_policy=policy)
+            hits = lookups = 0
+            scan_key = 0
+            for _ in range(30):
+                for i in range(80):
+                    key = f"hot{i}"
+                    lookups += 1
+                    if cache.get(key) is None:
+                        cache.put(key, i)
+                    else:
+                        hits += 1
+                for _ in range(100):
+                    scan_key += 1
+                    cache.put(f"scan{scan_key}", scan_key)
+            hit_rates[policy] = hits / lookups
+
+        assert hit_rates["tinylfu"] > hit_rates["lru"] + 0.5
+
+    def test_non_json_values(self):
+        """Test values JSON cannot represent still round-trip."""
+        cache = LRUCache(max_size=10)
+        cache.put("key1", {1, 2, 3})
+        assert cache.get("key1") == {1, 2, 3}
+
+    def test_values_json_would_alter_round_trip_exactly(self):
+        """Test int dict keys and tuples come back unchanged, not as strings and lists."""
+        cache = LRUCache(max_size=10)
+        value = {"counts": {1: "one", 2: "two"}, "point": (1.5, 2.5), "tags": ["a"]}
+
+        cache.put("key1", value)
+
+        cached = cache.get("key1")
+        assert cached == value
+        assert isinstance(cached["point"], tuple)
+        assert list(cached["counts"]) == [1, 2]
+
+
+class TestDiskCache:
+    """Test persistent disk cache tier."""
+
+    def test_persists_across_reopen(self, tmp_path):
+        """Test entries survive closing and reopening the database."""
+        path = tmp_path / "cache.sqlite3"
+        cache = DiskCache(str(path))
+        cache.open()
+        cache.put("key1", {"value": 1})
+        cache.close()
+
+        reopened = DiskCache(str(path))
+        reopened.open()
+        assert reopened.get("key1") == {"value": 1}
+        assert reopened.bytes_used > 0
+        reopened.close()
+
+    def test_ttl_expiration_and_compaction(self, tmp_path):
+        """Test expired entries are not returned and are compacted away."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+        cache.open()
+        cache.put("short", {"value": 1}, ttl_seconds=0)
+        cache.put("long", {"value": 2})
+
+        assert cache.get("short") is None
+        cache.put("short2", {"value": 3}, ttl_seconds=0)
+        assert cache.compact() == 1
+        assert cache.size() == 1
+        assert cache.get("long") == {"value": 2}
+        cache.close()
+
+    def test_size_bounded_eviction(self, tmp_path):
+        """Test least recently accessed entries are evicted over the size limit."""
+        cache = DiskCache(
+            str(tmp_path / "cache.sqlite3"), max_size_mb=0.01, compression=False, touch_interval=0
+        )
+        cache.open()
+        payload = "x" * 2000
+
+        cache.put("a", payload)
+        time.sleep(0.01)
+        cache.put("b", payload)
+        time.sleep(0.01)
+        cache.get("a")  # Refresh "a" so "b" is least recently accessed
+        time.sleep(0.01)
+        for i in range(4):
+            cache.put(f"c{i}", payload)
+            time.sleep(0.01)
+
+        assert cache.bytes_used <= cache.max_bytes
+        assert cache.eviction_count > 0
+        assert cache.get("b") is None
+        assert cache.get("c3") == payload
+        cache.close()
+
+    def test_hits_buffer_access_times(self, tmp_path):
+        """Test hits do not write; stale access times are saved with the next write."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), touch_interval=0)
+        cache.open()
+        cache.put("a", {"value": 1})
+        stored_at = cache._conn.execute("SELECT accessed_at FROM cache_entries").fetchone()[0]
+        changes = cache._conn.total_changes
+
+        time.sleep(0.01)
+        assert cache.get("a") == {"value": 1}
+        assert cache._conn.total_changes == changes
+
+        cache.put("b", {"value": 2})
+        accessed_at = cache._conn.execute(
+            "SELECT accessed_at FROM cache_entries WHERE key = 'a'"
+        ).fetchone()[0]
+        assert accessed_at > stored_at
+        cache.close()
+
+    def test_recent_hits_are_not_touched(self, tmp_path):
+        """Test entries accessed within touch_interval keep their access time."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"), touch_interval=60)
+        cache.open()
+        cache.put("a", {"value": 1})
+
+        cache.get("a")
+
+        assert cache._touched == {}
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_manager_disk_tier_survives_restart(self, tmp_path):
+        """Test the disk backend serves entries cached by a previous process."""
+        config = CacheConfig(backend="disk", disk_path=str(tmp_path / "llm.sqlite3"))
+        data = {"price": 350000}
+        prop = {"address": "123 Main St", "listing_id": "PHX-1"}
+
+        first = CacheManager(config)
+        await first.initialize()
+        await first.set(prop, "extraction", data)
+        await first.close()
+
+        second = CacheManager(config)
+        await second.initialize()
+        assert second._backend.size() == 0
+        assert await second.get(prop, "extraction") == data
+        # Promoted into the memory tier
+        assert second._backend.size() == 1
+        assert second.get_metrics()["disk"]["entries"] == 1
+
+        await second.invalidate(prop, "extraction")
+        assert second._disk.size() == 0
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_manager_disk_promotion_keeps_expiry(self, tmp_path):
+        """Test a disk hit promoted to memory expires when the disk entry does."""
+        config = CacheConfig(backend="disk", disk_path=str(tmp_path / "llm.sqlite3"))
+        prop = {"address": "123 Main St", "listing_id": "PHX-1"}
+        manager = CacheManager(config)
+        await manager.initialize()
+        cache_key = manager._generate_cache_key(prop, "extraction")
+        await manager._disk.put_async(cache_key, {"a": 1}, ttl_seconds=5, tag="listing_id:phx-1")
+
+        assert await manager.get(prop, "extraction") == {"a": 1}
+
+        [(key, _, expires_at)] = manager._backend.items()
+        assert key == cache_key
+        assert expires_at <= time.time() + 5
+        assert manager._key_properties[cache_key] == "listing_id:phx-1"
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_manager_disk_invalidate_pattern_after_restart(self, tmp_path):
+        """Test property invalidation reaches entries written by an earlier process."""
+        config = CacheConfig(backend="disk", disk_path=str(tmp_path / "llm.sqlite3"))
+        prop = {"address": "123 Main St", "listing_id": "PHX-1"}
+
+        first = CacheManager(config)
+        await first.initialize()
+        await first.set(prop, "extraction", {"a": 1})
+        await first.set(prop, "validation", {"b": 2})
+        await first.close()
+
+        second = CacheManager(config)
+        await second.initialize()
+        assert await second.invalidate_pattern(prop) == 2
+        assert await second.get(prop, "extraction") is None
+        await second.close()
+
+
+class TestSingleFlight:
+    """Test concurrent call coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test callers with the same key await one call."""
+        flight = SingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        results = await asyncio.gather(*(flight.do("key", work, 21) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert calls == [21]
+        assert flight.get_stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+        # Later calls run again
+        assert await flight.do("key", work, 1) == 2
+        assert flight.executions == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test a failing call raises in every coalesced caller."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.executions == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_after_cancellation(self):
+        """Test cancelling the running call does not cancel waiting callers."""
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+        assert leader.cancelled()
+        assert flight.executions == 2
+
 
 class TestCacheMetrics:
     """Test cache metrics collection."""
@@ -388,3 +836,39 @@ class TestCacheIntegration:
         # Should now have 2 entries in cache
         cache_metrics = cache_manager.get_metrics()
         assert cache_metrics["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_extraction_cache_is_content_addressed(self):
+        """Test structured extraction is served from cache for unchanged content."""
+        from phoenix_real_estate.collectors.processing import OllamaClient
+        from phoenix_real_estate.foundation.config import EnvironmentConfigProvider
+
+        cache_manager = CacheManager(CacheConfig(enabled=True, backend="memory"))
+        await cache_manager.initialize()
+
+        client = OllamaClient(EnvironmentConfigProvider())
+        client._cache_manager = cache_manager
+        client.generate_completion = AsyncMock(
+            return_value='<output>{"street": "123 Main St", "city": "Phoenix"}</output>'
+        )
+        schema = {"street": "string", "city": "string"}
+
+        result1 = await client.extract_structured_data("123 MAIN ST  PHOENIX", schema)
+        assert result1 == {"street": "123 Main St", "city": "Phoenix"}
+        assert client.generate_completion.call_count == 1
+
+        # Mutating the returned dict must not leak into the cache
+        result1["source"] = "maricopa_county"
+
+        # Whitespace-only differences hit the same entry
+        result2 = await client.extract_structured_data("123 MAIN ST PHOENIX\n", schema)
+        assert result2 == {"street": "123 Main St", "city": "Phoenix"}
+        assert client.generate_completion.call_count == 1
+
+        # A different schema is a different cache entry
+        await client.extract_structured_data("123 MAIN ST PHOENIX", {"street": "string"})
+        assert client.generate_completion.call_count == 2
+
+        stats = client.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
@@ -168,6 +168,26 @@ class TestPropertyDataExtractor:
         assert result["source"] == "phoenix_mls"
         assert "extracted_at" in result
 
+    async def test_html_reduced_before_prompt(self, extractor, mock_ollama_client):
+        """Test raw HTML is reduced before being sent to the LLM."""
+        mock_ollama_client.extract_structured_data = AsyncMock(return_value={"price": 450000})
+        noisy_html = (
+            "<html><head><script>" + "var tracking = 1;" * 500 + "</script></head>"
+            "<body><nav>Home | Buy | Sell</nav>" + SAMPLE_PHOENIX_MLS_HTML + "</body></html>"
+        )
+
+        await extractor.extract_from_html(noisy_html, source="phoenix_mls")
+
+        content = mock_ollama_client.extract_structured_data.call_args.kwargs["content"]
+        assert "tracking" not in content
+        assert "Home | Buy" not in content
+        assert "123 Main St, Phoenix, AZ 85033" in content
+
+        stats = extractor.get_reduction_stats()
+        assert stats["pages"] == 1
+        assert stats["reduced_tokens"] < stats["original_tokens"]
+        assert stats["reduction_ratio"] > 0.5
+
     # Maricopa County extraction tests
     async def test_extract_maricopa_data(self, extractor, mock_ollama_client):
         """Test extraction from Maricopa County JSON."""
@@ -193,6 +213,90 @@ class TestPropertyDataExtractor:
         assert result["source"] == "maricopa_county"
         assert "extracted_at" in result
 
+    async def test_maricopa_address_parsed_without_llm(self, extractor, mock_ollama_client):
+        """Test that regular county addresses are split without an LLM call."""
+        mock_ollama_client.extract_structured_data = AsyncMock()
+
+        result = await extractor.extract_from_json(SAMPLE_MARICOPA_JSON, source="maricopa_county")
+
+        mock_ollama_client.extract_structured_data.assert_not_called()
+        assert result["address"] == {
+            "street": "123 Main St",
+            "city": "Phoenix",
+            "state": "AZ",
+            "zip_code": "85033",
+        }
+        assert extractor.get_address_parsing_stats()["rule_based"] == 1
+
+    async def test_maricopa_address_llm_fallback(self, extractor, mock_ollama_client):
+        """Test that unparseable addresses still go to the LLM."""
+        mock_address = {
+            "street": "Lot 7 Tonto Rd",
+            "city": "Cave Creek",
+            "state": "AZ",
+            "zip_code": "85331",
+        }
+        mock_ollama_client.extract_structured_data = AsyncMock(return_value=mock_address)
+        json_data = dict(SAMPLE_MARICOPA_JSON, property_address="LOT 7 TONTO RD NEAR CAVE CREEK")
+
+        result = await extractor.extract_from_json(json_data, source="maricopa_county")
+
+        mock_ollama_client.extract_structured_data.assert_called_once()
+        assert result["address"] == mock_address
+        stats = extractor.get_address_parsing_stats()
+        assert stats["llm_fallback"] == 1
+        assert stats["rule_based"] == 0
+
+    async def test_batch_json_shares_llm_prompt(self, extractor, mock_ollama_client):
+        """Test unparseable addresses in a JSON batch share one batched LLM call."""
+        addresses = ["LOT 7 TONTO RD NEAR CAVE CREEK", "PARCEL 12 OFF HWY 60"]
+        mock_ollama_client.extract_structured_data = AsyncMock()
+        mock_ollama_client.extract_structured_data_batch = AsyncMock(
+            return_value=[{"city": "Cave Creek"}, {"city": "Gold Canyon"}]
+        )
+        items = [dict(SAMPLE_MARICOPA_JSON, property_address=address) for address in addresses]
+        items.append(SAMPLE_MARICOPA_JSON)
+
+        results = await extractor.extract_batch(
+            items, source="maricopa_county", content_type="json"
+        )
+
+        mock_ollama_client.extract_structured_data_batch.assert_called_once()
+        assert mock_ollama_client.extract_structured_data_batch.call_args[0][0] == addresses
+        mock_ollama_client.extract_structured_data.assert_not_called()
+        assert [result["address"]["city"] for result in results] == [
+            "Cave Creek",
+            "Gold Canyon",
+            "Phoenix",
+        ]
+        stats = extractor.get_address_parsing_stats()
+        assert stats["llm_batched"] == 2
+        assert stats["rule_based"] == 1
+
+    async def test_prefetched_addresses_are_scoped_to_their_batch(
+        self, extractor, mock_ollama_client
+    ):
+        """Test overlapping batches keep their own results and repeats reuse them."""
+        addresses = ["LOT 7 TONTO RD NEAR CAVE CREEK", "PARCEL 12 OFF HWY 60"]
+        mock_ollama_client.extract_structured_data = AsyncMock()
+        mock_ollama_client.extract_structured_data_batch = AsyncMock(
+            return_value=[{"city": "Cave Creek"}, {"city": "Gold Canyon"}]
+        )
+        items = [dict(SAMPLE_MARICOPA_JSON, property_address=address) for address in addresses]
+
+        prefetched = await extractor.prefetch_batch(items, "maricopa_county")
+        # Another batch finishing in between must not affect this one
+        await extractor.extract_batch([], source="maricopa_county", content_type="json")
+
+        for item in (items[0], items[0], items[1]):
+            result = await extractor.extract_from_json(
+                item, "maricopa_county", prefetched_addresses=prefetched
+            )
+            assert result["address"] == prefetched[item["property_address"]]
+
+        mock_ollama_client.extract_structured_data.assert_not_called()
+        assert extractor.get_address_parsing_stats()["llm_batched"] == 3
+
     # Prompt engineering tests
     async def test_get_extraction_prompt(self, extractor):
         """Test prompt generation for different content types."""
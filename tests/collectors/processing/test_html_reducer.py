@@ -0,0 +1,80 @@
+"""Tests for HTML pre-reduction before LLM extraction."""
+
+from phoenix_real_estate.collectors.processing.html_reducer import HTMLReducer, estimate_tokens
+
+
+LISTING_HTML = """
+<html>
+<head><title>Listing</title><script>window.tracking = {};</script><style>.a{}</style></head>
+<body>
+    <nav><a href="/login">Sign In</a><a href="/calc">Mortgage Calculator</a></nav>
+    <div class="property-details">
+        <h1>$450,000 - 4BR/3BA Single Family Home</h1>
+        <div class="address">123 Main St, Phoenix, AZ 85033</div>
+        <div class="specs">
+            <span>2,500 sq ft</span>
+            <span>Built 2005</span>
+        </div>
+        <div class="description">Beautiful move-in ready home with pool.</div>
+    </div>
+    <!-- analytics -->
+    <script>%s</script>
+    <footer>Copyright Example Realty</footer>
+</body>
+</html>
+""" % ("var x = 1;" * 2000)
+
+
+class TestHTMLReducer:
+    """Test suite for HTMLReducer."""
+
+    def test_strips_non_content_markup(self):
+        """Scripts, styles, navigation and footers never reach the prompt."""
+        result = HTMLReducer().reduce(LISTING_HTML)
+
+        assert "tracking" not in result.text
+        assert "var x" not in result.text
+        assert "Sign In" not in result.text
+        assert "Mortgage Calculator" not in result.text
+        assert "Copyright" not in result.text
+        assert "analytics" not in result.text
+
+    def test_keeps_listing_regions(self):
+        """Listing facts are summarized with their region labels."""
+        result = HTMLReducer().reduce(LISTING_HTML)
+
+        assert "address: 123 Main St, Phoenix, AZ 85033" in result.text
+        assert "sqft: 2,500 sq ft" in result.text
+        assert "$450,000" in result.text
+        assert "Built 2005" in result.text
+        assert "pool" in result.text
+        assert not result.used_fallback
+        # Nested regions are not repeated by their containers
+        assert result.text.count("123 Main St") == 1
+
+    def test_reports_token_sizes(self):
+        """Before/after token sizes reflect the reduction."""
+        result = HTMLReducer().reduce(LISTING_HTML)
+
+        assert result.original_tokens == estimate_tokens(LISTING_HTML)
+        assert result.reduced_tokens == estimate_tokens(result.text)
+        assert result.reduced_tokens * 10 < result.original_tokens
+        assert result.reduction_ratio > 0.9
+
+    def test_falls_back_to_page_text(self):
+        """Pages without known regions fall back to their visible text."""
+        result = HTMLReducer().reduce("<body><p>3 bed home for $300,000</p></body>")
+
+        assert result.used_fallback
+        assert result.text == "3 bed home for $300,000"
+
+    def test_truncates_to_max_chars(self):
+        """Reduced text is capped at max_chars."""
+        result = HTMLReducer(max_chars=20).reduce(LISTING_HTML)
+        assert len(result.text) == 20
+
+    def test_empty_content(self):
+        """Empty content yields an empty reduction."""
+        result = HTMLReducer().reduce("")
+        assert result.text == ""
+        assert result.reduced_tokens == 0
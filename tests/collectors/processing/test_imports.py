@@ -21,3 +21,15 @@ def test_module_version():
 
     assert hasattr(processing, "__version__")
     assert processing.__version__ == "0.1.0"
+
+
+def test_module_does_not_import_scraper():
+    """Test processing can be imported without the Playwright-based scraper."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import phoenix_real_estate.collectors.processing; "
+        "sys.exit('phoenix_real_estate.collectors.phoenix_mls.scraper' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
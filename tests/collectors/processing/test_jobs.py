@@ -0,0 +1,93 @@
+"""Tests for batch job tracking."""
+
+import asyncio
+import time
+
+import pytest
+
+from phoenix_real_estate.collectors.processing.jobs import JobRegistry
+
+
+class TestProcessingJob:
+    """Test suite for ProcessingJob."""
+
+    def test_progress_and_completion(self):
+        """Test a job completes once sealed and every item has a result."""
+        job = JobRegistry().create()
+        first, second = job.add_item(), job.add_item()
+        assert job.status == "receiving"
+
+        job.record(first, result={"property_id": "p1"})
+        job.seal()
+        assert job.status == "processing"
+        assert not job.done
+
+        job.record(second, error="LLM timeout")
+        summary = job.summary()
+        assert job.done
+        assert summary["status"] == "completed"
+        assert summary["succeeded"] == 1
+        assert summary["failed"] == 1
+        assert summary["finished_at"] is not None
+        assert job.results[1] == {"index": 1, "status": "failed", "error": "LLM timeout"}
+
+    @pytest.mark.asyncio
+    async def test_stream_follows_until_done(self):
+        """Test following a stream yields results as they arrive until completion."""
+        job = JobRegistry().create()
+        for _ in range(3):
+            job.add_item()
+        job.seal()
+        job.record(0, result={"n": 0})
+
+        async def finish():
+            for index in (1, 2):
+                await asyncio.sleep(0.01)
+                job.record(index, result={"n": index})
+
+        finisher = asyncio.create_task(finish())
+        streamed = [result["index"] async for result in job.stream_results(follow=True)]
+        await finisher
+
+        assert streamed == [0, 1, 2]
+        assert [r["index"] async for r in job.stream_results()] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_results_are_capped(self):
+        """Test only the latest results are kept and dropped ones are counted."""
+        job = JobRegistry(max_results_per_job=2).create()
+        for index in range(5):
+            job.record(job.add_item(), result={"n": index})
+        job.seal()
+
+        assert [r["index"] async for r in job.stream_results()] == [3, 4]
+        assert job.summary()["results_dropped"] == 3
+        assert job.succeeded == 5
+        assert job.done
+
+
+class TestJobRegistry:
+    """Test suite for JobRegistry."""
+
+    def test_expires_finished_jobs_and_bounds_size(self):
+        """Test finished jobs expire after retention and the oldest are dropped."""
+        registry = JobRegistry(max_jobs=2, retention_seconds=60)
+        finished = registry.create()
+        finished.seal()
+        finished.finished_at = time.time() - 120
+
+        active = registry.create()
+        assert registry.get(finished.job_id) is None
+        assert registry.get(active.job_id) is active
+
+        newer = registry.create()
+        registry.create()
+        assert registry.get(active.job_id) is None
+        assert registry.get(newer.job_id) is newer
+        assert len(registry) == 2
+
+    def test_record_unknown_job_is_ignored(self):
+        """Test results for expired jobs are dropped without error."""
+        registry = JobRegistry()
+        registry.record("missing", 0, result={"n": 0})
+        assert registry.get("missing") is None
@@ -2,7 +2,7 @@
 
 This test suite follows TDD principles and provides complete test coverage for:
 - All public methods (health_check, llm_health_check, metrics_handler, process_property)
-- Worker functionality (_process_worker)
+- Worker functionality (_process_item)
 - Startup and shutdown sequences
 - Error handling and edge cases
 - Signal handling and graceful shutdown
@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 
 import pytest
 from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
 from prometheus_client import CONTENT_TYPE_LATEST
 
 from phoenix_real_estate.collectors.processing.service import LLMProcessingService
@@ -101,7 +102,10 @@ class TestLLMProcessingService:
         """Create mock configuration."""
         config = Mock(spec=EnvironmentConfigProvider)
         config.get = Mock(return_value="test_value")
-        config.get_typed = Mock(return_value=30)
+        typed_values = {"PROCESSING_QUEUE_SIZE": 37}
+        config.get_typed = Mock(
+            side_effect=lambda name, *args, **kwargs: typed_values.get(name, 30)
+        )
         return config
 
     @pytest.fixture
@@ -124,11 +128,6 @@ class TestLLMProcessingService:
         service.health_service = MockHealthCheckService()
         service.running = True
 
-        # Create mock workers
-        service.workers = [Mock() for _ in range(2)]
-        for worker in service.workers:
-            worker.done = Mock(return_value=False)
-
         return service
 
     def test_init(self, mock_config):
@@ -155,8 +154,9 @@ class TestLLMProcessingService:
             assert service.running is False
             assert isinstance(service.shutdown_event, asyncio.Event)
             assert isinstance(service.processing_queue, asyncio.Queue)
-            assert service.processing_queue.maxsize == 100
-            assert service.workers == []
+            # Sized from PROCESSING_QUEUE_SIZE
+            assert service.processing_queue.maxsize == 37
+            assert service.worker_pool is None
 
     def test_init_with_config_path(self):
         """Test service initialization with config path."""
@@ -321,6 +321,20 @@ class TestLLMProcessingService:
                 {"source": "test_source", "data": {"property": "test"}}
             )
 
+    @pytest.mark.asyncio
+    async def test_process_property_strips_job_fields(self, started_service):
+        """Test a /process body cannot attach its result to a batch job."""
+        request = Mock()
+        request.json = AsyncMock(
+            return_value={"source": "test", "data": {}, "job_id": "other-job", "job_index": 3}
+        )
+        started_service.processing_queue.put = AsyncMock()
+
+        response = await started_service.process_property(request)
+
+        assert response.status == 200
+        started_service.processing_queue.put.assert_called_once_with({"source": "test", "data": {}})
+
     @pytest.mark.asyncio
     async def test_process_property_no_source(self, started_service):
         """Test property processing request without source."""
@@ -357,16 +371,70 @@ class TestLLMProcessingService:
             mock_counter.labels.assert_called_once_with(source="unknown", status="error")
             mock_counter.labels.return_value.inc.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_batch_and_job_status(self, started_service):
+        """Test an NDJSON batch is queued as a job whose results stream back."""
+        started_service.processing_integrator.process_property = AsyncMock(
+            side_effect=[{"property_id": "p1"}, Exception("LLM timeout")]
+        )
+        started_service.db_client.properties.insert_one = AsyncMock()
+        body = (
+            b'{"source": "phoenix_mls", "data": {"n": 1}}\n'
+            b"not json\n"
+            b"\n"
+            b'{"source": "maricopa_county", "data": {"n": 2}}'
+        )
+
+        async with TestClient(TestServer(started_service.app)) as client:
+            response = await client.post("/process/batch", data=body)
+            assert response.status == 202
+            lines = [json.loads(line) for line in (await response.text()).splitlines()]
+            # The job id is sent before the upload is read
+            assert lines[0]["status"] == "receiving"
+            assert lines[0]["job_id"] == response.headers["X-Job-Id"]
+            job = lines[-1]
+            assert job["job_id"] == lines[0]["job_id"]
+            assert "error" not in job
+            assert job["total"] == 2
+            assert job["rejected"] == 1
+            assert job["status"] == "processing"
+
+            while not started_service.processing_queue.empty():
+                await started_service._process_item(started_service.processing_queue.get_nowait())
+
+            response = await client.get(f"/jobs/{job['job_id']}?follow=true")
+            assert response.content_type == "application/x-ndjson"
+            lines = [json.loads(line) for line in (await response.text()).splitlines()]
+
+            assert lines[0]["type"] == "summary"
+            results = {line["index"]: line for line in lines if line["type"] == "result"}
+            assert results[0]["result"] == {"property_id": "p1"}
+            assert results[1]["error"] == "LLM timeout"
+            assert lines[-1]["status"] == "completed"
+            assert lines[-1]["succeeded"] == 1
+
+            response = await client.get("/jobs/unknown")
+            assert response.status == 404
+
+    @pytest.mark.asyncio
+    async def test_process_batch_seals_job_when_client_disconnects(self, started_service):
+        """Test a batch whose response cannot be written still ends up sealed."""
+        with patch.object(
+            web.StreamResponse, "prepare", AsyncMock(side_effect=ConnectionResetError)
+        ):
+            with pytest.raises(ConnectionResetError):
+                await started_service.process_batch(Mock())
+
+        (job,) = started_service.jobs._jobs.values()
+        assert job.sealed
+        assert job.done
+        assert job.finished_at is not None
+
     @pytest.mark.asyncio
     async def test_process_worker_success(self, started_service):
         """Test worker processing items successfully."""
-        # Create test queue with item
         test_item = {"source": "test_source", "data": {"property": "test"}}
 
-        # Mock queue operations
-        started_service.processing_queue.get = AsyncMock(return_value=test_item)
-        started_service.running = True
-
         # Mock processing integrator
         started_service.processing_integrator.process_property = AsyncMock(
             return_value={"processed": True, "source": "test_source"}
@@ -375,10 +443,6 @@ class TestLLMProcessingService:
         # Mock database insertion
         started_service.db_client.properties.insert_one = AsyncMock()
 
-        # Create a worker task that will process one item then stop
-        async def run_worker():
-            await started_service._process_worker(0)
-
         with (
             patch(
                 "phoenix_real_estate.collectors.processing.service.processing_duration"
@@ -386,29 +450,11 @@ class TestLLMProcessingService:
             patch(
                 "phoenix_real_estate.collectors.processing.service.processing_requests"
             ) as mock_counter,
-            patch("asyncio.wait_for") as mock_wait_for,
         ):
-            # Setup mocks
-            mock_wait_for.side_effect = [
-                test_item,
-                asyncio.TimeoutError(),
-            ]  # First call returns item, second times out
             mock_histogram.labels.return_value.time.return_value.__enter__ = Mock()
             mock_histogram.labels.return_value.time.return_value.__exit__ = Mock()
 
-            # Start worker and let it run briefly
-            worker_task = asyncio.create_task(run_worker())
-            await asyncio.sleep(0.01)  # Let worker start
-            started_service.running = False  # Stop worker
-
-            try:
-                await asyncio.wait_for(worker_task, timeout=1.0)
-            except asyncio.TimeoutError:
-                worker_task.cancel()
-                try:
-                    await worker_task
-                except asyncio.CancelledError:
-                    pass
+            await started_service._process_item(test_item)
 
             # Verify processing was called
             started_service.processing_integrator.process_property.assert_called_once_with(
@@ -428,17 +474,11 @@ class TestLLMProcessingService:
         """Test worker handling processing failures."""
         test_item = {"source": "test_source", "data": {"should_fail": True}}
 
-        started_service.processing_queue.get = AsyncMock(return_value=test_item)
-        started_service.running = True
-
         # Mock processing failure
         started_service.processing_integrator.process_property = AsyncMock(
             side_effect=Exception("Processing failed")
         )
 
-        async def run_worker():
-            await started_service._process_worker(0)
-
         with (
             patch(
                 "phoenix_real_estate.collectors.processing.service.processing_duration"
@@ -446,24 +486,11 @@ class TestLLMProcessingService:
             patch(
                 "phoenix_real_estate.collectors.processing.service.processing_requests"
             ) as mock_counter,
-            patch("asyncio.wait_for") as mock_wait_for,
         ):
-            mock_wait_for.side_effect = [test_item, asyncio.TimeoutError()]
             mock_histogram.labels.return_value.time.return_value.__enter__ = Mock()
             mock_histogram.labels.return_value.time.return_value.__exit__ = Mock()
 
-            worker_task = asyncio.create_task(run_worker())
-            await asyncio.sleep(0.01)
-            started_service.running = False
-
-            try:
-                await asyncio.wait_for(worker_task, timeout=1.0)
-            except asyncio.TimeoutError:
-                worker_task.cancel()
-                try:
-                    await worker_task
-                except asyncio.CancelledError:
-                    pass
+            await started_service._process_item(test_item)
 
             # Verify error metrics
             mock_counter.labels.assert_called_with(source="test_source", status="error")
@@ -2,10 +2,12 @@
 
 import pytest
 import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 from aiohttp import ClientError
 
 from phoenix_real_estate.collectors.processing import OllamaClient
+from phoenix_real_estate.collectors.processing.llm_client import OutputStreamDetector
 from phoenix_real_estate.foundation import ConfigProvider
 
 
@@ -225,3 +227,269 @@ class TestOllamaClient:
             )
 
             assert result is None
+
+    @pytest.mark.asyncio
+    async def test_extract_structured_data_batch(self, ollama_client):
+        """Test several records are extracted from one batched prompt."""
+        mock_llm_response = """<output index="0">{"city": "Phoenix"}</output>
+<output index="1">{"city": "Tempe"}</output>
+<output index="2">{"city": "Mesa"}</output>"""
+
+        with patch.object(ollama_client, "generate_completion") as mock_gen:
+            mock_gen.return_value = mock_llm_response
+
+            results = await ollama_client.extract_structured_data_batch(
+                ["addr one", "addr two", "addr three"], {"city": "string"}
+            )
+
+            assert results == [{"city": "Phoenix"}, {"city": "Tempe"}, {"city": "Mesa"}]
+            assert mock_gen.call_count == 1
+            prompt = mock_gen.call_args[0][0]
+            assert '<record index="2">' in prompt
+
+    @pytest.mark.asyncio
+    async def test_extract_structured_data_batch_retries_missing(self, ollama_client):
+        """Test records dropped from a batched response are retried on their own."""
+        with patch.object(ollama_client, "generate_completion") as mock_gen:
+            mock_gen.side_effect = [
+                '<output index="0">{"city": "Phoenix"}</output>\n<output index="1">{bad}</output>',
+                '<output>{"city": "Tempe"}</output>',
+            ]
+
+            results = await ollama_client.extract_structured_data_batch(
+                ["addr one", "addr two"], {"city": "string"}
+            )
+
+            assert results == [{"city": "Phoenix"}, {"city": "Tempe"}]
+            assert mock_gen.call_count == 2
+            assert "addr two" in mock_gen.call_args[0][0]
+            assert "<record" not in mock_gen.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_completions_are_coalesced(self, ollama_client):
+        """Test concurrent identical prompts share one model request."""
+        release = asyncio.Event()
+
+        async def slow_completion(*args):
+            await release.wait()
+            return "shared"
+
+        with patch.object(
+            ollama_client, "_generate_completion_impl", side_effect=slow_completion
+        ) as mock_impl:
+            tasks = [
+                asyncio.create_task(ollama_client.generate_completion("Same prompt"))
+                for _ in range(5)
+            ]
+            other = asyncio.create_task(ollama_client.generate_completion("Other prompt"))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await asyncio.gather(*tasks) == ["shared"] * 5
+            assert await other == "shared"
+            assert mock_impl.call_count == 2
+            assert ollama_client.get_cache_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions_get_independent_results(self, ollama_client):
+        """Test coalesced extractions return copies callers can modify."""
+
+        async def slow_completion(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return '<output>{"city": "Phoenix"}</output>'
+
+        with patch.object(
+            ollama_client, "generate_completion", side_effect=slow_completion
+        ) as mock_gen:
+            first, second = await asyncio.gather(
+                ollama_client.extract_structured_data("same listing", {"city": "string"}),
+                ollama_client.extract_structured_data("same listing", {"city": "string"}),
+            )
+
+            assert mock_gen.call_count == 1
+            first["city"] = "Changed"
+            assert second == {"city": "Phoenix"}
+
+    @pytest.mark.asyncio
+    async def test_streaming_stops_after_complete_output(self, ollama_client):
+        """Test streamed generation is cancelled once the JSON output is complete."""
+        import json
+        from unittest.mock import Mock
+
+        tokens = ['<output>{"city": ', '"Phoenix"}', "</output>", " Note:", " the city", " is..."]
+
+        async def stream_lines():
+            for token in tokens:
+                yield (json.dumps({"response": token, "done": False}) + "\n").encode()
+
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.content = stream_lines()
+
+        with patch("aiohttp.ClientSession.post") as mock_post:
+            mock_post.return_value.__aenter__.return_value = mock_response
+
+            result = await ollama_client.generate_completion(
+                "Test prompt", stop_detector=OutputStreamDetector(1, {"city": "string"})
+            )
+
+            assert result == '<output>{"city": "Phoenix"}</output>'
+            assert mock_post.call_args[1]["json"]["stream"] is True
+            mock_response.close.assert_called_once()
+
+
+class TestOutputStreamDetector:
+    """Test suite for the incremental output detector."""
+
+    def test_detects_output_split_across_chunks(self):
+        """Test tags and objects split at arbitrary chunk boundaries."""
+        detector = OutputStreamDetector(1, {"price": "number"})
+        text = (
+            "Sure! <out"
+            + 'put>{"price": 1, "note": "a } in <output> text"'
+            + "}</out"
+            + "put> more"
+        )
+        chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+
+        completed_at = None
+        for index, chunk in enumerate(chunks):
+            if detector.feed(chunk):
+                completed_at = index
+                break
+
+        assert completed_at is not None
+        consumed = "".join(chunks[: completed_at + 1])
+        assert "</output>" in consumed
+        assert "more" not in consumed
+
+    def test_ignores_invalid_and_off_schema_objects(self):
+        """Test only parseable objects with schema fields count as complete."""
+        detector = OutputStreamDetector(1, {"price": "number"})
+
+        assert not detector.feed("<output>{invalid}</output>")
+        assert not detector.feed('<output>{"other": 1}</output>')
+        assert detector.feed('<output>{"price": 2}</output>')
+
+    def test_object_after_empty_output_is_ignored(self):
+        """Test JSON after an output block without an object is not counted."""
+        detector = OutputStreamDetector(1, {"price": "number"})
+
+        assert not detector.feed("<output>no listing data</outp")
+        assert not detector.feed('ut> For example: {"price": 1}')
+        assert detector.feed('<output>{"price": 2}</output>')
+
+    def test_waits_for_all_batched_outputs(self):
+        """Test batched responses complete only after every indexed output."""
+        detector = OutputStreamDetector(2, {"city": "string"})
+
+        assert not detector.feed('<output index="0">{"city": "Mesa"}</output>')
+        assert detector.feed('<output index="1">{"city": "Tempe"}</output>')
+
+
+class TestOllamaEndpointPool:
+    """Test suite for multi-endpoint routing."""
+
+    @pytest.fixture
+    def pool_config(self):
+        """Create configuration with two Ollama endpoints."""
+        from unittest.mock import Mock
+
+        config = Mock(spec=ConfigProvider)
+        config.get = Mock(
+            side_effect=lambda key, default=None: {
+                "OLLAMA_BASE_URLS": "http://localhost:11434, http://localhost:11435/",
+                "LLM_MODEL": "llama3.2:latest",
+            }.get(key, default)
+        )
+        config.get_typed = Mock(
+            side_effect=lambda key, type_cls, default=None: {
+                "OLLAMA_MAX_FAILURES": 2,
+                "OLLAMA_EJECTION_SECONDS": 60.0,
+            }.get(key, default)
+        )
+        return config
+
+    @pytest.mark.asyncio
+    async def test_endpoints_parsed_from_config(self, pool_config):
+        """Test endpoint list parsing and primary base URL."""
+        client = OllamaClient(pool_config)
+
+        assert [stats["url"] for stats in client.get_endpoint_stats()] == [
+            "http://localhost:11434",
+            "http://localhost:11435",
+        ]
+        assert client.base_url == "http://localhost:11434"
+
+    @pytest.mark.asyncio
+    async def test_routes_to_least_outstanding_endpoint(self, pool_config):
+        """Test concurrent requests are spread across endpoints."""
+        client = OllamaClient(pool_config)
+
+        async with client._use_endpoint() as first:
+            async with client._use_endpoint() as second:
+                assert first.url != second.url
+                assert first.outstanding == 1
+                assert second.outstanding == 1
+
+        assert all(stats["outstanding"] == 0 for stats in client.get_endpoint_stats())
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_is_ejected(self, pool_config):
+        """Test repeated failures remove an endpoint from routing."""
+        client = OllamaClient(pool_config)
+        failing = client._endpoints[0]
+
+        for _ in range(2):
+            with pytest.raises(ClientError):
+                async with client._use_endpoint() as endpoint:
+                    assert endpoint is failing
+                    raise ClientError("Connection refused")
+            # Keep the healthy endpoint busier so the failing one is picked again
+            client._endpoints[1].total_requests += 1
+
+        stats = client.get_endpoint_stats()
+        assert stats[0]["available"] is False
+        assert stats[1]["available"] is True
+        async with client._use_endpoint() as endpoint:
+            assert endpoint is client._endpoints[1]
+
+    @pytest.mark.asyncio
+    async def test_health_check_ejects_unhealthy_endpoint(self, pool_config):
+        """Test health checks eject down endpoints but report overall health."""
+        client = OllamaClient(pool_config)
+
+        async def probe(base_url):
+            return base_url.endswith("11435")
+
+        with patch.object(client, "_probe_endpoint", side_effect=probe):
+            assert await client.health_check() is True
+
+        stats = client.get_endpoint_stats()
+        assert stats[0]["available"] is False
+        assert stats[1]["available"] is True
+
+    @pytest.mark.asyncio
+    async def test_expired_ejection_probed_once(self, pool_config):
+        """Test concurrent requests share one health probe of a re-admitted endpoint."""
+        client = OllamaClient(pool_config)
+        ejected = client._endpoints[0]
+        ejected.ejected_until = time.monotonic() - 1
+        probe_started = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def probe(base_url):
+            probe_started.set()
+            await release_probe.wait()
+            return True
+
+        with patch.object(client, "_probe_endpoint", side_effect=probe) as mock_probe:
+            first = asyncio.create_task(client._select_endpoint())
+            await probe_started.wait()
+            # Routed around the endpoint while its probe is in flight
+            assert await client._select_endpoint() is client._endpoints[1]
+            release_probe.set()
+            await first
+
+        mock_probe.assert_called_once()
+        assert ejected.is_available(time.monotonic())
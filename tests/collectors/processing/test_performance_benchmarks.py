@@ -13,6 +13,7 @@ from phoenix_real_estate.collectors.processing.performance import (
     BenchmarkResult,
     PerformanceOptimizer,
     BatchSizeOptimizer,
+    AdaptiveConcurrencyLimiter,
 )
 from phoenix_real_estate.foundation.config import get_config
 
@@ -385,3 +386,73 @@ class TestBenchmarkResult:
         assert comparison["avg_improvement_percent"] > 40  # >40% improvement
         assert comparison["p95_improvement_percent"] > 30  # >30% improvement at p95
         assert comparison["is_improvement"] is True
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limits_in_flight_work(self):
+        """Test the limiter bounds concurrency like a semaphore."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, adaptive=False)
+        active = 0
+        max_active = 0
+
+        async def work():
+            nonlocal active, max_active
+            async with limiter:
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert max_active == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_when_saturated_and_fast(self):
+        """Test additive increase while saturated and latency stays at baseline."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        for _ in range(10):
+            limiter.record_sample(0.5)
+
+        assert limiter.limit == 3
+        # Growth frees a slot immediately
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_limit_does_not_grow_when_idle(self):
+        """Test unused capacity is not expanded."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        for _ in range(20):
+            limiter.record_sample(0.5)
+
+        assert limiter.limit == 4
+
+    def test_limit_shrinks_on_errors(self):
+        """Test multiplicative decrease on errors, bounded by the minimum."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, min_limit=2)
+
+        limiter.record_sample(1.0, success=False)
+        assert limiter.limit == 7
+
+        for _ in range(20):
+            limiter.record_sample(1.0, success=False)
+        assert limiter.limit == 2
+
+    def test_limit_shrinks_on_latency_inflation(self):
+        """Test latency far above baseline shrinks the limit once per interval."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+        limiter.record_sample(0.1)
+        for _ in range(20):
+            limiter.record_sample(2.0)
+
+        assert limiter.limit == 7
+        assert limiter.get_stats()["decreases"] == 1
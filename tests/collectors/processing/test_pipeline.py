@@ -196,6 +196,53 @@ class TestDataProcessingPipeline:
         )
         mock_validator.validate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_tiered_extraction_skips_llm_when_parser_succeeds(
+        self, pipeline, mock_extractor, mock_validator, sample_validation_result
+    ):
+        """Test fully parseable listings never reach the LLM."""
+        html_content = (
+            '<div class="listing"><h1 class="address">123 Main St, Phoenix, AZ 85033</h1>'
+            '<span class="price">$450,000</span><span class="beds">4 beds</span>'
+            '<span class="baths">3 baths</span><span class="sqft">2,500 sq ft</span></div>'
+        )
+        mock_validator.get_invalid_fields.return_value = []
+        mock_validator.validate.return_value = sample_validation_result
+
+        result = await pipeline.process_html(html_content, "phoenix_mls")
+
+        mock_extractor.extract_from_html.assert_not_called()
+        assert result.property_data.bedrooms == 4
+        assert result.property_data.zip_code == "85033"
+        assert result.metadata["extraction_tier"] == "parser"
+        assert result.metadata["field_provenance"]["price"] == "parser"
+        assert pipeline.get_metrics()["extraction_tiers"]["parser"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tiered_extraction_uses_llm_for_missing_fields(
+        self, pipeline, mock_extractor, mock_validator, sample_validation_result
+    ):
+        """Test the LLM is asked only for fields the parser could not supply."""
+        html_content = (
+            '<div class="listing"><h1 class="address">123 Main St, Phoenix, AZ 85033</h1>'
+            '<span class="price">$450,000</span><span class="beds">4 beds</span>'
+            '<span class="baths">3 baths</span></div>'
+        )
+        mock_validator.get_invalid_fields.return_value = []
+        mock_validator.validate.return_value = sample_validation_result
+        mock_extractor.extract_from_html.return_value = {"square_feet": 2500, "price": 1}
+
+        result = await pipeline.process_html(html_content, "phoenix_mls")
+
+        mock_extractor.extract_from_html.assert_called_once_with(
+            html_content, "phoenix_mls", None, True, fields=["square_feet"]
+        )
+        assert result.property_data.square_feet == 2500
+        assert result.property_data.price == 450000
+        assert result.metadata["extraction_tier"] == "parser+llm"
+        assert result.metadata["field_provenance"]["square_feet"] == "llm"
+        assert result.metadata["field_provenance"]["price"] == "parser"
+
     @pytest.mark.asyncio
     async def test_process_single_json(
         self,
@@ -223,7 +270,7 @@ class TestDataProcessingPipeline:
         assert result.source == "maricopa_county"
 
         mock_extractor.extract_from_json.assert_called_once_with(
-            json_data, "maricopa_county", None, True
+            json_data, "maricopa_county", None, True, prefetched_addresses=None
         )
 
     @pytest.mark.asyncio
@@ -330,6 +377,103 @@ class TestDataProcessingPipeline:
         assert metrics["successful"] == 4
         assert metrics["failed"] == 1
 
+    @pytest.mark.asyncio
+    async def test_process_stream_yields_as_completed(
+        self,
+        pipeline,
+        mock_extractor,
+        mock_validator,
+        sample_property_data,
+        sample_validation_result,
+    ):
+        """Test streaming keeps the pool full and a slow item doesn't block others."""
+        active_calls = 0
+        max_active = 0
+
+        async def extract(content, *args, **kwargs):
+            nonlocal active_calls, max_active
+            active_calls += 1
+            max_active = max(max_active, active_calls)
+            await asyncio.sleep(0.3 if "Property 0" in content else 0.01)
+            active_calls -= 1
+            return sample_property_data
+
+        async def contents():
+            for i in range(8):
+                yield f"<html>Property {i}</html>"
+
+        mock_extractor.extract_from_html.side_effect = extract
+        mock_validator.validate.return_value = sample_validation_result
+
+        results = [result async for result in pipeline.process_stream(contents(), "phoenix_mls")]
+
+        assert len(results) == 8
+        assert all(r.is_valid for r in results)
+        assert max_active == 3  # MAX_CONCURRENT_PROCESSING from config
+        # The slow first item finishes last instead of holding back its sub-batch
+        assert results[-1].metadata["stream_index"] == 0
+
+    @pytest.mark.asyncio
+    async def test_process_stream_pulls_only_max_concurrent_items(
+        self,
+        pipeline,
+        mock_extractor,
+        mock_validator,
+        sample_property_data,
+        sample_validation_result,
+    ):
+        """Test no more than max_concurrent items are taken from the source at once."""
+        pulled = 0
+
+        async def extract(content, *args, **kwargs):
+            await asyncio.sleep(0.01)
+            return sample_property_data
+
+        async def contents():
+            nonlocal pulled
+            for i in range(8):
+                pulled += 1
+                yield f"<html>Property {i}</html>"
+
+        mock_extractor.extract_from_html.side_effect = extract
+        mock_validator.validate.return_value = sample_validation_result
+
+        pulled_at_yield = [pulled async for _ in pipeline.process_stream(contents(), "phoenix_mls")]
+
+        assert pulled_at_yield[0] == 3  # MAX_CONCURRENT_PROCESSING from config
+        assert pulled_at_yield[-1] == 8
+
+    @pytest.mark.asyncio
+    async def test_process_stream_ordered(
+        self,
+        pipeline,
+        mock_extractor,
+        mock_validator,
+        sample_property_data,
+        sample_validation_result,
+    ):
+        """Test ordered streaming yields results in input order, including errors."""
+
+        async def extract(content, *args, **kwargs):
+            index = int(content.removeprefix("<html>Property ").removesuffix("</html>"))
+            await asyncio.sleep(0.01 * (5 - index))
+            if index == 2:
+                raise ProcessingError("Extraction failed")
+            return sample_property_data
+
+        mock_extractor.extract_from_html.side_effect = extract
+        mock_validator.validate.return_value = sample_validation_result
+
+        html_contents = [f"<html>Property {i}</html>" for i in range(5)]
+        results = [
+            result
+            async for result in pipeline.process_stream(html_contents, "phoenix_mls", ordered=True)
+        ]
+
+        assert [r.metadata["stream_index"] for r in results] == [0, 1, 2, 3, 4]
+        assert not results[2].is_valid
+        assert "Extraction failed" in results[2].error
+
     @pytest.mark.asyncio
     async def test_retry_mechanism(
         self,
@@ -8,6 +8,7 @@ from phoenix_real_estate.collectors.processing.monitoring import (
     ResourceMonitor,
     ResourceMetrics,
     ResourceLimits,
+    ResourceSampler,
     AlertLevel,
 )
 
@@ -214,6 +215,59 @@ class TestResourceMonitor:
             assert metrics["status"] == "degraded"
 
 
+class TestResourceSampler:
+    """Test background resource sampling."""
+
+    def test_sample_ring_buffer(self):
+        """Test samples are kept in a bounded ring buffer."""
+        sampler = ResourceSampler(interval=60, capacity=3)
+
+        for _ in range(5):
+            sampler.sample()
+
+        history = sampler.history()
+        assert len(history) == 3
+        assert history[-1] is sampler.latest()
+        assert [s.timestamp for s in history] == sorted(s.timestamp for s in history)
+
+    def test_latest_respects_max_age(self):
+        """Test stale snapshots are ignored."""
+        sampler = ResourceSampler(interval=60)
+        assert sampler.latest() is None
+
+        sampler.sample()
+        assert sampler.latest(max_age=60) is not None
+        with patch("time.time", return_value=sampler.latest().timestamp + 120):
+            assert sampler.latest(max_age=60) is None
+
+    @pytest.mark.asyncio
+    async def test_background_thread_publishes_samples(self):
+        """Test the sampling thread keeps publishing snapshots."""
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        try:
+            first = sampler.latest()
+            assert first is not None
+            await asyncio.sleep(0.1)
+            assert sampler.latest().timestamp > first.timestamp
+        finally:
+            sampler.stop()
+        assert not sampler.running
+
+    @pytest.mark.asyncio
+    async def test_monitor_reads_do_not_block(self):
+        """Test monitor metrics come from the sampler without blocking calls."""
+        monitor = ResourceMonitor(ResourceLimits(), sample_interval=60)
+        await monitor.start()
+        try:
+            with patch("psutil.cpu_percent", side_effect=AssertionError("blocking call")):
+                metrics = monitor.get_metrics_snapshot()
+            assert metrics["status"] == "healthy"
+            assert metrics["memory_mb"] > 0
+        finally:
+            await monitor.stop()
+
+
 class TestResourceMetrics:
     """Test resource metrics collection."""
 
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from aiohttp import web
 from prometheus_client import CONTENT_TYPE_LATEST
+from pymongo import ReplaceOne, UpdateOne
 
 # Mock uvloop before importing the service
 with patch.dict("sys.modules", {"uvloop": Mock()}):
@@ -46,7 +47,10 @@ class TestLLMProcessingService:
         """Create mock configuration."""
         config = Mock(spec=EnvironmentConfigProvider)
         config.get = Mock(return_value="test_value")
-        config.get_typed = Mock(return_value=30)
+        typed_values = {"PROCESSING_QUEUE_SIZE": 37}
+        config.get_typed = Mock(
+            side_effect=lambda name, *args, **kwargs: typed_values.get(name, 30)
+        )
         return config
 
     @pytest.fixture
@@ -82,8 +86,9 @@ class TestLLMProcessingService:
             assert service.running is False
             assert isinstance(service.shutdown_event, asyncio.Event)
             assert isinstance(service.processing_queue, asyncio.Queue)
-            assert service.processing_queue.maxsize == 100
-            assert service.workers == []
+            # Sized from PROCESSING_QUEUE_SIZE
+            assert service.processing_queue.maxsize == 37
+            assert service.worker_pool is None
 
     @pytest.mark.asyncio
     async def test_health_check_healthy(self, service):
@@ -143,3 +148,26 @@ class TestLLMProcessingService:
         service._signal_handler(signal.SIGINT, None)
 
         assert service.shutdown_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_write_results_retry_reuses_ids(self, service):
+        """Test a replayed batch targets the same documents instead of inserting again."""
+        service.db_client = MockDatabaseClient(service.config)
+        service.db_client.properties.bulk_write = AsyncMock()
+        results = [{"property_id": "prop-1", "price": 1}, {"price": 2}]
+
+        await service._write_results(results)
+        await service._write_results(results)
+
+        first, second = (
+            call.args[0] for call in service.db_client.properties.bulk_write.await_args_list
+        )
+        assert first == second
+        assert first == [
+            UpdateOne(
+                {"property_id": "prop-1"},
+                {"$set": {"property_id": "prop-1", "price": 1}},
+                upsert=True,
+            ),
+            ReplaceOne({"_id": results[1]["_id"]}, results[1], upsert=True),
+        ]
@@ -0,0 +1,171 @@
+"""Tests for the source priority queue and autoscaling worker pool."""
+
+import asyncio
+
+import pytest
+
+from phoenix_real_estate.collectors.processing.worker_pool import (
+    SourcePriorityQueue,
+    WorkerPool,
+    parse_source_priorities,
+)
+
+
+class TestSourcePriorityQueue:
+    """Test suite for SourcePriorityQueue."""
+
+    def test_parse_source_priorities(self):
+        """Test priorities parse from config strings and mappings."""
+        assert parse_source_priorities("maricopa_county:0, phoenix_mls:1") == {
+            "maricopa_county": 0,
+            "phoenix_mls": 1,
+        }
+        assert parse_source_priorities({"phoenix_mls": "2"}) == {"phoenix_mls": 2}
+        assert parse_source_priorities(None) == {}
+
+    @pytest.mark.asyncio
+    async def test_orders_by_source_priority_then_fifo(self):
+        """Test higher-priority sources are served first, FIFO within a source."""
+        queue = SourcePriorityQueue(maxsize=10, priorities={"maricopa_county": 0})
+        for i in range(3):
+            queue.put_nowait({"source": "phoenix_mls", "n": i})
+        queue.put_nowait({"source": "maricopa_county", "n": 10})
+        queue.put_nowait({"source": "phoenix_mls", "n": 3, "priority": -1})
+
+        assert queue.qsize() == 5
+        assert queue.depths() == {"phoenix_mls": 4, "maricopa_county": 1}
+
+        order = [queue.get_nowait()["n"] for _ in range(5)]
+        assert order == [3, 10, 0, 1, 2]
+        assert queue.depths() == {}
+
+    @pytest.mark.asyncio
+    async def test_bounded(self):
+        """Test the queue keeps asyncio.Queue's bound and maxsize."""
+        queue = SourcePriorityQueue(maxsize=1)
+        queue.put_nowait({"source": "phoenix_mls"})
+
+        assert queue.maxsize == 1
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait({"source": "phoenix_mls"})
+
+
+class TestWorkerPool:
+    """Test suite for WorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_processes_all_items(self):
+        """Test workers wake on new items and process everything."""
+        queue = SourcePriorityQueue()
+        processed = []
+
+        async def handler(item):
+            processed.append(item["n"])
+
+        pool = WorkerPool(handler, queue, min_workers=2, max_workers=2, scale_interval=60)
+        await pool.start()
+        for i in range(20):
+            await queue.put({"source": "phoenix_mls", "n": i})
+        await asyncio.wait_for(queue.join(), timeout=1)
+        await pool.stop()
+
+        assert sorted(processed) == list(range(20))
+        assert pool.get_stats()["processed"] == 20
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_kill_workers(self):
+        """Test a failing item is counted and the worker keeps going."""
+        queue = SourcePriorityQueue()
+
+        async def handler(item):
+            if item["n"] == 0:
+                raise ValueError("bad item")
+
+        pool = WorkerPool(handler, queue, min_workers=1, max_workers=1, scale_interval=60)
+        await pool.start()
+        for i in range(3):
+            await queue.put({"n": i})
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        stats = pool.get_stats()
+        assert stats["failed"] == 1
+        assert stats["processed"] == 2
+        assert pool.size == 1
+        await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_scales_up_with_queue_depth_and_down_when_idle(self):
+        """Test the pool grows under backlog and shrinks back when drained."""
+        queue = SourcePriorityQueue()
+        release = asyncio.Event()
+
+        async def handler(item):
+            await release.wait()
+
+        pool = WorkerPool(handler, queue, min_workers=1, max_workers=4, scale_interval=60)
+        await pool.start()
+        for i in range(10):
+            await queue.put({"n": i})
+        await asyncio.sleep(0)
+
+        assert pool.rebalance() == 3
+        assert pool.size == 4
+        assert pool.rebalance() == 0  # Already at max_workers
+
+        release.set()
+        await asyncio.wait_for(queue.join(), timeout=1)
+        await asyncio.sleep(0)
+
+        while pool.rebalance():
+            await asyncio.sleep(0)
+        assert pool.size == 1
+        assert pool.get_stats()["scale_downs"] == 3
+        await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_high_latency_stops_growth(self):
+        """Test the pool does not add workers when LLM latency is over target."""
+        queue = SourcePriorityQueue()
+
+        async def handler(item):
+            await asyncio.sleep(0.05)
+
+        pool = WorkerPool(
+            handler,
+            queue,
+            min_workers=1,
+            max_workers=4,
+            scale_interval=60,
+            target_latency=0.01,
+        )
+        await pool.start()
+        await queue.put({"n": 0})
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        for i in range(5):
+            await queue.put({"n": i})
+        await asyncio.sleep(0)
+
+        assert pool.rebalance() == 0
+        assert pool.size == 1
+        await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_lets_busy_workers_finish(self):
+        """Test stop waits for in-flight items instead of cancelling them."""
+        queue = SourcePriorityQueue()
+        finished = []
+
+        async def handler(item):
+            await asyncio.sleep(0.05)
+            finished.append(item["n"])
+
+        pool = WorkerPool(handler, queue, min_workers=2, max_workers=2, scale_interval=60)
+        await pool.start()
+        await queue.put({"n": 1})
+        await asyncio.sleep(0.01)
+        await pool.stop()
+
+        assert finished == [1]
+        assert pool.size == 0
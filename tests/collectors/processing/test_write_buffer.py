@@ -0,0 +1,114 @@
+"""Tests for the write-behind result buffer."""
+
+import asyncio
+
+import pytest
+
+from phoenix_real_estate.collectors.processing.write_buffer import WriteBehindBuffer
+
+
+class RecordingWriter:
+    """Bulk writer that records every batch it receives."""
+
+    def __init__(self, fail_times: int = 0, delay: float = 0.0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.delay = delay
+
+    async def __call__(self, documents):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail_times:
+            self.fail_times -= 1
+            raise ConnectionError("write failed")
+        self.batches.append(list(documents))
+
+
+class TestWriteBehindBuffer:
+    """Test suite for WriteBehindBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches(self):
+        """Test documents from many producers are written in size-bounded batches."""
+        writer = RecordingWriter()
+        buffer = WriteBehindBuffer(writer, max_batch_size=10, flush_interval=5.0)
+        await buffer.start()
+
+        async def produce(start):
+            for i in range(start, start + 25):
+                await buffer.add({"property_id": f"p{i}"})
+
+        await asyncio.gather(*(produce(n * 25) for n in range(4)))
+        await buffer.stop()
+
+        assert sum(len(batch) for batch in writer.batches) == 100
+        assert all(len(batch) <= 10 for batch in writer.batches)
+        assert len(writer.batches) == 10
+        assert buffer.get_stats()["documents_written"] == 100
+
+    @pytest.mark.asyncio
+    async def test_flushes_partial_batch_after_interval(self):
+        """Test a partial batch is written once the flush interval passes."""
+        writer = RecordingWriter()
+        buffer = WriteBehindBuffer(writer, max_batch_size=100, flush_interval=0.05)
+        await buffer.start()
+
+        await buffer.add({"property_id": "p1"})
+        await buffer.add({"property_id": "p2"})
+        await asyncio.sleep(0.2)
+
+        assert writer.batches == [[{"property_id": "p1"}, {"property_id": "p2"}]]
+        await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_when_full(self):
+        """Test producers wait while the buffer is full."""
+        writer = RecordingWriter(delay=0.2)
+        buffer = WriteBehindBuffer(writer, max_batch_size=2, flush_interval=0.01, max_buffered=2)
+        await buffer.start()
+
+        for i in range(4):
+            await buffer.add({"property_id": f"p{i}"})  # First batch is being written
+
+        blocked = asyncio.create_task(buffer.add({"property_id": "p4"}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        await blocked
+        await buffer.stop()
+        assert sum(len(batch) for batch in writer.batches) == 5
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_documents(self):
+        """Test graceful shutdown writes everything still buffered."""
+        writer = RecordingWriter()
+        buffer = WriteBehindBuffer(writer, max_batch_size=100, flush_interval=60)
+        await buffer.start()
+
+        for i in range(5):
+            await buffer.add({"property_id": f"p{i}"})
+        await buffer.stop()
+
+        assert sum(len(batch) for batch in writer.batches) == 5
+        with pytest.raises(RuntimeError):
+            await buffer.add({"property_id": "late"})
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_retried_then_counted(self):
+        """Test transient write failures are retried and permanent ones reported."""
+        writer = RecordingWriter(fail_times=1)
+        buffer = WriteBehindBuffer(writer, max_batch_size=10, flush_interval=0.01, max_retries=1)
+        await buffer.start()
+        await buffer.add({"property_id": "p1"})
+        await buffer.stop()
+
+        assert writer.batches == [[{"property_id": "p1"}]]
+
+        failing = WriteBehindBuffer(
+            RecordingWriter(fail_times=10), flush_interval=0.01, max_retries=0
+        )
+        await failing.start()
+        await failing.add({"property_id": "p2"})
+        await failing.stop()
+
+        assert failing.get_stats()["documents_failed"] == 1
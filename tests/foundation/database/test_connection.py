@@ -294,10 +294,13 @@ class TestDatabaseConnection:
         mock_properties.create_index = AsyncMock()
         mock_daily_reports = MagicMock()
         mock_daily_reports.create_index = AsyncMock()
+        mock_zip_market_stats = MagicMock()
+        mock_zip_market_stats.create_index = AsyncMock()
 
         mock_db.__getitem__.side_effect = lambda name: {
             "properties": mock_properties,
             "daily_reports": mock_daily_reports,
+            "zip_market_stats": mock_zip_market_stats,
         }[name]
 
         with patch(
@@ -308,14 +311,19 @@ class TestDatabaseConnection:
 
             await db_conn.connect()
 
-            # Verify all expected indexes were created
-            assert mock_properties.create_index.call_count >= 12  # All single and compound indexes
+            # Verify the minimal compound index set was created
+            assert mock_properties.create_index.call_count == 4
             assert mock_daily_reports.create_index.call_count == 1
 
             # Verify specific index calls
-            mock_properties.create_index.assert_any_call("property_id", unique=True)
-            mock_properties.create_index.assert_any_call("address.zipcode")
-            mock_daily_reports.create_index.assert_called_once_with("date", unique=True)
+            mock_properties.create_index.assert_any_call([("property_id", 1)], unique=True)
+            mock_properties.create_index.assert_any_call(
+                [("address.zipcode", 1), ("is_active", 1), ("current_price", 1)]
+            )
+            mock_daily_reports.create_index.assert_called_once_with([("date", 1)], unique=True)
+            mock_zip_market_stats.create_index.assert_called_once_with(
+                [("zipcode", 1)], unique=True
+            )
 
     @pytest.mark.asyncio
     async def test_close(self, mock_motor_client):
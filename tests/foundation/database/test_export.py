@@ -0,0 +1,124 @@
+"""Tests for the incremental property export writers."""
+
+import csv
+import gzip
+from datetime import datetime
+
+import pytest
+from bson import json_util
+
+from phoenix_real_estate.foundation.database.export import (
+    _ParquetOutput,
+    flatten_document,
+    write_csv,
+    write_ndjson_gz,
+    write_parquet,
+)
+
+
+def make_documents(count):
+    """Build simple property documents."""
+    return [
+        {
+            "property_id": f"prop-{i}",
+            "address": {"zipcode": "85001", "street": f"{i} Main St"},
+            "current_price": 300000 + i,
+            "last_updated": datetime(2025, 1, 20, 12, 0, i),
+            "sources": [{"source": "phoenix_mls"}],
+        }
+        for i in range(count)
+    ]
+
+
+async def stream(documents):
+    """Yield documents asynchronously, like PropertyRepository.export."""
+    for document in documents:
+        yield document
+
+
+class TestExportWriters:
+    """Test export writers."""
+
+    def test_flatten_document(self):
+        """Test nested documents become dotted columns and lists become JSON."""
+        row = flatten_document(make_documents(1)[0])
+
+        assert row["address.zipcode"] == "85001"
+        assert json_util.loads(row["sources"]) == [{"source": "phoenix_mls"}]
+
+    async def test_write_ndjson_gz_round_trips(self, tmp_path):
+        """Test NDJSON lines keep dates and are written across batches."""
+        documents = make_documents(5)
+        path = tmp_path / "properties.ndjson.gz"
+
+        count = await write_ndjson_gz(stream(documents), path, batch_size=2)
+
+        assert count == 5
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            restored = [json_util.loads(line) for line in f]
+        assert restored == documents
+        assert not path.with_name(f"{path.name}.tmp").exists()
+
+    async def test_write_csv_uses_first_batch_columns(self, tmp_path):
+        """Test the CSV header comes from the first batch unless columns are given."""
+        path = tmp_path / "properties.csv"
+        documents = make_documents(3) + [{"property_id": "prop-x", "extra": 1}]
+
+        count = await write_csv(stream(documents), path, batch_size=2)
+
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert count == 4
+        assert "extra" not in rows[0]
+        assert rows[0]["last_updated"] == "2025-01-20T12:00:00"
+        assert rows[3]["property_id"] == "prop-x"
+
+    async def test_write_parquet(self, tmp_path):
+        """Test Parquet output holds every document with widened numeric columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "properties.parquet"
+
+        count = await write_parquet(
+            stream(make_documents(5)),
+            path,
+            columns=["property_id", "current_price", "address.zipcode"],
+            batch_size=2,
+        )
+
+        table = pq.read_table(path)
+        assert count == table.num_rows == 5
+        assert table.column_names == ["property_id", "current_price", "address.zipcode"]
+        assert table.column("current_price").to_pylist()[0] == 300000.0
+
+    async def test_write_parquet_types_sparse_columns(self, tmp_path):
+        """Test columns empty in the first batch take their type from later batches."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "properties.parquet"
+        documents = [
+            {"property_id": "prop-0", "sqft": None, "notes": None},
+            {"property_id": "prop-1", "sqft": None, "notes": None},
+            {"property_id": "prop-2", "sqft": 1500, "notes": None},
+            {"property_id": "prop-3", "sqft": 1750.5, "notes": None, "pool": True},
+        ]
+
+        count = await write_parquet(stream(documents), path, batch_size=2)
+
+        table = pq.read_table(path)
+        assert count == table.num_rows == 4
+        assert table.column_names == ["property_id", "sqft", "notes", "pool"]
+        assert table.column("sqft").to_pylist() == [None, None, 1500.0, 1750.5]
+        assert table.column("pool").to_pylist() == [None, None, None, True]
+
+    async def test_write_parquet_keeps_unresolved_columns_as_text(self, tmp_path):
+        """Test a column still empty when the schema is fixed stores later values as text."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "properties.parquet"
+        output = _ParquetOutput(path, None, max_buffered_rows=2)
+
+        output.write([{"property_id": "prop-0", "sqft": None}] * 2)
+        output.write([{"property_id": "prop-2", "sqft": 1500, "extra": 1}])
+        output.close()
+
+        table = pq.read_table(path)
+        assert table.column_names == ["property_id", "sqft"]
+        assert table.column("sqft").to_pylist() == [None, None, "1500"]
@@ -0,0 +1,180 @@
+"""Tests for the query-plan and index advisor."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from phoenix_real_estate.foundation.database.connection import (
+    COLLECTION_INDEXES,
+    DatabaseConnection,
+)
+from phoenix_real_estate.foundation.database.index_advisor import (
+    IndexAdvisor,
+    QueryShape,
+    esr_index,
+    format_report,
+    minimal_index_set,
+    propose_indexes,
+    redundant_indexes,
+    repository_query_shapes,
+)
+
+
+async def iterate(items):
+    """Async iterator over items."""
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock database holding one properties collection."""
+    collection = Mock()
+    collection.name = "properties"
+    collection.list_indexes = Mock(
+        return_value=iterate(
+            [
+                {"name": "_id_", "key": {"_id": 1}},
+                {"name": "property_id_1", "key": {"property_id": 1}, "unique": True},
+                {"name": "address.zipcode_1", "key": {"address.zipcode": 1}},
+                {
+                    "name": "address.zipcode_1_current_price_-1",
+                    "key": {"address.zipcode": 1, "current_price": -1},
+                },
+            ]
+        )
+    )
+    collection.aggregate = Mock(
+        return_value=iterate(
+            [
+                {"name": "_id_", "accesses": {"ops": 3}},
+                {"name": "property_id_1", "accesses": {"ops": 120}},
+                {"name": "address.zipcode_1", "accesses": {"ops": 0}},
+                {"name": "address.zipcode_1_current_price_-1", "accesses": {"ops": 40}},
+            ]
+        )
+    )
+    collection.create_index = AsyncMock(side_effect=lambda keys: "created")
+
+    db = Mock()
+    db.__getitem__ = Mock(return_value=collection)
+    db.command = AsyncMock(
+        return_value={
+            "queryPlanner": {
+                "winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+                "rejectedPlans": [{"stage": "IXSCAN", "indexName": "ignored"}],
+            }
+        }
+    )
+    return db
+
+
+@pytest.fixture
+def db_connection(mock_db):
+    """Create a mock connection yielding the mock database."""
+    connection = Mock(spec=DatabaseConnection)
+    context = AsyncMock()
+    context.__aenter__.return_value = mock_db
+    context.__aexit__.return_value = None
+    connection.get_database.return_value = context
+    return connection
+
+
+class TestIndexProposal:
+    """Test index proposals derived from query shapes."""
+
+    def test_esr_index_orders_equality_sort_range(self):
+        """Test equality fields lead, then sort fields, then range fields."""
+        shape = QueryShape(
+            "recent",
+            "properties",
+            {"last_updated": {"$gt": 0}, "is_active": True},
+            sort=(("last_updated", -1), ("property_id", -1)),
+        )
+
+        assert esr_index(shape) == (("is_active", 1), ("last_updated", 1), ("property_id", 1))
+
+    def test_minimal_index_set_drops_prefixes_and_mirrors(self):
+        """Test prefixes of longer keys and mirrored keys collapse into one index."""
+        unique = [(("property_id", 1),)]
+        keys = [
+            (("zip", 1),),
+            (("zip", 1), ("price", 1)),
+            (("zip", -1), ("price", -1)),
+            (("property_id", 1),),
+        ]
+
+        assert minimal_index_set(keys, unique) == [
+            (("property_id", 1),),
+            (("zip", 1), ("price", 1)),
+        ]
+
+    def test_created_indexes_match_proposal(self):
+        """Test connect() creates exactly the proposed index set."""
+        proposed = propose_indexes(repository_query_shapes())
+        created = {
+            collection: {tuple(keys) for keys, _ in indexes}
+            for collection, indexes in COLLECTION_INDEXES.items()
+        }
+
+        assert {collection: set(keys) for collection, keys in proposed.items()} == created
+
+    def test_redundant_indexes(self):
+        """Test indexes prefixing a longer index are redundant unless unique."""
+        indexes = {
+            "_id_": (("_id", 1),),
+            "zip": (("zip", 1),),
+            "zip_price": (("zip", 1), ("price", -1)),
+            "pid": (("pid", 1),),
+            "pid_zip": (("pid", 1), ("zip", 1)),
+        }
+
+        assert redundant_indexes(indexes, unique=["pid"]) == {"zip": "zip_price"}
+
+
+class TestIndexAdvisor:
+    """Test IndexAdvisor against a mock database."""
+
+    async def test_analyze_reports_plans_and_indexes(self, db_connection, mock_db):
+        """Test plans, usage, redundancy and the proposal are combined in one report."""
+        shapes = [
+            QueryShape("by_id", "properties", {"property_id": "x"}),
+            QueryShape("by_zip", "properties", {"address.zipcode": "85001"}, count=True),
+            QueryShape("export", "properties", {}, full_scan=True),
+        ]
+        advisor = IndexAdvisor(db_connection, shapes)
+
+        report = await advisor.analyze()
+
+        assert mock_db.command.call_count == 3
+        assert mock_db.command.call_args_list[1][0][1] == {
+            "count": "properties",
+            "query": {"address.zipcode": "85001"},
+        }
+        query = report["queries"][0]
+        assert query["collscan"] and query["blocking_sort"]
+        assert query["indexes_used"] == []
+
+        review = report["collections"]["properties"]
+        indexes = {index["name"]: index for index in review["indexes"]}
+        assert indexes["address.zipcode_1"]["unused"] is True
+        assert indexes["address.zipcode_1"]["redundant_with"] == (
+            "address.zipcode_1_current_price_-1"
+        )
+        assert indexes["property_id_1"]["unused"] is False
+        assert review["missing"] == []
+        assert review["not_proposed"] == ["address.zipcode_1_current_price_-1"]
+        assert "[COLLSCAN]" in format_report(report)
+
+    async def test_analyze_without_index_stats(self, db_connection, mock_db):
+        """Test tiers that forbid $indexStats still get plans and a proposal."""
+        mock_db["properties"].aggregate = Mock(side_effect=OperationFailure("not allowed"))
+        advisor = IndexAdvisor(db_connection, [QueryShape("by_pid", "properties", {"pid": 1})])
+
+        report = await advisor.analyze()
+
+        review = report["collections"]["properties"]
+        assert review["usage_available"] is False
+        assert review["missing"] == [[("pid", 1)]]
+        assert await advisor.create_missing(report) == ["created"]
@@ -4,21 +4,36 @@ This module contains comprehensive tests for all repository classes including
 CRUD operations, queries, aggregations, and error handling.
 """
 
+import statistics
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
 
 from phoenix_real_estate.foundation.database.repositories import (
     BaseRepository,
     PropertyRepository,
     DailyReportRepository,
     RepositoryFactory,
+    compute_content_hash,
+    decode_page_token,
+    encode_page_token,
+    estimate_histogram_percentile,
+    interpolate_percentile,
+    zip_market_summary,
 )
 from phoenix_real_estate.foundation.database.connection import DatabaseConnection
 from phoenix_real_estate.foundation.utils.exceptions import DatabaseError, ValidationError
 
 
+async def iter_nothing():
+    """Async iterator over no documents."""
+    return
+    yield
+
+
 @pytest.fixture
 def mock_db_connection():
     """Create a mock database connection."""
@@ -182,6 +197,305 @@ class TestPropertyRepository:
         call_args = mock_collection.update_one.call_args[0]
         assert "last_updated" in call_args[1]["$set"]
 
+    async def test_upsert_inserts_with_set_on_insert(
+        self, property_repo, setup_mock_collection, sample_property_data
+    ):
+        """Test upsert writes with one update_one that only sets created_at on insert."""
+        mock_collection = setup_mock_collection
+        mock_collection.find_one.return_value = None
+        mock_collection.update_one.return_value = Mock(upserted_id="new_id")
+
+        property_id, was_created = await property_repo.upsert(sample_property_data)
+
+        assert (property_id, was_created) == ("test-property-123", True)
+        query, update = mock_collection.update_one.call_args[0]
+        assert query == {"property_id": "test-property-123"}
+        assert "created_at" in update["$setOnInsert"]
+        assert "created_at" not in update["$set"]
+        assert update["$set"]["content_hash"] == compute_content_hash(sample_property_data)
+        assert "$push" not in update
+        assert mock_collection.update_one.call_args.kwargs["upsert"] is True
+
+    async def test_upsert_inserts_price_history(
+        self, property_repo, setup_mock_collection, sample_property_data
+    ):
+        """Test a new property keeps the price history it was collected with."""
+        mock_collection = setup_mock_collection
+        mock_collection.find_one.return_value = None
+        mock_collection.update_one.return_value = Mock(upserted_id="new_id")
+        history = [{"price": 320000, "date": "2024-01-01", "source": "maricopa_county"}]
+
+        await property_repo.upsert(dict(sample_property_data, price_history=history))
+
+        _, update = mock_collection.update_one.call_args[0]
+        assert update["$setOnInsert"]["price_history"] == history
+        assert "price_history" not in update["$set"]
+
+    async def test_upsert_skips_unchanged_property(
+        self, property_repo, setup_mock_collection, sample_property_data
+    ):
+        """Test an upsert whose content hash matches the stored one does not write."""
+        mock_collection = setup_mock_collection
+        mock_collection.find_one.return_value = {
+            "property_id": "test-property-123",
+            "content_hash": compute_content_hash(sample_property_data),
+            "current_price": 350000,
+        }
+
+        result = await property_repo.upsert(dict(sample_property_data, last_updated="later"))
+
+        assert result == ("test-property-123", False)
+        mock_collection.update_one.assert_not_called()
+
+    async def test_upsert_records_price_change(
+        self, property_repo, setup_mock_collection, sample_property_data
+    ):
+        """Test a changed price is pushed onto the price history in the same write."""
+        mock_collection = setup_mock_collection
+        mock_collection.find_one.return_value = {
+            "property_id": "test-property-123",
+            "content_hash": "stale",
+            "current_price": 340000,
+        }
+        mock_collection.update_one.return_value = Mock(upserted_id=None)
+        sample_property_data["metadata"] = {"source": "phoenix_mls"}
+
+        result = await property_repo.upsert(sample_property_data)
+
+        assert result == ("test-property-123", False)
+        update = mock_collection.update_one.call_args[0][1]
+        entry = update["$push"]["price_history"]
+        assert (entry["price"], entry["source"]) == (350000, "phoenix_mls")
+
+    def test_content_hash_ignores_volatile_fields(self, sample_property_data):
+        """Test timestamps and equivalent numbers do not change the content hash."""
+        baseline = compute_content_hash(sample_property_data)
+        recollected = dict(
+            sample_property_data,
+            current_price=350000.0,
+            last_updated="2025-01-21T00:00:00",
+            metadata={"extracted_at": "2025-01-21T00:00:00"},
+        )
+
+        assert compute_content_hash(recollected) == compute_content_hash(
+            dict(sample_property_data, metadata={})
+        )
+        assert compute_content_hash(dict(sample_property_data, current_price=1)) != baseline
+
+    async def test_bulk_upsert_chunks_and_counts(self, property_repo, setup_mock_collection):
+        """Test bulk upsert skips unchanged properties and sends chunked unordered writes."""
+        mock_collection = setup_mock_collection
+        properties = [{"property_id": f"prop-{i}", "current_price": i} for i in range(4)]
+        stored = [{"property_id": "prop-0", "content_hash": compute_content_hash(properties[0])}]
+
+        def find(query, projection):
+            cursor = Mock()
+            ids = set(query["property_id"]["$in"])
+
+            async def iterate(self):
+                for doc in stored:
+                    if doc["property_id"] in ids:
+                        yield doc
+
+            cursor.__aiter__ = iterate
+            return cursor
+
+        mock_collection.find = Mock(side_effect=find)
+        mock_collection.bulk_write = AsyncMock(
+            side_effect=[
+                Mock(bulk_api_result={"nUpserted": 1, "nMatched": 0}),
+                Mock(bulk_api_result={"nUpserted": 1, "nMatched": 1}),
+            ]
+        )
+        properties.append({"current_price": 1})  # Missing property_id
+
+        counts = await property_repo.bulk_upsert(properties, chunk_size=2)
+
+        assert counts == {"inserted": 2, "updated": 1, "unchanged": 1, "failed": 1}
+        assert mock_collection.find.call_count == 2
+        assert mock_collection.bulk_write.call_count == 2
+        first_chunk = mock_collection.bulk_write.call_args_list[0][0][0]
+        assert len(first_chunk) == 1
+        assert mock_collection.bulk_write.call_args_list[0].kwargs["ordered"] is False
+        assert first_chunk[0]._doc["$setOnInsert"]["is_active"] is True
+
+    async def test_bulk_upsert_counts_write_errors(self, property_repo, setup_mock_collection):
+        """Test per-document write errors are counted without failing the batch."""
+        mock_collection = setup_mock_collection
+        cursor = Mock()
+        cursor.__aiter__ = lambda self: iter_nothing()
+        mock_collection.find = Mock(return_value=cursor)
+        mock_collection.bulk_write = AsyncMock(
+            side_effect=BulkWriteError(
+                {"nUpserted": 1, "nMatched": 0, "writeErrors": [{"index": 1, "errmsg": "bad"}]}
+            )
+        )
+
+        counts = await property_repo.bulk_upsert(
+            [{"property_id": "prop-1"}, {"property_id": "prop-2"}]
+        )
+
+        assert counts == {"inserted": 1, "updated": 0, "unchanged": 0, "failed": 1}
+        assert await property_repo.bulk_save([]) == 0
+
+    async def test_bulk_upsert_keeps_last_duplicate(self, property_repo, setup_mock_collection):
+        """Test a property_id repeated in one chunk is written and counted once."""
+        mock_collection = setup_mock_collection
+        cursor = Mock()
+        cursor.__aiter__ = lambda self: iter_nothing()
+        mock_collection.find = Mock(return_value=cursor)
+        mock_collection.bulk_write = AsyncMock(
+            return_value=Mock(bulk_api_result={"nUpserted": 1, "nMatched": 0})
+        )
+        properties = [
+            {"property_id": "prop-1", "current_price": price, "address": {"zipcode": "85001"}}
+            for price in (300000, 310000)
+        ]
+
+        counts = await property_repo.bulk_upsert(properties)
+
+        assert counts == {"inserted": 1, "updated": 0, "unchanged": 1, "failed": 0}
+        (operation,) = mock_collection.bulk_write.call_args_list[0][0][0]
+        assert operation._doc["$set"]["current_price"] == 310000
+        (stats_operation,) = mock_collection.bulk_write.call_args_list[1][0][0]
+        assert stats_operation._doc["$inc"]["count"] == 1
+        assert stats_operation._doc["$inc"]["sum_price"] == 310000
+
+    def test_interpolate_percentile_is_exact(self):
+        """Test percentiles match the inclusive linear-interpolation definition."""
+        prices = sorted([410000, 250000, 399000, 615000, 289900, 350000, 720000, 305000])
+        by_rank = {rank: price for rank, price in enumerate(prices, start=1)}
+        expected = statistics.quantiles(prices, n=100, method="inclusive")
+
+        for percentile in (10, 25, 50, 75, 90):
+            assert interpolate_percentile(by_rank, len(prices), percentile) == pytest.approx(
+                expected[percentile - 1]
+            )
+        assert interpolate_percentile(by_rank, len(prices), 0) == 250000
+        assert interpolate_percentile(by_rank, len(prices), 100) == 720000
+
+    async def test_price_statistics_for_many_zipcodes(self, property_repo, setup_mock_collection):
+        """Test one ranked aggregation yields exact statistics per zipcode."""
+        mock_collection = setup_mock_collection
+        prices = [100.0, 200.0, 300.0, 400.0]
+        cursor = Mock()
+        cursor.to_list = AsyncMock(
+            return_value=[
+                {
+                    "_id": "85001",
+                    "count": 4,
+                    "avg_price": 250.0,
+                    "ranked": [{"rank": i + 1, "price": p} for i, p in enumerate(prices)],
+                }
+            ]
+        )
+        mock_collection.aggregate = Mock(return_value=cursor)
+
+        stats = await property_repo.get_price_statistics_by_zipcodes(
+            ["85001", "85002"], percentiles=[25, 75]
+        )
+
+        assert mock_collection.aggregate.call_count == 1
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert pipeline[0]["$match"]["address.zipcode"] == {"$in": ["85001", "85002"]}
+        assert "$setWindowFields" in pipeline[1]
+        # Only the ranks the statistics need are grouped, never every price
+        assert set(pipeline[-1]["$group"]) == {"_id", "count", "avg_price", "ranked"}
+
+        assert stats["85001"]["median_price"] == 250.0
+        assert stats["85001"]["percentiles"] == {"p25": 175.0, "p75": 325.0}
+        assert (stats["85001"]["min_price"], stats["85001"]["max_price"]) == (100.0, 400.0)
+        assert stats["85002"]["count"] == 0
+        assert stats["85002"]["percentiles"] == {"p25": None, "p75": None}
+
+    @pytest.mark.parametrize("percentile", [-5, 100.5, 150])
+    async def test_price_statistics_reject_out_of_range_percentiles(
+        self, property_repo, setup_mock_collection, percentile
+    ):
+        """Test percentiles outside [0, 100] fail validation before any query."""
+        mock_collection = setup_mock_collection
+        mock_collection.aggregate = Mock()
+
+        with pytest.raises(ValidationError):
+            await property_repo.get_price_statistics_by_zipcodes(
+                ["85001"], percentiles=[50, percentile]
+            )
+        with pytest.raises(ValidationError):
+            interpolate_percentile({1: 100.0, 2: 200.0}, 2, percentile)
+
+        mock_collection.aggregate.assert_not_called()
+
+    async def test_upsert_moves_market_stats_contribution(
+        self, property_repo, setup_mock_collection, sample_property_data
+    ):
+        """Test a price change decrements the old bucket and increments the new one."""
+        mock_collection = setup_mock_collection
+        mock_collection.find_one.return_value = {
+            "property_id": "test-property-123",
+            "content_hash": "stale",
+            "current_price": 290000,
+            "address": {"zipcode": "85001"},
+            "is_active": True,
+        }
+        mock_collection.update_one.return_value = Mock(upserted_id=None)
+        mock_collection.bulk_write = AsyncMock()
+
+        await property_repo.upsert(sample_property_data)
+
+        (operation,) = mock_collection.bulk_write.call_args[0][0]
+        assert operation._filter == {"zipcode": "85001"}
+        increments = operation._doc["$inc"]
+        assert increments["count"] == 0
+        assert increments["sum_price"] == 60000
+        assert (increments["histogram.250000"], increments["histogram.350000"]) == (-1, 1)
+        assert operation._doc["$max"] == {"max_price": 350000}
+
+    def test_zip_market_summary_estimates_median(self):
+        """Test the median estimate interpolates within the median's bucket."""
+        summary = zip_market_summary(
+            {
+                "zipcode": "85001",
+                "count": 4,
+                "sum_price": 1_200_000,
+                "min_price": 220000,
+                "max_price": 380000,
+                "histogram": {"200000": 1, "300000": 2, "350000": 1, "400000": 0},
+            }
+        )
+
+        assert summary["avg_price"] == 300000
+        assert summary["median_price_estimate"] == 325000
+        assert summary["histogram"] == {"200000": 1, "300000": 2, "350000": 1}
+        assert estimate_histogram_percentile({}, 0, 50) is None
+        assert zip_market_summary({"zipcode": "85002"})["median_price_estimate"] is None
+
+    async def test_refresh_zip_market_stats(self, property_repo, setup_mock_collection):
+        """Test a refresh replaces rebuilt zipcodes and deletes emptied ones."""
+        mock_collection = setup_mock_collection
+        cursor = Mock()
+        cursor.to_list = AsyncMock(
+            return_value=[
+                {
+                    "_id": "85001",
+                    "count": 3,
+                    "sum_price": 900000,
+                    "min_price": 250000,
+                    "max_price": 350000,
+                    "histogram": [{"k": 250000, "v": 1}, {"k": 300000, "v": 2}],
+                }
+            ]
+        )
+        mock_collection.aggregate = Mock(return_value=cursor)
+        mock_collection.bulk_write = AsyncMock()
+        mock_collection.delete_many = AsyncMock()
+
+        rebuilt = await property_repo.refresh_zip_market_stats(["85001", "85002"])
+
+        assert rebuilt == 1
+        (replacement,) = mock_collection.bulk_write.call_args[0][0]
+        assert replacement._doc["histogram"] == {"250000": 1, "300000": 2}
+        mock_collection.delete_many.assert_called_once_with({"zipcode": {"$in": ["85002"]}})
+
     async def test_search_by_zipcode(self, property_repo, setup_mock_collection):
         """Test search by zipcode with pagination."""
         mock_collection = setup_mock_collection
@@ -207,6 +521,88 @@ class TestPropertyRepository:
         assert total == 25
         assert all("_id" not in prop for prop in properties)
 
+    async def test_search_by_zipcode_page_uses_keyset(self, property_repo, setup_mock_collection):
+        """Test pages seek past the last (sort value, property_id) without skip or count."""
+        mock_collection = setup_mock_collection
+        docs = [{"property_id": f"prop-{i}", "current_price": 100 * i} for i in range(3)]
+
+        mock_cursor = Mock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.limit.return_value = mock_cursor
+
+        async def mock_aiter(self):
+            for doc in docs:
+                yield dict(doc)
+
+        mock_cursor.__aiter__ = mock_aiter
+        mock_collection.find.return_value = mock_cursor
+        token = encode_page_token(
+            {"property_id": "prop-9", "current_price": 50}, "current_price", 1
+        )
+
+        page = await property_repo.search_by_zipcode_page(
+            "85001",
+            limit=2,
+            cursor=token,
+            sort_by="current_price",
+            sort_order=1,
+            fields=["address"],
+        )
+
+        query, projection = mock_collection.find.call_args[0]
+        assert query["$and"][1] == {
+            "$or": [
+                {"current_price": {"$gt": 50}},
+                {"current_price": 50, "property_id": {"$gt": "prop-9"}},
+            ]
+        }
+        assert projection == {"_id": 0, "address": 1, "current_price": 1, "property_id": 1}
+        mock_cursor.sort.assert_called_once_with([("current_price", 1), ("property_id", 1)])
+        mock_cursor.limit.assert_called_once_with(3)
+        mock_cursor.skip.assert_not_called()
+        mock_collection.count_documents.assert_not_called()
+
+        assert [doc["property_id"] for doc in page["properties"]] == ["prop-0", "prop-1"]
+        assert page["total"] is None
+        assert decode_page_token(page["next_cursor"], "current_price", 1) == (100, "prop-1")
+
+    async def test_export_streams_with_server_batches(self, property_repo, setup_mock_collection):
+        """Test export yields documents lazily with the requested batch size."""
+        mock_collection = setup_mock_collection
+        mock_cursor = Mock()
+        mock_cursor.batch_size.return_value = mock_cursor
+
+        async def mock_aiter(self):
+            for i in range(3):
+                yield {"_id": f"id-{i}", "property_id": f"prop-{i}"}
+
+        mock_cursor.__aiter__ = mock_aiter
+        mock_collection.find.return_value = mock_cursor
+
+        exported = [
+            doc
+            async for doc in property_repo.export(
+                {"is_active": True}, fields=["property_id"], batch_size=250
+            )
+        ]
+
+        assert exported == [{"property_id": f"prop-{i}"} for i in range(3)]
+        mock_collection.find.assert_called_once_with(
+            {"is_active": True}, {"_id": 0, "property_id": 1}
+        )
+        mock_cursor.batch_size.assert_called_once_with(250)
+
+    def test_page_token_rejects_other_sort(self):
+        """Test a token cannot be replayed against a different sort or be forged."""
+        token = encode_page_token(
+            {"property_id": "prop-1", "last_updated": None}, "last_updated", -1
+        )
+
+        with pytest.raises(ValidationError):
+            decode_page_token(token, "current_price", -1)
+        with pytest.raises(ValidationError):
+            decode_page_token("not-a-token", "last_updated", -1)
+
 
 class TestDailyReportRepository:
     """Test DailyReportRepository class."""